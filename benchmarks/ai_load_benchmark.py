@@ -0,0 +1,148 @@
+"""
+Load benchmark of the AI path against the local OpenRouter stub (no tokens, no network).
+
+Drives OpenRouterAI.generate_content directly ("generator" target) or through
+ReportService.process_daily_report with a no-op driver ("service" target) at a
+given concurrency, and reports throughput, latency p50/p95, API and extension
+call counts, and the JSON parse failure rate:
+
+    python benchmarks/ai_load_benchmark.py --requests 200 --concurrency 16 --latency 0.3 \\
+        --mix valid=60,short=25,fenced=10,malformed=5
+    python benchmarks/ai_load_benchmark.py --target service --no-batch-extensions --json ai.json
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_stats import percentile
+from benchmarks.stubs.openrouter_stub import parse_mix, start_stub_server
+from src.core.entities import Report
+from src.core.interfaces import IAutomationDriver, IContentGenerator
+from src.infrastructure.ai.openrouter_ai import OpenRouterAI
+from src.services.report_service import ReportService
+
+
+class CountingGenerator(IContentGenerator):
+    """Wraps a generator and classifies its failures (JSON parse vs anything else)."""
+
+    def __init__(self, inner: IContentGenerator):
+        self.inner = inner
+        self.lock = threading.Lock()
+        self.parse_failures = 0
+        self.other_failures = 0
+
+    def generate_content(self, context: str, user_input: str) -> Report:
+        try:
+            return self.inner.generate_content(context, user_input)
+        except ValueError:
+            with self.lock:
+                self.parse_failures += 1
+            raise
+        except Exception:
+            with self.lock:
+                self.other_failures += 1
+            raise
+
+
+class NullDriver(IAutomationDriver):
+    """Accepts every report after an optional fixed delay, so only the AI path is measured."""
+
+    def __init__(self, submit_seconds: float = 0.0):
+        self.submit_seconds = submit_seconds
+
+    def execute_full_flow(self, email: str, password: str, report: Report) -> bool:
+        time.sleep(self.submit_seconds)
+        return True
+
+    def login(self, email: str, password: str) -> bool:
+        return True
+
+    def navigate_to_report_page(self) -> bool:
+        return True
+
+    def fill_report(self, report: Report) -> bool:
+        return True
+
+    def submit_report(self) -> bool:
+        return True
+
+    def close(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=("generator", "service"), default="generator")
+    parser.add_argument("--requests", type=int, default=100, help="Total reports to generate")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent callers")
+    parser.add_argument("--mix", default="valid=70,short=20,fenced=5,malformed=5", help="Stub response mix")
+    parser.add_argument("--latency", type=float, default=0.2, help="Stub latency per API call (seconds)")
+    parser.add_argument("--submit-seconds", type=float, default=0.0, help="No-op driver delay (service target)")
+    parser.add_argument("--no-batch-extensions", action="store_true", help="Repair short fields one request each")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", dest="json_path", help="Also write the summary to this file")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(mix=parse_mix(args.mix), latency_seconds=args.latency, seed=args.seed)
+    ai = OpenRouterAI(api_key="stub-key", base_url=base_url, batch_extensions=not args.no_batch_extensions)
+    generator = CountingGenerator(ai)
+    service = ReportService(generator, NullDriver(args.submit_seconds))
+
+    def one(index: int):
+        started = time.perf_counter()
+        if args.target == "service":
+            ok = service.process_daily_report("Mahasiswa Magang IT", f"Aktivitas #{index}", "bench@example.com", "x")
+        else:
+            try:
+                ok = generator.generate_content("Mahasiswa Magang IT", f"Aktivitas #{index}").validate()
+            except Exception:
+                ok = False
+        return ok, time.perf_counter() - started
+
+    wall_started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+        results = list(executor.map(one, range(args.requests)))
+    wall_seconds = time.perf_counter() - wall_started
+    served = server.RequestHandlerClass.state.snapshot()
+    server.shutdown()
+
+    latencies: List[float] = [seconds for _, seconds in results]
+    succeeded = sum(1 for ok, _ in results if ok)
+    stats = ai.get_stats()
+    summary: Dict[str, object] = {
+        "target": args.target,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "succeeded": succeeded,
+        "throughput_per_s": args.requests / wall_seconds if wall_seconds else 0.0,
+        "wall_seconds": wall_seconds,
+        "latency_p50_s": percentile(latencies, 0.50),
+        "latency_p95_s": percentile(latencies, 0.95),
+        "api_calls": stats["api_calls"],
+        "extension_calls": stats["extension_calls"],
+        "extension_calls_per_report": stats["extension_calls"] / args.requests if args.requests else 0.0,
+        "batched_extensions": stats["batched_extensions"],
+        "parse_failures": generator.parse_failures,
+        "parse_failure_rate": generator.parse_failures / args.requests if args.requests else 0.0,
+        "other_failures": generator.other_failures,
+        "stub_responses": served,
+    }
+
+    print()
+    for key, value in summary.items():
+        print(f"{key:<28}{value:.3f}" if isinstance(value, float) else f"{key:<28}{value}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "summary": summary}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+Cold-start import time of every entry point, as paid by each scheduled CI run.
+
+Each run imports one entry module in a fresh interpreter with `-X importtime`
+and records the module's cumulative import time, the process wall time and
+which heavy third-party packages got loaded (and what they cost). Importing
+never runs main(), so no .env, network or browser is needed:
+
+    python benchmarks/import_time_benchmark.py --runs 5
+    python benchmarks/import_time_benchmark.py --entry src.workflow_runner --forbid seleniumbase,selenium
+    python benchmarks/import_time_benchmark.py --budget-ms 600 --json import_times.json
+"""
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_stats import percentile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_POINTS = (
+    "src.main",
+    "src.bot_runner",
+    "src.workflow_runner",
+    "src.batch_runner",
+    "src.external_presensi_runner",
+)
+HEAVY_PACKAGES = ("seleniumbase", "selenium", "telegram", "pydantic_settings", "httpx", "requests", "cryptography")
+# "import time: <self us> | <cumulative us> | <indented module name>"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def import_once(module: str) -> Dict[str, object]:
+    """Import `module` in a fresh interpreter; timings in milliseconds."""
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+
+    total_ms = 0.0
+    heavy: Dict[str, float] = {}
+    errors: List[str] = []
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            if line and not line.startswith("import time:"):
+                errors.append(line)
+            continue
+        cumulative_ms = int(match.group(2)) / 1000
+        name = match.group(4)
+        if name == module:
+            total_ms = cumulative_ms
+        # A package's own line comes after its submodules and carries their cost.
+        if name in HEAVY_PACKAGES:
+            heavy[name] = max(heavy.get(name, 0.0), cumulative_ms)
+
+    return {
+        "ok": completed.returncode == 0,
+        "import_ms": total_ms,
+        "wall_ms": wall_ms,
+        "heavy_ms": heavy,
+        "error": errors[-1] if completed.returncode != 0 and errors else None,
+    }
+
+
+def summarize(module: str, runs: List[Dict[str, object]]) -> Dict[str, object]:
+    ok_runs = [run for run in runs if run["ok"]]
+    imports = [run["import_ms"] for run in ok_runs]
+    walls = [run["wall_ms"] for run in ok_runs]
+    heavy: Dict[str, List[float]] = {}
+    for run in ok_runs:
+        for name, ms in run["heavy_ms"].items():
+            heavy.setdefault(name, []).append(ms)
+    return {
+        "entry": module,
+        "ok": len(ok_runs) == len(runs),
+        "import_p50_ms": percentile(imports, 0.50),
+        "import_p95_ms": percentile(imports, 0.95),
+        "wall_p50_ms": percentile(walls, 0.50),
+        "heavy_p50_ms": {name: percentile(samples, 0.50) for name, samples in sorted(heavy.items())},
+        "error": next((run["error"] for run in runs if not run["ok"]), None),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entry", action="append", help="Entry module to measure (repeatable; default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per entry point")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if an entry's p50 import time exceeds this")
+    parser.add_argument("--forbid", default="", help="Comma-separated packages no entry point may import")
+    parser.add_argument("--json", dest="json_path", help="Also write the summary to this file")
+    args = parser.parse_args()
+
+    entries = args.entry or list(ENTRY_POINTS)
+    forbidden = [name.strip() for name in args.forbid.split(",") if name.strip()]
+    summaries = []
+    for module in entries:
+        runs = [import_once(module) for _ in range(max(1, args.runs))]
+        summaries.append(summarize(module, runs))
+
+    print(f"{'entry point':<32}{'import p50':>12}{'import p95':>12}{'wall p50':>10}  heavy packages (p50 ms)")
+    exit_code = 0
+    for summary in summaries:
+        if not summary["ok"]:
+            print(f"{summary['entry']:<32}{'FAILED':>12}  {summary['error']}")
+            exit_code = 1
+            continue
+        heavy = ", ".join(f"{name} {ms:.0f}" for name, ms in summary["heavy_p50_ms"].items()) or "-"
+        print(
+            f"{summary['entry']:<32}{summary['import_p50_ms']:>10.0f}ms{summary['import_p95_ms']:>10.0f}ms"
+            f"{summary['wall_p50_ms']:>8.0f}ms  {heavy}"
+        )
+        problems: List[str] = []
+        if args.budget_ms is not None and summary["import_p50_ms"] > args.budget_ms:
+            problems.append(f"p50 import {summary['import_p50_ms']:.0f}ms > budget {args.budget_ms:.0f}ms")
+        loaded = [name for name in forbidden if name in summary["heavy_p50_ms"]]
+        if loaded:
+            problems.append(f"imports forbidden package(s): {', '.join(loaded)}")
+        for problem in problems:
+            print(f"  ↳ {problem}")
+            exit_code = 1
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "summary": summaries}, f, indent=2)
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+End-to-end benchmark of the browser submission flow against the offline stub site.
+
+Starts benchmarks/stubs/maganghub_stub.py in-process, runs SeleniumBaseDriver
+through start -> login -> navigate -> fill -> submit N times and prints p50/p95
+per stage plus total wall time:
+
+    python benchmarks/maganghub_flow_benchmark.py --runs 10 --latency 0.05 --ui-latency 0.2
+    python benchmarks/maganghub_flow_benchmark.py --runs 10 --pool 1 --json results.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_stats import percentile
+from benchmarks.stubs.maganghub_stub import start_stub_server
+from src.core.entities import Report
+from src.infrastructure.automation.browser_pool import BrowserPool, default_use_uc
+from src.infrastructure.automation.resource_blocking import MAGANGHUB_PROFILE
+from src.infrastructure.automation.seleniumbase_driver import SeleniumBaseDriver
+
+STAGES = ("start", "login", "navigate", "fill", "submit", "total")
+
+EMAIL = "bench@example.com"
+PASSWORD = "bench-password"
+
+REPORT = Report(
+    activity=(
+        "Menyusun modul pelatihan internal untuk tim operasional, merapikan dokumentasi "
+        "alur kerja harian, dan berdiskusi dengan mentor mengenai prioritas minggu ini."
+    ),
+    learning=(
+        "Memahami cara menyusun dokumentasi yang mudah diikuti, pentingnya validasi data "
+        "sebelum dikirim, serta cara berkomunikasi yang efektif dengan tim lintas fungsi."
+    ),
+    obstacles=(
+        "Beberapa data referensi belum lengkap sehingga perlu konfirmasi ulang ke tim terkait; "
+        "diatasi dengan membuat daftar pertanyaan dan menjadwalkan sesi singkat bersama mentor."
+    ),
+)
+
+
+def run_once(driver: SeleniumBaseDriver) -> Dict[str, float]:
+    """One full flow; returns seconds per stage. Raises RuntimeError naming the failed stage."""
+    timings: Dict[str, float] = {}
+    steps = (
+        ("start", driver._start_session),
+        ("login", lambda: driver.login(EMAIL, PASSWORD)),
+        ("navigate", driver.navigate_to_report_page),
+        ("fill", lambda: driver.fill_report(REPORT)),
+        ("submit", driver.submit_report),
+    )
+    started = time.perf_counter()
+    try:
+        for name, step in steps:
+            step_started = time.perf_counter()
+            ok = step()
+            timings[name] = time.perf_counter() - step_started
+            if not ok:
+                raise RuntimeError(f"stage '{name}' failed")
+    finally:
+        driver.close()
+    timings["total"] = time.perf_counter() - started
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Number of full flows to run")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub server latency per request (seconds)")
+    parser.add_argument("--ui-latency", type=float, default=0.0, help="Stub client-side UI delay (seconds)")
+    parser.add_argument("--headless", action=argparse.BooleanOptionalAction, default=True)
+    parser.add_argument("--pool", type=int, default=0, help="Browser pool size (0 = new browser per run)")
+    parser.add_argument("--blocking", action="store_true", help="Enable the MagangHub resource blocking profile")
+    parser.add_argument("--json", dest="json_path", help="Also write raw timings to this file")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(
+        "127.0.0.1", 0, EMAIL, PASSWORD, args.latency, args.ui_latency, allow_resubmit=True
+    )
+    pool = None
+    if args.pool > 0:
+        pool = BrowserPool(
+            headless=args.headless,
+            use_uc=default_use_uc(),
+            min_size=args.pool,
+            max_size=args.pool,
+            storage_origins=(base_url,),
+        )
+        pool.warm_up()
+
+    samples: Dict[str, List[float]] = {stage: [] for stage in STAGES}
+    failures: List[str] = []
+    wall_started = time.perf_counter()
+    try:
+        for run in range(1, args.runs + 1):
+            driver = SeleniumBaseDriver(
+                headless=args.headless,
+                pool=pool,
+                blocking=MAGANGHUB_PROFILE if args.blocking else None,
+                base_url=base_url,
+            )
+            try:
+                timings = run_once(driver)
+            except Exception as e:
+                failures.append(f"run {run}: {e}")
+                print(f"[BENCH] run {run}/{args.runs} failed: {e}")
+                continue
+            for stage, seconds in timings.items():
+                samples[stage].append(seconds)
+            print(f"[BENCH] run {run}/{args.runs} ok in {timings['total']:.2f}s")
+    finally:
+        wall_seconds = time.perf_counter() - wall_started
+        if pool is not None:
+            pool.close_all()
+        server.shutdown()
+
+    print()
+    print(f"{'stage':<10}{'n':>4}{'p50 (s)':>10}{'p95 (s)':>10}")
+    for stage in STAGES:
+        values = samples[stage]
+        print(f"{stage:<10}{len(values):>4}{percentile(values, 0.50):>10.3f}{percentile(values, 0.95):>10.3f}")
+    print(f"\nwall time {wall_seconds:.2f}s, {args.runs - len(failures)}/{args.runs} run(s) succeeded")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "args": vars(args),
+                    "samples": samples,
+                    "failures": failures,
+                    "wall_seconds": wall_seconds,
+                },
+                f,
+                indent=2,
+            )
+
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Time-to-confirmation of a presensi submission against the local Apps Script stub.
+
+--mode http uses PresensiHttpClient, --mode browser PresensiDriver (UC Chrome),
+--mode fallback the HTTP client with the browser fallback the runner uses. Each
+run submits once; the stub's record of accepted submissions is checked too:
+
+    python benchmarks/presensi_submit_benchmark.py --mode http --runs 20 --latency 0.2
+    python benchmarks/presensi_submit_benchmark.py --mode browser --runs 3 --headless
+    python benchmarks/presensi_submit_benchmark.py --mode fallback --runs 3 --headless --no-dopost
+
+The stub serves the POST contract PresensiEndpoint assumes, so http numbers
+only hold if the real script accepts that contract (it is unverified).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_stats import percentile
+from benchmarks.stubs.presensi_stub import DEFAULT_UNITS, start_stub_server
+from src.infrastructure.automation.presensi_driver import PresensiDriver
+from src.infrastructure.automation.presensi_fallback import FallbackPresensiSubmitter
+from src.infrastructure.automation.presensi_http_client import PresensiHttpClient
+
+
+def build_submitter(mode: str, headless: bool):
+    if mode == "http":
+        return PresensiHttpClient()
+    if mode == "browser":
+        return PresensiDriver(headless=headless)
+    return FallbackPresensiSubmitter(PresensiHttpClient(), PresensiDriver(headless=headless))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("http", "browser", "fallback"), default="http")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub latency per request (seconds)")
+    parser.add_argument("--action", choices=("MASUK", "KELUAR"), default="MASUK")
+    parser.add_argument("--auth-redirect", action="store_true", help="Stub requires a Google sign-in")
+    parser.add_argument("--no-dopost", action="store_true", help="Stub answers POSTs like a script without doPost")
+    parser.add_argument("--headless", action="store_true", help="Run the browser headless (browser/fallback)")
+    parser.add_argument("--json", dest="json_path", help="Also write the summary to this file")
+    args = parser.parse_args()
+
+    server, exec_url = start_stub_server(
+        latency_seconds=args.latency, auth_redirect=args.auth_redirect, no_dopost=args.no_dopost
+    )
+    timings = []
+    succeeded = 0
+    for index in range(args.runs):
+        submitter = build_submitter(args.mode, args.headless)
+        started = time.perf_counter()
+        try:
+            success, details = submitter.submit_presensi(exec_url, f"Bench User {index}", DEFAULT_UNITS[0], args.action)
+        finally:
+            submitter.close()
+        timings.append(time.perf_counter() - started)
+        succeeded += int(success)
+        if not success:
+            print(f"[BENCH] run {index} failed: {details}")
+    recorded = len(server.RequestHandlerClass.state.submissions)
+    server.shutdown()
+
+    summary = {
+        "mode": args.mode,
+        "runs": args.runs,
+        "succeeded": succeeded,
+        "recorded_by_stub": recorded,
+        "p50_s": percentile(timings, 0.50),
+        "p95_s": percentile(timings, 0.95),
+        "max_s": max(timings) if timings else 0.0,
+    }
+    print()
+    for key, value in summary.items():
+        print(f"{key:<20}{value:.3f}" if isinstance(value, float) else f"{key:<20}{value}")
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "summary": summary, "timings_s": timings}, f, indent=2)
+    if succeeded != args.runs or recorded != succeeded:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
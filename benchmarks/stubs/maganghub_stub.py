@@ -0,0 +1,348 @@
+"""
+Local stub of the MagangHub monev portal.
+
+Serves the API endpoints declared in MagangHubApi (for MaganghubHttpDriver)
+and a minimal Vuetify-like web UI matching MagangHubSelectors: login page,
+dashboard calendar, report dialog with attendance select, three textareas,
+confirmation checkbox and submit button (for SeleniumBaseDriver).
+
+    python benchmarks/stubs/maganghub_stub.py --port 8765 --ui-latency 0.3
+    MAGANGHUB_SUBMIT_MODE=http MAGANGHUB_API_BASE_URL=http://127.0.0.1:8765 python src/main.py
+    MAGANGHUB_WEB_BASE_URL=http://127.0.0.1:8765 python src/main.py
+"""
+import argparse
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.infrastructure.automation.api_endpoints import MagangHubApi as Api
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Login - MagangHub (stub)</title></head>
+<body>
+<form id="login-form" style="max-width:320px;margin:80px auto;display:flex;flex-direction:column;gap:8px">
+  <h2>Masuk</h2>
+  <input id="username" name="username" type="text" placeholder="Email">
+  <input id="password" name="password" type="password" placeholder="Password">
+  <div class="v-messages__message" style="display:none;color:#b00020"></div>
+  <button type="submit">Masuk</button>
+</form>
+<script>
+const UI_LATENCY_MS = __UI_LATENCY_MS__;
+document.getElementById('login-form').addEventListener('submit', async (event) => {
+  event.preventDefault();
+  const response = await fetch('__LOGIN_API__', {
+    method: 'POST',
+    headers: {'Content-Type': 'application/json'},
+    body: JSON.stringify({
+      username: document.getElementById('username').value,
+      password: document.getElementById('password').value,
+    }),
+  });
+  const body = await response.json();
+  if (!response.ok) {
+    const error = document.querySelector('.v-messages__message');
+    error.textContent = body.message || 'Login gagal';
+    error.style.display = 'block';
+    return;
+  }
+  localStorage.setItem('access_token', body.data.access_token);
+  setTimeout(() => { location.href = '/dashboard'; }, UI_LATENCY_MS);
+});
+</script>
+</body></html>
+"""
+
+DASHBOARD_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Dashboard - MagangHub (stub)</title>
+<style>
+  td { width: 36px; height: 36px; text-align: center; }
+  .clickable-day { cursor: pointer; }
+  .today-highlight { background: #1976d2; color: #fff; }
+  .v-dialog { position: fixed; inset: 40px; background: #fff; border: 1px solid #ccc; padding: 16px; overflow: auto; }
+  .v-dialog textarea { display: block; width: 100%; height: 60px; }
+  .v-btn--disabled { opacity: 0.5; }
+</style></head>
+<body>
+<div class="v-app-bar">MagangHub (stub)</div>
+<nav>Dashboard</nav>
+<main class="v-main">
+  <table class="calendar"><tbody id="calendar"></tbody></table>
+</main>
+<script>
+const UI_LATENCY_MS = __UI_LATENCY_MS__;
+const MIN_LENGTH = __MIN_LENGTH__;
+const token = localStorage.getItem('access_token');
+if (!token) location.href = '/login';
+
+const today = new Date(Date.now() + 8 * 3600 * 1000).toISOString().slice(0, 10);
+const day = Number(today.slice(8, 10));
+const calendar = document.getElementById('calendar');
+let row = null;
+for (let d = 1; d <= 31; d++) {
+  if ((d - 1) % 7 === 0) { row = document.createElement('tr'); calendar.appendChild(row); }
+  const cell = document.createElement('td');
+  cell.textContent = d;
+  cell.className = 'clickable-day' + (d === day ? ' today-highlight' : '');
+  if (d === day) cell.addEventListener('click', () => setTimeout(openDialog, UI_LATENCY_MS));
+  row.appendChild(cell);
+}
+
+function openDialog() {
+  if (document.querySelector('.v-dialog')) return;
+  const dialog = document.createElement('div');
+  dialog.className = 'v-dialog v-dialog--active';
+  dialog.setAttribute('role', 'dialog');
+  dialog.innerHTML = `
+    <h3>Tambah Laporan Harian</h3>
+    <div class="v-input"><label class="v-label" for="attendance">Kehadiran</label>
+      <select id="attendance"><option value="">Pilih</option><option value="Hadir">Hadir</option><option value="Izin">Izin</option></select>
+    </div>
+    <div class="v-input"><label class="v-label">Uraian Aktivitas</label><textarea name="activity"></textarea></div>
+    <div class="v-input"><label class="v-label">Pembelajaran</label><textarea name="learning"></textarea></div>
+    <div class="v-input"><label class="v-label">Kendala</label><textarea name="obstacles"></textarea></div>
+    <div class="v-input"><div class="v-selection-control">
+      <input type="checkbox" id="confirm-check">
+      <label for="confirm-check">Saya menyatakan telah meninjau dan memastikan isian laporan ini sudah benar</label>
+    </div></div>
+    <div class="v-messages__message" style="display:none;color:#b00020"></div>
+    <div class="v-card-actions"><button type="button" class="v-btn bg-black v-btn--disabled" disabled>Simpan dan Kirim</button></div>`;
+  document.body.appendChild(dialog);
+
+  const button = dialog.querySelector('button');
+  const areas = Array.from(dialog.querySelectorAll('textarea'));
+  const validate = () => {
+    const valid =
+      dialog.querySelector('#attendance').value === 'Hadir' &&
+      dialog.querySelector('#confirm-check').checked &&
+      areas.every((area) => area.value.trim().length >= MIN_LENGTH);
+    button.disabled = !valid;
+    button.classList.toggle('v-btn--disabled', !valid);
+  };
+  ['input', 'change'].forEach((name) => dialog.addEventListener(name, validate, true));
+  dialog.querySelector('#confirm-check').addEventListener('click', () => setTimeout(validate, 0));
+
+  button.addEventListener('click', async () => {
+    const payload = {date: today, attendance: dialog.querySelector('#attendance').value, confirmed: true};
+    areas.forEach((area) => { payload[area.name] = area.value; });
+    const response = await fetch('__SUBMIT_API__', {
+      method: 'POST',
+      headers: {'Content-Type': 'application/json', 'Authorization': 'Bearer ' + token},
+      body: JSON.stringify(payload),
+    });
+    if (response.ok) {
+      setTimeout(() => dialog.remove(), UI_LATENCY_MS);
+      return;
+    }
+    const body = await response.json();
+    const error = dialog.querySelector('.v-messages__message');
+    error.textContent = body.message || 'Gagal menyimpan';
+    error.style.display = 'block';
+  });
+}
+</script>
+</body></html>
+"""
+
+
+class StubState:
+    """In-memory portal state shared by all request handlers."""
+
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        latency_seconds: float = 0.0,
+        ui_latency_seconds: float = 0.0,
+        allow_resubmit: bool = False,
+    ):
+        self.email = email
+        self.password = password
+        self.latency_seconds = latency_seconds
+        # Client-side delay before redirects, dialog open and dialog close (simulates Vue rendering).
+        self.ui_latency_seconds = ui_latency_seconds
+        # Benchmarks submit repeatedly for the same day.
+        self.allow_resubmit = allow_resubmit
+        self.tokens = set()
+        self.submissions = []
+        self.lock = threading.Lock()
+
+    def today(self) -> str:
+        return datetime.now(timezone(timedelta(hours=8))).strftime("%Y-%m-%d")
+
+    def is_submitted(self, date: str) -> bool:
+        if self.allow_resubmit:
+            return False
+        with self.lock:
+            return any(item["date"] == date for item in self.submissions)
+
+
+class MagangHubStubHandler(BaseHTTPRequestHandler):
+    state: StubState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, body: dict):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_html(self, template: str):
+        payload = (
+            template.replace("__UI_LATENCY_MS__", str(int(self.state.ui_latency_seconds * 1000)))
+            .replace("__MIN_LENGTH__", "100")
+            .replace("__LOGIN_API__", Api.LOGIN)
+            .replace("__SUBMIT_API__", Api.DAILY_REPORT_SUBMIT)
+            .encode("utf-8")
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _redirect(self, location: str):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return {}
+
+    def _authorized(self) -> bool:
+        header = self.headers.get("Authorization", "")
+        token = header[len("Bearer "):] if header.startswith("Bearer ") else ""
+        with self.state.lock:
+            return token in self.state.tokens
+
+    def do_GET(self):
+        time.sleep(self.state.latency_seconds)
+        parsed = urlparse(self.path)
+
+        if parsed.path == "/":
+            self._redirect("/login")
+            return
+        if parsed.path == "/login":
+            self._send_html(LOGIN_PAGE)
+            return
+        if parsed.path == "/dashboard":
+            self._send_html(DASHBOARD_PAGE)
+            return
+
+        if parsed.path == "/__stub__/submissions":
+            with self.state.lock:
+                self._send_json(200, {"data": list(self.state.submissions)})
+            return
+
+        if parsed.path == Api.DAILY_REPORT_SLOT:
+            if not self._authorized():
+                self._send_json(401, {"message": "Unauthenticated."})
+                return
+            date = (parse_qs(parsed.query).get("date") or [self.state.today()])[0]
+            self._send_json(
+                200,
+                {"data": {"id": f"slot-{date}", "date": date, "submitted": self.state.is_submitted(date)}},
+            )
+            return
+
+        self._send_json(404, {"message": "Not found"})
+
+    def do_POST(self):
+        time.sleep(self.state.latency_seconds)
+        parsed = urlparse(self.path)
+        body = self._read_json()
+
+        if parsed.path == Api.LOGIN:
+            if body.get("username") != self.state.email or body.get("password") != self.state.password:
+                self._send_json(401, {"message": "Email atau password salah."})
+                return
+            token = secrets.token_hex(16)
+            with self.state.lock:
+                self.state.tokens.add(token)
+            self._send_json(200, {"data": {"access_token": token}})
+            return
+
+        if parsed.path == Api.DAILY_REPORT_SUBMIT:
+            if not self._authorized():
+                self._send_json(401, {"message": "Unauthenticated."})
+                return
+            errors = {
+                field: "Minimal 100 karakter."
+                for field in ("activity", "learning", "obstacles")
+                if len((body.get(field) or "").strip()) < 100
+            }
+            if not body.get("confirmed"):
+                errors["confirmed"] = "Konfirmasi wajib dicentang."
+            if body.get("attendance") != Api.ATTENDANCE_PRESENT:
+                errors["attendance"] = "Kehadiran wajib diisi."
+            if errors:
+                self._send_json(422, {"message": "Validasi gagal.", "errors": errors})
+                return
+            if self.state.is_submitted(body.get("date")):
+                self._send_json(409, {"message": "Laporan hari ini sudah dikirim."})
+                return
+            with self.state.lock:
+                self.state.submissions.append(body)
+            self._send_json(201, {"data": {"id": len(self.state.submissions)}})
+            return
+
+        self._send_json(404, {"message": "Not found"})
+
+
+def start_stub_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    email: str = "intern@example.com",
+    password: str = "password",
+    latency_seconds: float = 0.0,
+    ui_latency_seconds: float = 0.0,
+    allow_resubmit: bool = False,
+):
+    """Start the stub in a daemon thread. Returns (server, base_url)."""
+    handler = type("BoundMagangHubStubHandler", (MagangHubStubHandler,), {})
+    handler.state = StubState(email, password, latency_seconds, ui_latency_seconds, allow_resubmit)
+    server = ThreadingHTTPServer((host, port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local MagangHub API stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--email", default=os.getenv("MAGANGHUB_EMAIL", "intern@example.com"))
+    parser.add_argument("--password", default=os.getenv("MAGANGHUB_PASSWORD", "password"))
+    parser.add_argument("--latency", type=float, default=0.0, help="Artificial latency per request (seconds)")
+    parser.add_argument("--ui-latency", type=float, default=0.0, help="Client-side UI delay in the web pages (seconds)")
+    parser.add_argument("--allow-resubmit", action="store_true", help="Accept more than one report per day")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(
+        args.host, args.port, args.email, args.password, args.latency, args.ui_latency, args.allow_resubmit
+    )
+    print(f"MagangHub stub listening on {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
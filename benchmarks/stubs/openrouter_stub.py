@@ -0,0 +1,208 @@
+"""
+Local OpenAI-compatible stub of the OpenRouter chat completions API.
+
+Each report prompt is answered with one of these response kinds, picked from a
+weighted mix:
+
+    valid      JSON with all three fields long enough
+    short      valid JSON, but the fields are shorter than Report.MIN_FIELD_LENGTH
+    fenced     valid JSON wrapped in a ```json markdown fence
+    malformed  truncated JSON that cannot be parsed
+
+Extension prompts (single field or batched) always get a long enough answer,
+so the `short` kind exercises the _ensure_lengths repair path.
+
+    python benchmarks/stubs/openrouter_stub.py --port 8766 --mix valid=70,short=20,fenced=5,malformed=5 --latency 0.4
+    OPENROUTER_BASE_URL=http://127.0.0.1:8766/api/v1 python src/main.py
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.core.entities import Report
+from src.infrastructure.ai.openrouter_ai import REPORT_FIELDS
+
+RESPONSE_KINDS = ("valid", "short", "fenced", "malformed")
+
+_SENTENCES = {
+    "activity": "Hari ini saya mengerjakan perbaikan modul laporan, menyusun dokumentasi alur kerja, "
+                "dan berdiskusi dengan mentor mengenai prioritas pengembangan fitur berikutnya.",
+    "learning": "Saya mempelajari pentingnya menulis kode yang mudah dirawat, cara melakukan pengujian "
+                "sebelum rilis, serta bagaimana berkomunikasi secara jelas dengan anggota tim.",
+    "obstacles": "Kendala utama adalah data uji yang belum lengkap, sehingga saya berkoordinasi dengan "
+                 "tim terkait dan menyiapkan data sementara agar pekerjaan tetap berjalan.",
+}
+
+
+def parse_mix(raw: str) -> Dict[str, float]:
+    """'valid=70,short=30' -> weights per response kind."""
+    weights = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        kind, _, weight = item.partition("=")
+        kind = kind.strip()
+        if kind not in RESPONSE_KINDS:
+            raise ValueError(f"Unknown response kind '{kind}' (expected one of {', '.join(RESPONSE_KINDS)})")
+        weights[kind] = float(weight or 1)
+    if not weights or sum(weights.values()) <= 0:
+        raise ValueError("Response mix needs at least one positive weight")
+    return weights
+
+
+def long_text(field: str) -> str:
+    return _SENTENCES.get(field, _SENTENCES["activity"])[: Report.MAX_FIELD_LENGTH]
+
+
+def short_text(field: str) -> str:
+    return _SENTENCES.get(field, _SENTENCES["activity"])[: Report.MIN_FIELD_LENGTH // 3]
+
+
+class StubState:
+    """Response mix, latency and per-kind counters shared by all request handlers."""
+
+    def __init__(self, mix: Dict[str, float], latency_seconds: float = 0.0, seed: Optional[int] = None):
+        self.mix = mix
+        self.latency_seconds = latency_seconds
+        self.random = random.Random(seed)
+        self.counts: Dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def pick_kind(self) -> str:
+        with self.lock:
+            return self.random.choices(list(self.mix), weights=list(self.mix.values()))[0]
+
+    def count(self, key: str):
+        with self.lock:
+            self.counts[key] = self.counts.get(key, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.counts)
+
+
+def report_content(kind: str) -> str:
+    if kind == "short":
+        return json.dumps({field: short_text(field) for field in REPORT_FIELDS}, ensure_ascii=False)
+    body = json.dumps({field: long_text(field) for field in REPORT_FIELDS}, ensure_ascii=False, indent=4)
+    if kind == "fenced":
+        return f"```json\n{body}\n```"
+    if kind == "malformed":
+        return body[: len(body) // 2]
+    return body
+
+
+def batched_extension_content(prompt: str) -> str:
+    fields = [field for field in REPORT_FIELDS if f'"{field}"' in prompt]
+    return json.dumps({field: long_text(field) for field in fields}, ensure_ascii=False)
+
+
+def single_extension_content(prompt: str) -> str:
+    for field in REPORT_FIELDS:
+        if f"Tipe: {field}" in prompt:
+            return long_text(field)
+    return long_text("activity")
+
+
+class OpenRouterStubHandler(BaseHTTPRequestHandler):
+    state: StubState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if urlparse(self.path).path == "/__stub__/stats":
+            self._send_json(200, {"data": self.state.snapshot()})
+            return
+        self._send_json(404, {"error": {"message": "Not found"}})
+
+    def do_POST(self):
+        time.sleep(self.state.latency_seconds)
+        if not urlparse(self.path).path.endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": "Not found"}})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+            prompt = body["messages"][-1]["content"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            self._send_json(400, {"error": {"message": "Invalid request body"}})
+            return
+
+        # Prompt shapes come from PromptTemplate.
+        if "kunci yang sama" in prompt:
+            kind, content = "extension_batched", batched_extension_content(prompt)
+        elif "Teks asli:" in prompt:
+            kind, content = "extension_single", single_extension_content(prompt)
+        else:
+            kind = self.state.pick_kind()
+            content = report_content(kind)
+        self.state.count(kind)
+
+        self._send_json(
+            200,
+            {
+                "id": f"stub-{kind}",
+                "object": "chat.completion",
+                "model": body.get("model", "stub"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            },
+        )
+
+
+def start_stub_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    mix: Optional[Dict[str, float]] = None,
+    latency_seconds: float = 0.0,
+    seed: Optional[int] = None,
+):
+    """Start the stub in a daemon thread. Returns (server, base_url) with base_url ending in /api/v1."""
+    handler = type("BoundOpenRouterStubHandler", (OpenRouterStubHandler,), {})
+    handler.state = StubState(mix or {"valid": 1.0}, latency_seconds, seed)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    bound_host, bound_port = server.server_address[:2]
+    return server, f"http://{bound_host}:{bound_port}/api/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--mix", default="valid=1", help="Weighted response kinds, e.g. valid=70,short=30")
+    parser.add_argument("--latency", type=float, default=0.0, help="Artificial latency per request (seconds)")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for the response mix")
+    args = parser.parse_args()
+
+    server, base_url = start_stub_server(args.host, args.port, parse_mix(args.mix), args.latency, args.seed)
+    print(f"OpenRouter stub listening on {base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""
+Local stub of the presensi Google Apps Script web app.
+
+GET /exec serves a page matching PresensiSelectors (name input, unit select,
+MASUK/KELUAR buttons that post the form and alert the reply) for
+PresensiDriver. POST /exec takes the fields declared in PresensiEndpoint and,
+like Apps Script, answers with a 302 to a one-time /echo URL holding the JSON
+reply, for PresensiHttpClient. --auth-redirect mimics a deployment that
+requires a Google sign-in; --no-dopost answers POSTs with Apps Script's
+"Script function not found: doPost" page, as a script without doPost would.
+
+The POST contract is the one PresensiEndpoint assumes, not one observed on the
+real script, so runs against this stub do not show that http mode works there.
+
+    python benchmarks/stubs/presensi_stub.py --port 8767 --latency 0.2
+    PRESENSI_URL=http://127.0.0.1:8767/exec PRESENSI_SUBMIT_MODE=http PRESENSI_ACTION=MASUK python src/external_presensi_runner.py
+"""
+import argparse
+import json
+import os
+import secrets
+import sys
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from src.infrastructure.automation.presensi_endpoint import PresensiEndpoint as Endpoint
+
+NO_DOPOST_PAGE = (
+    b"<!DOCTYPE html><html><head><title>Error</title></head><body>"
+    b"<div>Script function not found: doPost</div></body></html>"
+)
+
+DEFAULT_UNITS = ("Pengembangan Aplikasi", "Infrastruktur", "Sekretariat")
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Presensi (stub)</title></head>
+<body style="max-width:360px;margin:60px auto;font-family:sans-serif">
+<h2>Presensi Magang</h2>
+<input id="nama" type="text" placeholder="Nama lengkap" style="width:100%">
+<select id="unit" style="width:100%;margin:8px 0">__OPTIONS__</select>
+<button class="btn-masuk" onclick="presensi('MASUK')">MASUK</button>
+<button class="btn-keluar" onclick="presensi('KELUAR')">KELUAR</button>
+<script>
+async function presensi(aksi) {
+  const body = new URLSearchParams({
+    __NAME_FIELD__: document.getElementById('nama').value,
+    __UNIT_FIELD__: document.getElementById('unit').value,
+    __ACTION_FIELD__: aksi,
+  });
+  const response = await fetch(location.pathname, {method: 'POST', body: body});
+  const reply = await response.json();
+  alert(reply.message);
+}
+</script>
+</body></html>
+"""
+
+
+class StubState:
+    """Accepted submissions, pending /echo replies and stub settings."""
+
+    def __init__(self, units: List[str], latency_seconds: float, auth_redirect: bool, no_dopost: bool = False):
+        self.units = units
+        self.latency_seconds = latency_seconds
+        self.auth_redirect = auth_redirect
+        self.no_dopost = no_dopost
+        self.lock = threading.Lock()
+        self.submissions: List[Dict[str, str]] = []
+        self.echoes: Dict[str, dict] = {}
+
+    def record(self, fields: Dict[str, str]) -> dict:
+        name = fields.get(Endpoint.NAME_FIELD, "").strip()
+        unit = fields.get(Endpoint.UNIT_FIELD, "").strip()
+        action = fields.get(Endpoint.ACTION_FIELD, "").strip().upper()
+        if not name:
+            return {"status": "error", "message": "Presensi gagal: nama wajib diisi"}
+        if unit not in self.units:
+            return {"status": "error", "message": f"Presensi gagal: unit '{unit}' tidak dikenal"}
+        if action not in Endpoint.ACTIONS:
+            return {"status": "error", "message": f"Presensi gagal: aksi '{action}' tidak dikenal"}
+        with self.lock:
+            self.submissions.append({"name": name, "unit": unit, "action": action, "at": time.time()})
+        return {"status": "success", "message": f"Presensi {action} berhasil dicatat untuk {name}"}
+
+
+class PresensiStubHandler(BaseHTTPRequestHandler):
+    state: StubState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _redirect(self, location: str):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        time.sleep(self.state.latency_seconds)
+        parsed = urlparse(self.path)
+        if parsed.path == "/exec":
+            if self.state.auth_redirect:
+                self._redirect("/ServiceLogin/signin?continue=/exec")
+                return
+            options = "".join(f"<option>{escape(unit)}</option>" for unit in self.state.units)
+            page = (
+                PAGE.replace("__OPTIONS__", options)
+                .replace("__NAME_FIELD__", Endpoint.NAME_FIELD)
+                .replace("__UNIT_FIELD__", Endpoint.UNIT_FIELD)
+                .replace("__ACTION_FIELD__", Endpoint.ACTION_FIELD)
+            )
+            self._send(200, "text/html; charset=utf-8", page.encode("utf-8"))
+        elif parsed.path == "/echo":
+            token = (parse_qs(parsed.query).get("id") or [""])[0]
+            with self.state.lock:
+                reply = self.state.echoes.pop(token, None)
+            if reply is None:
+                self._send(404, "text/html; charset=utf-8", b"<html><body>Sorry, the file you have requested does not exist.</body></html>")
+                return
+            self._send(200, "application/json", json.dumps(reply).encode("utf-8"))
+        elif parsed.path.startswith("/ServiceLogin"):
+            self._send(200, "text/html; charset=utf-8", b"<html><body>Sign in - Google Accounts</body></html>")
+        else:
+            self._send(404, "text/plain", b"Not Found")
+
+    def do_POST(self):
+        time.sleep(self.state.latency_seconds)
+        if urlparse(self.path).path != "/exec":
+            self._send(404, "text/plain", b"Not Found")
+            return
+        if self.state.auth_redirect:
+            self._redirect("/ServiceLogin/signin?continue=/exec")
+            return
+        if self.state.no_dopost:
+            self._send(200, "text/html; charset=utf-8", NO_DOPOST_PAGE)
+            return
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length).decode("utf-8") if length else ""
+        fields = {key: values[-1] for key, values in parse_qs(raw, keep_blank_values=True).items()}
+        token = secrets.token_urlsafe(8)
+        reply = self.state.record(fields)
+        with self.state.lock:
+            self.state.echoes[token] = reply
+        self._redirect(f"/echo?id={token}")
+
+
+def start_stub_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    units: Optional[List[str]] = None,
+    latency_seconds: float = 0.0,
+    auth_redirect: bool = False,
+    no_dopost: bool = False,
+):
+    """Start the stub in a daemon thread. Returns (server, exec_url)."""
+    handler = type("BoundPresensiStubHandler", (PresensiStubHandler,), {})
+    handler.state = StubState(list(units or DEFAULT_UNITS), latency_seconds, auth_redirect, no_dopost)
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/exec"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8767)
+    parser.add_argument("--units", default=",".join(DEFAULT_UNITS), help="Comma-separated accepted units")
+    parser.add_argument("--latency", type=float, default=0.0, help="Artificial latency per request (seconds)")
+    parser.add_argument("--auth-redirect", action="store_true", help="Redirect every request to a sign-in page")
+    parser.add_argument("--no-dopost", action="store_true", help="Answer POSTs like a script without doPost")
+    args = parser.parse_args()
+
+    units = [unit.strip() for unit in args.units.split(",") if unit.strip()]
+    server, exec_url = start_stub_server(args.host, args.port, units, args.latency, args.auth_redirect, args.no_dopost)
+    print(f"Presensi stub listening on {exec_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Local fake of the Telegram Bot API for exercising polling and webhook modes offline.
+
+Implements the methods the bots call (getMe, setWebhook, deleteWebhook,
+getUpdates, sendMessage, editMessageText, deleteMessage) and records every
+outgoing message. Updates are injected with FakeTelegram.push_text(): they are
+queued for getUpdates in polling mode, or POSTed to the registered webhook
+(with its X-Telegram-Bot-Api-Secret-Token) in webhook mode.
+
+    python benchmarks/stubs/telegram_stub.py --port 8081
+    TELEGRAM_API_BASE_URL=http://127.0.0.1:8081 TELEGRAM_BOT_TOKEN=123:stub python src/bot_runner.py
+"""
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+BOT_USER = {"id": 4242, "is_bot": True, "first_name": "AutoAbsen Stub", "username": "autoabsen_stub_bot"}
+
+
+class FakeTelegram:
+    """Shared state: pending updates, webhook registration and sent messages."""
+
+    def __init__(self):
+        self.lock = threading.Condition()
+        self.updates: List[dict] = []
+        self.next_update_id = 1
+        self.next_message_id = 1
+        self.webhook_url: Optional[str] = None
+        self.webhook_secret: Optional[str] = None
+        self.sent: List[dict] = []
+        self.webhook_rejections = 0
+
+    def _message(self, chat_id: int, text: str, from_user: dict) -> dict:
+        message = {
+            "message_id": self.next_message_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": from_user,
+            "text": text,
+        }
+        self.next_message_id += 1
+        return message
+
+    def push_text(self, user_id: int, text: str, secret_override: Optional[str] = None) -> dict:
+        """Inject a private text message from user_id; returns the update."""
+        with self.lock:
+            user = {"id": user_id, "is_bot": False, "first_name": f"User {user_id}"}
+            message = self._message(user_id, text, user)
+            if text.startswith("/"):
+                message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(text.split()[0])}]
+            update = {"update_id": self.next_update_id, "message": message}
+            self.next_update_id += 1
+            webhook_url, secret = self.webhook_url, self.webhook_secret
+            if webhook_url is None:
+                self.updates.append(update)
+                self.lock.notify_all()
+                return update
+
+        headers = {"X-Telegram-Bot-Api-Secret-Token": secret_override if secret_override is not None else (secret or "")}
+        response = requests.post(webhook_url, json=update, headers=headers, timeout=10)
+        if response.status_code != 200:
+            with self.lock:
+                self.webhook_rejections += 1
+        return update
+
+    def wait_for_sent(self, count: int, timeout: float = 10.0) -> bool:
+        deadline = time.monotonic() + timeout
+        with self.lock:
+            while len(self.sent) < count:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.lock.wait(remaining)
+            return True
+
+    # Bot API methods -------------------------------------------------------
+
+    def call(self, method: str, params: dict):
+        handler = getattr(self, f"_api_{method.lower()}", None)
+        if handler is None:
+            return True  # accept anything else (setMyCommands, ...) as a no-op
+        return handler(params)
+
+    def _api_getme(self, params):
+        return BOT_USER
+
+    def _api_setwebhook(self, params):
+        with self.lock:
+            self.webhook_url = params.get("url") or None
+            self.webhook_secret = params.get("secret_token")
+        return True
+
+    def _api_deletewebhook(self, params):
+        with self.lock:
+            self.webhook_url = None
+            self.webhook_secret = None
+        return True
+
+    def _api_getwebhookinfo(self, params):
+        with self.lock:
+            return {"url": self.webhook_url or "", "has_custom_certificate": False, "pending_update_count": len(self.updates)}
+
+    def _api_getupdates(self, params):
+        offset = int(params.get("offset") or 0)
+        timeout = float(params.get("timeout") or 0)
+        deadline = time.monotonic() + timeout
+        with self.lock:
+            # Confirmed updates (id < offset) are dropped, as in the real API.
+            self.updates = [update for update in self.updates if update["update_id"] >= offset]
+            while not self.updates and time.monotonic() < deadline:
+                self.lock.wait(deadline - time.monotonic())
+            return list(self.updates)
+
+    def _api_sendmessage(self, params):
+        with self.lock:
+            message = self._message(int(params["chat_id"]), params.get("text", ""), BOT_USER)
+            self.sent.append(dict(message, sent_at=time.monotonic()))
+            self.lock.notify_all()
+            return message
+
+    def _api_editmessagetext(self, params):
+        with self.lock:
+            return self._message(int(params.get("chat_id") or 0), params.get("text", ""), BOT_USER)
+
+    def _api_deletemessage(self, params):
+        return True
+
+
+def _decode_params(handler: BaseHTTPRequestHandler) -> Dict[str, object]:
+    length = int(handler.headers.get("Content-Length") or 0)
+    raw = handler.rfile.read(length) if length else b""
+    content_type = handler.headers.get("Content-Type", "")
+    if "application/json" in content_type:
+        return json.loads(raw or b"{}")
+    params: Dict[str, object] = {}
+    for key, values in parse_qs(raw.decode("utf-8")).items():
+        value = values[-1]
+        # PTB form-encodes non-string parameters as JSON.
+        try:
+            params[key] = json.loads(value)
+        except ValueError:
+            params[key] = value
+    return params
+
+
+class TelegramStubHandler(BaseHTTPRequestHandler):
+    fake: FakeTelegram = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode("utf-8")
+        try:
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # the bot stopped while a getUpdates long poll was pending
+
+    def _handle(self):
+        # /bot<token>/<method>
+        parts = urlparse(self.path).path.strip("/").split("/")
+        if len(parts) != 2 or not parts[0].startswith("bot"):
+            self._send_json(404, {"ok": False, "error_code": 404, "description": "Not Found"})
+            return
+        try:
+            params = _decode_params(self)
+        except ValueError:
+            self._send_json(400, {"ok": False, "error_code": 400, "description": "Bad Request: invalid parameters"})
+            return
+        self._send_json(200, {"ok": True, "result": self.fake.call(parts[1], params)})
+
+    do_GET = _handle
+    do_POST = _handle
+
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0):
+    """Start the fake Bot API in a daemon thread. Returns (server, base_url, fake)."""
+    handler = type("BoundTelegramStubHandler", (TelegramStubHandler,), {})
+    handler.fake = FakeTelegram()
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    bound_host, bound_port = server.server_address[:2]
+    return server, f"http://{bound_host}:{bound_port}", handler.fake
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--user-id", type=int, default=123456789, help="Sender of typed messages")
+    args = parser.parse_args()
+
+    server, base_url, fake = start_stub_server(args.host, args.port)
+    print(f"Telegram stub listening on {base_url} (type a message and press Enter to send it)")
+    try:
+        while True:
+            text = input("> ").strip()
+            if not text:
+                continue
+            seen = len(fake.sent)
+            fake.push_text(args.user_id, text)
+            if fake.wait_for_sent(seen + 1, timeout=30):
+                for message in fake.sent[seen:]:
+                    print(f"< {message['text']}")
+    except (KeyboardInterrupt, EOFError):
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Update-to-reply latency of polling vs webhook mode against the fake Telegram server.
+
+Runs a minimal echo bot built through UpdateSource (the same code path as
+bot_runner/workflow_runner), injects N messages and measures the time from
+injection to the bot's sendMessage. In webhook mode it also checks that an
+update with a wrong secret token is rejected:
+
+    python benchmarks/telegram_update_benchmark.py --mode polling --messages 50
+    python benchmarks/telegram_update_benchmark.py --mode webhook --messages 50 --port 8443
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from telegram import Update
+from telegram.ext import ContextTypes, MessageHandler, filters
+
+from benchmarks.bench_stats import percentile
+from benchmarks.stubs.telegram_stub import start_stub_server
+from src.infrastructure.telegram.update_source import UpdateSource
+
+USER_ID = 123456789
+
+
+async def echo(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    await update.message.reply_text(update.message.text)
+
+
+async def run(args) -> int:
+    server, api_base_url, fake = start_stub_server()
+    source = UpdateSource(
+        mode=args.mode,
+        webhook_url=f"http://127.0.0.1:{args.port}",
+        listen="127.0.0.1",
+        port=args.port,
+        secret_token="bench-secret",
+        api_base_url=api_base_url,
+    )
+    source.validate()
+    app = source.application_builder("123:bench").build()
+    app.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), echo))
+
+    await app.initialize()
+    await app.start()
+    await source.start(app)
+    exit_code = 0
+    try:
+        latencies = []
+        for index in range(args.messages):
+            seen = len(fake.sent)
+            started = time.monotonic()
+            await asyncio.to_thread(fake.push_text, USER_ID, f"ping {index}")
+            if not await asyncio.to_thread(fake.wait_for_sent, seen + 1, 10):
+                print(f"[BENCH] message {index} got no reply")
+                exit_code = 1
+                continue
+            latencies.append(fake.sent[seen]["sent_at"] - started)
+
+        print(f"mode={args.mode} replies={len(latencies)}/{args.messages}")
+        print(f"latency p50={percentile(latencies, 0.50) * 1000:.1f} ms p95={percentile(latencies, 0.95) * 1000:.1f} ms")
+
+        if source.is_webhook:
+            seen = len(fake.sent)
+            await asyncio.to_thread(fake.push_text, USER_ID, "forged", "wrong-secret")
+            await asyncio.sleep(0.5)
+            rejected = fake.webhook_rejections == 1 and len(fake.sent) == seen
+            print(f"wrong secret token rejected: {rejected}")
+            if not rejected:
+                exit_code = 1
+    finally:
+        await app.updater.stop()
+        await app.stop()
+        await app.shutdown()
+        server.shutdown()
+    return exit_code
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("polling", "webhook"), default="webhook")
+    parser.add_argument("--messages", type=int, default=20)
+    parser.add_argument("--port", type=int, default=8443, help="Webhook server port (webhook mode)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
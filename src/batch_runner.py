@@ -0,0 +1,81 @@
+import argparse
+import os
+import sys
+
+# Ensure project root is in python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.infrastructure.ai.generator_factory import build_content_generator
+from src.infrastructure.automation.browser_pool import BrowserPool, default_use_uc
+from src.infrastructure.automation.driver_factory import build_automation_driver, build_session_cache
+from src.infrastructure.automation.selectors import MagangHubSelectors
+from src.infrastructure.integrations.roster_file import format_results_table, load_roster, write_results
+from src.services.batch_service import BatchReportService, recommended_worker_count
+from src.config import config
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Submit daily reports for a roster of accounts")
+    parser.add_argument("--roster", default=os.getenv("BATCH_ROSTER_PATH", "roster.csv"),
+                        help="CSV/JSON roster: email, password|password_env, activity, context")
+    parser.add_argument("--workers", type=int, default=config.batch_workers if config else 0,
+                        help="Concurrent submissions (0 = auto from CPU cores and free memory)")
+    parser.add_argument("--spread-seconds", type=float, default=config.batch_spread_seconds if config else 0,
+                        help="Spread job start times across this window")
+    parser.add_argument("--output", default=os.getenv("BATCH_RESULT_PATH", "batch_results.csv"),
+                        help="Where to write the per-account result table (CSV)")
+    return parser.parse_args()
+
+
+def main():
+    if not config:
+        raise SystemExit(1)
+
+    args = parse_args()
+    entries = load_roster(args.roster)
+    if not entries:
+        print("❌ Roster is empty.")
+        raise SystemExit(1)
+
+    workers = args.workers or recommended_worker_count()
+    workers = min(workers, len(entries))
+
+    # No generation cache here: interns sharing an activity text must not receive identical reports.
+    ai_provider = build_content_generator(config)
+    is_headless = not config.show_browser
+    # Key derivation runs once here; every job's driver shares the cache.
+    session_cache = build_session_cache(config)
+    # One warm browser per worker; each job borrows from the pool through its own driver.
+    browser_pool = BrowserPool(
+        headless=is_headless,
+        use_uc=default_use_uc(),
+        min_size=config.browser_pool_min_size,
+        max_size=workers,
+        max_uses=config.browser_pool_max_uses,
+        max_rss_mb=config.browser_pool_max_rss_mb,
+        storage_origins=(config.maganghub_web_base_url or MagangHubSelectors.BASE_URL,),
+    )
+    batch = BatchReportService(
+        ai_provider,
+        driver_factory=lambda: build_automation_driver(
+            config, headless=is_headless, pool=browser_pool, session_cache=session_cache
+        ),
+        max_workers=workers,
+        spread_seconds=args.spread_seconds,
+    )
+
+    try:
+        results = batch.run(entries, default_context=config.aktivitas_konteks)
+    finally:
+        browser_pool.close_all()
+
+    write_results(args.output, results)
+    print(format_results_table(results))
+    print(f"📝 Result table written to {args.output}")
+
+    if not all(result.success for result in results):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,25 @@
 import os
 import sys
 import logging
+import threading
 
 # Ensure project root is in python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.infrastructure.ai.openrouter_ai import OpenRouterAI
-from src.infrastructure.automation.seleniumbase_driver import SeleniumBaseDriver
+from src.infrastructure.ai.generator_factory import (
+    build_async_content_generator,
+    build_content_generator,
+    build_generation_cache_store,
+)
+from src.infrastructure.automation.browser_pool import BrowserPool, default_use_uc
+from src.infrastructure.automation.driver_factory import build_automation_driver, build_session_cache
+from src.infrastructure.automation.selectors import MagangHubSelectors
+from src.infrastructure.integrations.tenant_store import TenantStore
+from src.infrastructure.monitoring.metrics import metrics
 from src.infrastructure.telegram.bot import TelegramBotHandler
-from src.services.report_service import ReportService
+from src.infrastructure.telegram.update_source import UpdateSource
+from src.services.batch_service import recommended_worker_count
+from src.services.submission_scheduler import SubmissionScheduler
 from src.config import config
 from src.utils.logger import setup_logger
 
@@ -20,29 +31,77 @@ def main():
         logger.error("❌ TELEGRAM_BOT_TOKEN is missing in .env")
         print("Please add TELEGRAM_BOT_TOKEN=your_token to .env")
         return
+    if not config.has_single_account() and not config.tenant_store_secret:
+        logger.error("❌ Set MAGANGHUB_EMAIL / MAGANGHUB_PASSWORD or TENANT_STORE_SECRET in .env")
+        return
 
     logger.info("🤖 Starting AutoAbsen Telegram Bot...")
 
     # Dependency Injection
-    ai_provider = OpenRouterAI(
-        api_key=config.openrouter_api_key,
-        model=config.ai_model,
-    )
+    # Sync and async generators share one cache store. No cache in multi-tenant mode (as in
+    # batch_runner): interns sharing an activity text must not receive identical reports.
+    generation_cache = None if config.tenant_store_secret else build_generation_cache_store(config)
+    ai_provider = build_content_generator(config, generation_cache)
     # For bot, we usually want headless=True
     is_headless = not config.show_browser
-    automation_driver = SeleniumBaseDriver(headless=is_headless)
-    
-    service = ReportService(ai_provider, automation_driver)
-    
+    # Each worker runs one browser at a time; the worker count is what bounds Chrome memory.
+    workers = config.bot_workers or recommended_worker_count()
+    # Key derivation runs once here; every job's driver shares the cache.
+    session_cache = build_session_cache(config)
+    # Long-running bot keeps at least one browser warm so queued reports skip Chrome startup.
+    browser_pool = BrowserPool(
+        headless=is_headless,
+        use_uc=default_use_uc(),
+        min_size=max(1, config.browser_pool_min_size),
+        max_size=max(config.browser_pool_max_size, workers),
+        max_uses=config.browser_pool_max_uses,
+        max_rss_mb=config.browser_pool_max_rss_mb,
+        storage_origins=(config.maganghub_web_base_url or MagangHubSelectors.BASE_URL,),
+    )
+    threading.Thread(target=browser_pool.warm_up, daemon=True).start()
+    if config.metrics_port:
+        metrics.serve(config.metrics_port, config.metrics_host)
+        metrics.track_browser_rss(browser_pool.total_rss_mb)
+
+    # Every job gets its own driver (drivers hold per-session browser state).
+    scheduler = SubmissionScheduler(
+        ai_provider,
+        driver_factory=lambda: build_automation_driver(
+            config, headless=is_headless, pool=browser_pool, session_cache=session_cache
+        ),
+        workers=workers,
+        max_queue=config.bot_queue_size,
+        job_seconds_estimate=config.bot_job_seconds_estimate,
+        pipelined=config.report_pipeline,
+    )
+    logger.info(f"Submission queue: workers={workers}, max_queue={config.bot_queue_size}")
+
     # Init Bot
     try:
-        # Create bot handler
-        # Note: ReportService is passed inside cause we want single instance
-        bot = TelegramBotHandler(config.telegram_bot_token, service)
+        async_ai = build_async_content_generator(config, generation_cache)
+        tenants = None
+        if config.tenant_store_secret:
+            tenants = TenantStore(
+                config.tenant_store_path,
+                config.tenant_store_secret,
+                cache_ttl_seconds=config.tenant_cache_ttl_seconds,
+            )
+            logger.info(f"Tenant store: {len(tenants.telegram_ids())} registered user(s)")
+        bot = TelegramBotHandler(
+            config.telegram_bot_token,
+            scheduler,
+            async_ai=async_ai,
+            tenants=tenants,
+            registration_open=config.tenant_registration_open,
+            registration_ids=[item.strip() for item in (config.tenant_registration_ids or "").split(",") if item.strip()],
+            update_source=UpdateSource.from_config(config),
+        )
         bot.start()
     except Exception as e:
         logger.error(f"Failed to start bot: {e}")
         print(f"Error: {e}")
+    finally:
+        browser_pool.close_all()
 
 if __name__ == "__main__":
     main()
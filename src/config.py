@@ -1,7 +1,11 @@
+import threading
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, EmailStr, model_validator
 from typing import Optional
 
+from src.core.exceptions import ConfigurationError
+
 class AppConfig(BaseSettings):
     """
     Application Configuration using Pydantic Settings.
@@ -9,17 +13,23 @@ class AppConfig(BaseSettings):
     Fails fast if required environment variables are missing.
     """
     
-    # MagangHub Credentials
-    maganghub_email: EmailStr = Field(..., description="Email for MagangHub login")
-    maganghub_password: str = Field(..., description="Password for MagangHub login")
+    # MagangHub Credentials (single-account modes; batch mode reads a roster instead)
+    maganghub_email: Optional[EmailStr] = Field(None, description="Email for MagangHub login")
+    maganghub_password: Optional[str] = Field(None, description="Password for MagangHub login")
     
     # AI Configuration
     openrouter_api_key: str = Field(..., description="API Key for OpenRouter")
     ai_model: str = Field("openai/gpt-4o-mini", description="AI Model to use")
+    openrouter_base_url: Optional[str] = Field(None, description="Override the OpenAI-compatible API base URL (e.g. local stub)")
     
     # Context
     aktivitas_konteks: str = Field("Mahasiswa Magang IT", description="Context for AI generation")
     
+    # Generation Cache (SQLite, keyed by normalized context + activity + model)
+    generation_cache_path: str = Field(".cache/generation.sqlite3", description="Cache file; empty disables caching")
+    generation_cache_max_entries: int = Field(200, description="LRU bound for cached reports")
+    generation_cache_ttl_hours: int = Field(24, description="Maximum age of a cached report")
+
     # App Settings
     show_browser: bool = Field(
         True,
@@ -28,9 +38,68 @@ class AppConfig(BaseSettings):
     )
     log_level: str = Field("INFO", description="Logging level")
 
+    # Browser Pool (warm Chrome sessions reused across submissions)
+    browser_pool_min_size: int = Field(0, description="Browsers kept warm at all times")
+    browser_pool_max_size: int = Field(1, description="Maximum concurrent browsers")
+    browser_pool_max_uses: int = Field(20, description="Recycle a browser after N checkouts")
+    browser_pool_max_rss_mb: int = Field(1500, description="Recycle a browser above this RSS (MB)")
+
+    # Resource blocking (headless runs only): CDP Network.setBlockedURLs wildcard patterns
+    resource_blocking: bool = Field(True, description="Block images/fonts/trackers in headless runs")
+    maganghub_block_deny: Optional[str] = Field(None, description="Extra comma-separated URL patterns to block")
+    maganghub_block_allow: Optional[str] = Field(None, description="Comma-separated URL patterns never blocked")
+    network_baseline_path: str = Field(".cache/network_baseline.json", description="Unblocked usage baseline; empty disables measurement")
+
+    # Submission mode: "browser" (SeleniumBase) or "http" (API first, browser fallback; API contract unverified)
+    maganghub_submit_mode: str = Field("browser", description="Submission driver: browser or http")
+    maganghub_api_base_url: Optional[str] = Field(None, description="Override MagangHub API base URL (e.g. local stub)")
+    maganghub_web_base_url: Optional[str] = Field(None, description="Override MagangHub web origin for the browser driver (e.g. local stub)")
+
+    # Batch mode (multi-account roster)
+    batch_workers: int = Field(0, description="Concurrent batch submissions (0 = auto)")
+    batch_spread_seconds: float = Field(0, description="Spread batch job starts across this window")
+
+    # Session Cache (encrypted cookies/localStorage to skip login on repeat runs)
+    session_cache_secret: Optional[str] = Field(None, description="Secret for session cache encryption; unset disables the cache")
+    session_cache_dir: str = Field(".cache/sessions", description="Directory for encrypted session files")
+    session_cache_ttl_minutes: int = Field(360, description="Maximum age of a cached session")
+
+    # Metrics (Prometheus endpoint for the long-running bot)
+    metrics_port: int = Field(0, description="Port for the /metrics endpoint (0 = disabled)")
+    metrics_host: str = Field("0.0.0.0", description="Bind address for the /metrics endpoint")
+
+    # Telegram bot submission queue
+    bot_workers: int = Field(0, description="Concurrent bot submissions, one browser each (0 = auto from CPU/RAM)")
+    bot_queue_size: int = Field(20, description="Maximum jobs waiting for a worker")
+    bot_job_seconds_estimate: float = Field(90, description="Initial per-job duration estimate for queue ETAs")
+
+    # Tenant store (multi-user bot: Telegram ID -> encrypted credentials/context/preferences)
+    tenant_store_secret: Optional[str] = Field(None, description="Secret for tenant store encryption; unset keeps single-account mode")
+    tenant_store_path: str = Field(".cache/tenants.sqlite3", description="SQLite file for the tenant store")
+    tenant_cache_ttl_seconds: int = Field(300, description="In-memory tenant read cache TTL")
+    tenant_registration_open: bool = Field(False, description="Allow any Telegram user to /register")
+    tenant_registration_ids: Optional[str] = Field(None, description="Comma-separated Telegram IDs allowed to /register while registration is closed")
+
+    # Report pipeline (CLI + Telegram bot): overlap AI generation with session start and login
+    report_pipeline: bool = Field(True, description="Generate the report while the portal session starts and logs in")
+
+    # Workflow bot: prepare browser/login/today's report while the user reviews the draft
+    workflow_prewarm: bool = Field(True, description="Speculatively prepare the submission once a draft is shown")
+    draft_candidates: int = Field(1, description="Drafts generated per activity in the workflow (1 = no candidate pool)")
+    draft_candidate_temperatures: str = Field("0.9,1.1", description="Comma-separated temperatures for alternate drafts")
+    draft_candidate_models: Optional[str] = Field(None, description="Comma-separated models for alternate drafts (empty = AI_MODEL)")
+    workflow_prewarm_max_age_seconds: int = Field(600, description="Refresh a prewarmed session older than this at YES")
+
     # Telegram Bot
     telegram_bot_token: Optional[str] = Field(None, description="Token for Telegram Bot")
     allowed_telegram_id: Optional[str] = Field(None, description="Allowed User ID for bot")
+    telegram_update_mode: str = Field("polling", description="How bots receive updates: polling or webhook")
+    telegram_webhook_url: Optional[str] = Field(None, description="Public base URL Telegram posts updates to (webhook mode)")
+    telegram_webhook_listen: str = Field("0.0.0.0", description="Bind address of the embedded webhook server")
+    telegram_webhook_port: int = Field(8443, description="Port of the embedded webhook server")
+    telegram_webhook_path: str = Field("telegram", description="URL path of the webhook endpoint")
+    telegram_webhook_secret: Optional[str] = Field(None, description="Secret token Telegram must send; random per process when unset")
+    telegram_api_base_url: Optional[str] = Field(None, description="Override the Bot API server (e.g. local fake)")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -39,6 +108,9 @@ class AppConfig(BaseSettings):
         case_sensitive=False  # Allow MAGANGHUB_EMAIL or maganghub_email
     )
 
+    def has_single_account(self) -> bool:
+        return bool(self.maganghub_email and self.maganghub_password)
+
     @model_validator(mode="before")
     @classmethod
     def apply_headless_compatibility(cls, data):
@@ -65,10 +137,41 @@ class AppConfig(BaseSettings):
         data["SHOW_BROWSER"] = not parsed_headless
         return data
 
-# Singleton instance
-try:
-    config = AppConfig()
-except Exception as e:
-    print(f"❌ Configuration Error: {e}")
-    # We might want to exit here, but letting the caller handle it is more flexible
-    config = None
+class DeferredConfig:
+    """
+    Stand-in for the AppConfig singleton: .env is read and validated on first
+    use (attribute access or truth test) instead of at import time, so importing
+    an entry point costs nothing until it actually needs a setting.
+    Like the None it replaces, it is falsy when the configuration is invalid.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resolved = False
+        self._value: Optional[AppConfig] = None
+
+    def resolve(self) -> Optional[AppConfig]:
+        if not self._resolved:
+            with self._lock:
+                if not self._resolved:
+                    try:
+                        self._value = AppConfig()
+                    except Exception as e:
+                        print(f"❌ Configuration Error: {e}")
+                        # Letting the caller handle it is more flexible than exiting here.
+                        self._value = None
+                    self._resolved = True
+        return self._value
+
+    def __bool__(self) -> bool:
+        return self.resolve() is not None
+
+    def __getattr__(self, name: str):
+        value = self.resolve()
+        if value is None:
+            raise ConfigurationError("Configuration is invalid (see the Configuration Error above)")
+        return getattr(value, name)
+
+
+# Singleton instance (resolved on first use)
+config = DeferredConfig()
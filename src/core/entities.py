@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import ClassVar
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, Optional
 
 @dataclass
 class Report:
@@ -20,3 +20,38 @@ class Report:
             len(self.learning) >= self.MIN_FIELD_LENGTH and
             len(self.obstacles) >= self.MIN_FIELD_LENGTH
         )
+
+
+@dataclass
+class RosterEntry:
+    """
+    One intern account in a batch run: credentials plus today's activity.
+    An empty context falls back to the batch-wide default context.
+    """
+    email: str
+    password: str
+    activity: str
+    context: str = ""
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one account in a batch run (never carries the password)."""
+    email: str
+    success: bool
+    duration_seconds: float
+    started_at: str
+    error: Optional[str] = None
+
+
+@dataclass
+class Tenant:
+    """
+    One bot user: Telegram ID mapped to MagangHub credentials, generation
+    context and free-form preferences. An empty context falls back to the default.
+    """
+    telegram_id: int
+    email: str
+    password: str
+    context: str = ""
+    preferences: Dict[str, Any] = field(default_factory=dict)
@@ -17,3 +17,7 @@ class ContentGenerationError(AutoAbsenError):
 class AutomationError(AutoAbsenError):
     """Raised when SeleniumBase automation fails"""
     pass
+
+class QueueFullError(AutoAbsenError):
+    """Raised when the submission queue has no room for another job"""
+    pass
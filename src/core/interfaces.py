@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Any, Awaitable, Callable, Dict
 from .entities import Report
 
 class IContentGenerator(ABC):
@@ -11,6 +11,35 @@ class IContentGenerator(ABC):
     def generate_content(self, context: str, user_input: str) -> Report:
         pass
 
+class IAsyncContentGenerator(ABC):
+    """
+    Asyncio-native variant of IContentGenerator for callers running on an
+    event loop (Telegram handlers), so generation does not need an executor.
+    """
+    @abstractmethod
+    async def generate_content(self, context: str, user_input: str) -> Report:
+        pass
+
+    async def generate_content_streaming(
+        self,
+        context: str,
+        user_input: str,
+        on_progress: Callable[[Dict[str, str]], Awaitable[None]],
+    ) -> Report:
+        """
+        Like generate_content, but reports partial field text through on_progress
+        while the completion streams. Default: a single callback with the result.
+        """
+        report = await self.generate_content(context, user_input)
+        await on_progress(
+            {"activity": report.activity, "learning": report.learning, "obstacles": report.obstacles}
+        )
+        return report
+
+    async def aclose(self):
+        """Release pooled connections."""
+        pass
+
 class IAutomationDriver(ABC):
     """
     Interface for Browser Automation Drivers.
@@ -40,6 +69,21 @@ class IAutomationDriver(ABC):
     def close(self):
         pass
 
+    def prepare_submission(self, email: str, password: str) -> bool:
+        """
+        Slow half of a submission that does not need the report: start the
+        session, log in and open today's report. Safe to run speculatively.
+        """
+        return self.login(email, password) and self.navigate_to_report_page()
+
+    def submission_ready(self) -> bool:
+        """Whether a prepared session can still take finish_submission (not stale)."""
+        return True
+
+    def finish_submission(self, report: Report) -> bool:
+        """Fast half: fill and submit on a session readied by prepare_submission."""
+        return self.fill_report(report) and self.submit_report()
+
 class IInteractionHandler(ABC):
     """
     Interface for handling user interaction (Bot, CLI, API).
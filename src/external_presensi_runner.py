@@ -6,7 +6,11 @@ from datetime import datetime, timedelta, timezone
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.infrastructure.automation.presensi_driver import PresensiDriver
+from src.infrastructure.automation.presensi_fallback import FallbackPresensiSubmitter
+from src.infrastructure.automation.presensi_http_client import PresensiHttpClient
+from src.infrastructure.automation.resource_blocking import NetworkBaseline, PRESENSI_PROFILE, parse_pattern_list
 from src.infrastructure.integrations.telegram_notifier import TelegramNotifier
+from src.infrastructure.monitoring.metrics import log_event
 
 
 DEFAULT_PRESENSI_URL = (
@@ -54,6 +58,7 @@ def run() -> bool:
     unit_name = (os.getenv("PRESENSI_UNIT") or DEFAULT_UNIT).strip()
     action = (os.getenv("PRESENSI_ACTION") or "").strip().upper()
     show_browser = _parse_bool(os.getenv("PRESENSI_SHOW_BROWSER"), False)
+    submit_mode = (os.getenv("PRESENSI_SUBMIT_MODE") or "browser").strip().lower()
 
     if not url:
         print("❌ PRESENSI_URL is empty.")
@@ -67,9 +72,28 @@ def run() -> bool:
     if action not in {"MASUK", "KELUAR"}:
         print("❌ PRESENSI_ACTION must be either MASUK or KELUAR.")
         return False
+    if submit_mode not in {"browser", "http"}:
+        print("❌ PRESENSI_SUBMIT_MODE must be either browser or http.")
+        return False
 
-    driver = PresensiDriver(headless=not show_browser)
-    success, details = driver.submit_presensi(
+    blocking = None
+    if _parse_bool(os.getenv("PRESENSI_RESOURCE_BLOCKING"), True):
+        blocking = PRESENSI_PROFILE.with_overrides(
+            extra_deny=parse_pattern_list(os.getenv("PRESENSI_BLOCK_DENY")),
+            extra_allow=parse_pattern_list(os.getenv("PRESENSI_BLOCK_ALLOW")),
+        )
+    baseline_path = os.getenv("NETWORK_BASELINE_PATH", ".cache/network_baseline.json").strip()
+
+    driver = PresensiDriver(
+        headless=not show_browser,
+        blocking=blocking,
+        network_baseline=NetworkBaseline(baseline_path) if baseline_path else None,
+    )
+    if submit_mode == "http":
+        log_event("PRESENSI-HTTP-UNVERIFIED", "PRESENSI_SUBMIT_MODE=http uses an assumed form/reply contract (see presensi_endpoint.py)")
+    # http posts straight to the Apps Script endpoint; the browser only launches if that fails.
+    submitter = FallbackPresensiSubmitter(PresensiHttpClient(), driver) if submit_mode == "http" else driver
+    success, details = submitter.submit_presensi(
         url=url,
         full_name=full_name,
         unit_name=unit_name,
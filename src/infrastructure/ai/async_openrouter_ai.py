@@ -0,0 +1,184 @@
+import asyncio
+import copy
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+
+from src.core.interfaces import IAsyncContentGenerator
+from src.core.entities import Report
+from src.infrastructure.monitoring.metrics import timed_stage
+from .openrouter_ai import OpenRouterClientBase
+from .prompt_template import PromptTemplate
+from .stream_parser import IncrementalReportParser
+
+
+class AsyncOpenRouterAI(OpenRouterClientBase, IAsyncContentGenerator):
+    """
+    Asyncio implementation of the OpenRouter adapter.
+    Keeps one HTTP/2 keep-alive connection pool for the process lifetime, so the
+    main prompt and the follow-up extension calls share a single TLS connection.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "openai/gpt-4o-mini",
+        timeout_seconds: float = 30,
+        max_connections: int = 10,
+        batch_extensions: bool = True,
+        base_url: Optional[str] = None,
+    ):
+        super().__init__(api_key, model, batch_extensions=batch_extensions, base_url=base_url)
+        self.timeout_seconds = timeout_seconds
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                http2=True,
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                    keepalive_expiry=300,
+                ),
+            )
+        return self._client
+
+    def variant(self, temperature: Optional[float] = None, model: Optional[str] = None) -> "AsyncOpenRouterAI":
+        """
+        Same API key, stats and connection pool with other sampling settings
+        (e.g. draft candidates). Close the original, not the variants.
+        """
+        clone = copy.copy(self)
+        clone._get_client = self._get_client
+        if temperature is not None:
+            clone.temperature = temperature
+        if model:
+            clone.model = model
+        return clone
+
+    @timed_stage("ai_generate", backend="openrouter")
+    async def generate_content(self, context: str, user_input: str) -> Report:
+        prompt = PromptTemplate.generate_report_prompt(context, user_input)
+
+        try:
+            response_json = await self._call_api(prompt)
+            data = self._parse_json_response(response_json)
+
+            data = await self._ensure_lengths(data)
+            return Report(
+                activity=data.get('activity', ''),
+                learning=data.get('learning', ''),
+                obstacles=data.get('obstacles', ''),
+            )
+
+        except Exception as e:
+            print(f"AI Generation failed: {e}")
+            raise
+
+    @timed_stage("ai_generate", backend="openrouter")
+    async def generate_content_streaming(
+        self,
+        context: str,
+        user_input: str,
+        on_progress: Callable[[Dict[str, str]], Awaitable[None]],
+    ) -> Report:
+        prompt = PromptTemplate.generate_report_prompt(context, user_input)
+
+        try:
+            parser = IncrementalReportParser()
+            last_snapshot: Dict[str, str] = {}
+            async for delta in self._stream_api(prompt):
+                snapshot = {field: text for field, (text, _) in parser.feed(delta).items()}
+                if snapshot != last_snapshot:
+                    last_snapshot = snapshot
+                    await on_progress(snapshot)
+
+            data = self._parse_json_response(parser.buffer)
+            data = await self._ensure_lengths(data)
+            report = Report(
+                activity=data.get('activity', ''),
+                learning=data.get('learning', ''),
+                obstacles=data.get('obstacles', ''),
+            )
+            await on_progress({"activity": report.activity, "learning": report.learning, "obstacles": report.obstacles})
+            return report
+
+        except Exception as e:
+            print(f"AI Generation failed: {e}")
+            raise
+
+    async def _stream_api(self, prompt: str):
+        """Yield content deltas from an OpenRouter SSE completion stream."""
+        self._count("api_calls")
+        payload = dict(self._build_payload(prompt), stream=True)
+        async with self._get_client().stream("POST", "/chat/completions", json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                # SSE: "data: {...}" events; ": ..." lines are keep-alive comments.
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                try:
+                    event = json.loads(data)
+                except ValueError:
+                    continue
+                choices = event.get("choices") or [{}]
+                delta = (choices[0].get("delta") or {}).get("content")
+                if delta:
+                    yield delta
+
+    async def _call_api(self, prompt: str) -> str:
+        self._count("api_calls")
+        response = await self._get_client().post("/chat/completions", json=self._build_payload(prompt))
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
+
+    async def _ensure_length(self, text: str, field_type: str) -> str:
+        if len(text) >= Report.MIN_FIELD_LENGTH:
+            return text
+
+        try:
+            prompt = PromptTemplate.extend_content_prompt(text, field_type)
+            self._count("extension_calls")
+            return (await self._call_api(prompt)).strip()
+        except Exception:
+            return text  # Return original if extension fails
+
+    async def _ensure_lengths(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        short = self._short_fields(data)
+        if not short:
+            return data
+
+        started = time.perf_counter()
+        pending = list(short)
+        if self.batch_extensions and len(short) > 1:
+            try:
+                self._count("extension_calls")
+                response_text = await self._call_api(PromptTemplate.extend_fields_prompt(short))
+                pending = self._merge_batched_extension(data, short, response_text)
+            except Exception:
+                pending = list(short)
+
+        if pending:
+            extended = await asyncio.gather(
+                *(self._ensure_length(data.get(field, ''), field) for field in pending)
+            )
+            data.update(zip(pending, extended))
+            self._count("sequential_waits_saved", len(pending) - 1)
+
+        self._log_extension(len(short), started)
+        return data
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,231 @@
+import asyncio
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Optional
+
+from src.core.interfaces import IAsyncContentGenerator, IContentGenerator
+from src.core.entities import Report
+
+
+def make_cache_key(context: str, user_input: str, model: str) -> str:
+    """Normalize case/whitespace/trailing punctuation so near-identical inputs share a key."""
+    def normalize(text: str) -> str:
+        return re.sub(r"\s+", " ", (text or "").strip().lower()).rstrip(" .!?,;")
+
+    raw = "\x1f".join((normalize(context), normalize(user_input), (model or "").strip().lower()))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class GenerationCacheStore:
+    """
+    SQLite-backed report cache bounded by entry count (LRU) and age (TTL).
+    Follows SRP: persistence + eviction only; coalescing lives in the wrappers.
+    """
+
+    def __init__(self, path: str, max_entries: int = 200, ttl_seconds: int = 24 * 3600):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0, "expired": 0}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS generations (
+                key TEXT PRIMARY KEY,
+                activity TEXT NOT NULL,
+                learning TEXT NOT NULL,
+                obstacles TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_generations_last_access ON generations(last_access)")
+        self._conn.commit()
+
+    def count(self, metric: str):
+        with self._lock:
+            self.stats[metric] += 1
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self.stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+    def get(self, key: str) -> Optional[Report]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT activity, learning, obstacles, created_at FROM generations WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            if now - row[3] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM generations WHERE key = ?", (key,))
+                self._conn.commit()
+                self.stats["expired"] += 1
+                self.stats["misses"] += 1
+                return None
+            self._conn.execute("UPDATE generations SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.stats["hits"] += 1
+        return Report(activity=row[0], learning=row[1], obstacles=row[2])
+
+    def put(self, key: str, report: Report):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO generations VALUES (?, ?, ?, ?, ?, ?)",
+                (key, report.activity, report.learning, report.obstacles, now, now),
+            )
+            self._conn.execute("DELETE FROM generations WHERE created_at < ?", (now - self.ttl_seconds,))
+            overflow = self._conn.execute("SELECT COUNT(*) FROM generations").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM generations WHERE key IN "
+                    "(SELECT key FROM generations ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,),
+                )
+                self.stats["evictions"] += overflow
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def uncached(generator):
+    """The generator behind a cache wrapper (or the generator itself), for callers that need a new draft."""
+    if isinstance(generator, (CachedContentGenerator, AsyncCachedContentGenerator)):
+        return generator.inner
+    return generator
+
+
+def _model_of(generator) -> str:
+    return getattr(generator, "model", type(generator).__name__)
+
+
+class CachedContentGenerator(IContentGenerator):
+    """
+    Decorator over any IContentGenerator: serves repeated inputs from the store
+    and coalesces identical in-flight requests into a single LLM call.
+    """
+
+    def __init__(self, inner: IContentGenerator, store: GenerationCacheStore):
+        self.inner = inner
+        self.store = store
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def generate_content(self, context: str, user_input: str) -> Report:
+        key = make_cache_key(context, user_input, _model_of(self.inner))
+        cached = self.store.get(key)
+        if cached is not None:
+            print(f"AI cache hit (stats={self.store.get_stats()})")
+            return cached
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            self.store.count("coalesced")
+            return future.result()
+
+        try:
+            report = self.inner.generate_content(context, user_input)
+            if report.validate():
+                self.store.put(key, report)
+            future.set_result(report)
+            return report
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+
+class AsyncCachedContentGenerator(IAsyncContentGenerator):
+    """Asyncio counterpart of CachedContentGenerator (coalesces on the event loop)."""
+
+    def __init__(self, inner: IAsyncContentGenerator, store: GenerationCacheStore):
+        self.inner = inner
+        self.store = store
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    async def generate_content(self, context: str, user_input: str) -> Report:
+        return await self._generate(context, user_input, None)
+
+    async def generate_content_streaming(
+        self,
+        context: str,
+        user_input: str,
+        on_progress: Callable[[Dict[str, str]], Awaitable[None]],
+    ) -> Report:
+        return await self._generate(context, user_input, on_progress)
+
+    async def _generate(
+        self,
+        context: str,
+        user_input: str,
+        on_progress: Optional[Callable[[Dict[str, str]], Awaitable[None]]],
+    ) -> Report:
+        key = make_cache_key(context, user_input, _model_of(self.inner))
+        cached = self.store.get(key)
+        if cached is None:
+            pending = self._inflight.get(key)
+            if pending is not None:
+                self.store.count("coalesced")
+                cached = await asyncio.shield(pending)
+        else:
+            print(f"AI cache hit (stats={self.store.get_stats()})")
+
+        if cached is not None:
+            if on_progress is not None:
+                await on_progress(
+                    {"activity": cached.activity, "learning": cached.learning, "obstacles": cached.obstacles}
+                )
+            return cached
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            if on_progress is not None:
+                report = await self.inner.generate_content_streaming(context, user_input, on_progress)
+            else:
+                report = await self.inner.generate_content(context, user_input)
+            if report.validate():
+                self.store.put(key, report)
+            future.set_result(report)
+            return report
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                # Mark retrieved so an un-awaited failure does not warn at GC time.
+                future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def aclose(self):
+        await self.inner.aclose()
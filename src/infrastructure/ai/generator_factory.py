@@ -0,0 +1,68 @@
+from typing import List, Optional
+
+from src.core.interfaces import IAsyncContentGenerator, IContentGenerator
+from .generation_cache import AsyncCachedContentGenerator, CachedContentGenerator, GenerationCacheStore, uncached
+
+# Adapters are imported inside the builders: the sync one pulls in requests and
+# the async one httpx, and each entry point only ever needs one of them.
+
+
+def build_generation_cache_store(settings) -> Optional[GenerationCacheStore]:
+    """Empty GENERATION_CACHE_PATH disables the cache."""
+    if not settings.generation_cache_path:
+        return None
+    return GenerationCacheStore(
+        path=settings.generation_cache_path,
+        max_entries=settings.generation_cache_max_entries,
+        ttl_seconds=settings.generation_cache_ttl_hours * 3600,
+    )
+
+
+def build_content_generator(settings, store: Optional[GenerationCacheStore] = None) -> IContentGenerator:
+    from .openrouter_ai import OpenRouterAI
+
+    generator = OpenRouterAI(
+        api_key=settings.openrouter_api_key,
+        model=settings.ai_model,
+        base_url=settings.openrouter_base_url,
+    )
+    return CachedContentGenerator(generator, store) if store is not None else generator
+
+
+def build_async_content_generator(
+    settings,
+    store: Optional[GenerationCacheStore] = None,
+) -> IAsyncContentGenerator:
+    from .async_openrouter_ai import AsyncOpenRouterAI
+
+    generator = AsyncOpenRouterAI(
+        api_key=settings.openrouter_api_key,
+        model=settings.ai_model,
+        base_url=settings.openrouter_base_url,
+    )
+    return AsyncCachedContentGenerator(generator, store) if store is not None else generator
+
+
+def _parse_list(raw: Optional[str]) -> List[str]:
+    return [item.strip() for item in (raw or "").split(",") if item.strip()]
+
+
+def build_draft_variants(settings, generator: IAsyncContentGenerator) -> List[IAsyncContentGenerator]:
+    """
+    Generators for the alternate drafts of a candidate pool: DRAFT_CANDIDATES - 1
+    variants cycling through the configured temperatures and models. They bypass
+    the generation cache (a cached entry would make every alternate identical)
+    and share the primary generator's connection pool.
+    """
+    from .async_openrouter_ai import AsyncOpenRouterAI
+
+    count = max(0, settings.draft_candidates - 1)
+    base = uncached(generator)
+    if count == 0 or not isinstance(base, AsyncOpenRouterAI):
+        return []
+    temperatures = [float(value) for value in _parse_list(settings.draft_candidate_temperatures)] or [None]
+    models = _parse_list(settings.draft_candidate_models) or [None]
+    return [
+        base.variant(temperature=temperatures[index % len(temperatures)], model=models[index % len(models)])
+        for index in range(count)
+    ]
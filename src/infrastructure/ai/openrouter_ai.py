@@ -1,27 +1,122 @@
 import json
-import requests
-from typing import Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
 
 from src.core.interfaces import IContentGenerator
 from src.core.entities import Report
+from src.infrastructure.monitoring.metrics import timed_stage
 from .prompt_template import PromptTemplate
 
-class OpenRouterAI(IContentGenerator):
+REPORT_FIELDS = ("activity", "learning", "obstacles")
+DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
+
+
+class OpenRouterClientBase:
     """
-    Implementation of IContentGenerator using OpenRouter API.
-    Follows OCP: Can be extended or swapped with OpenAI/Claude without changing core logic.
+    Shared OpenRouter request/response handling for the sync and async adapters.
+    Transport (requests vs httpx) is left to subclasses.
     """
-    
-    def __init__(self, api_key: str, model: str = "openai/gpt-4o-mini"):
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "openai/gpt-4o-mini",
+        batch_extensions: bool = True,
+        base_url: Optional[str] = None,
+        temperature: float = 0.7,
+    ):
+        # Batched mode repairs all short fields with one structured request;
+        # per-field requests (run concurrently) remain the fallback.
+        self.batch_extensions = batch_extensions
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, float] = {
+            "api_calls": 0,
+            "extension_calls": 0,
+            "batched_extensions": 0,
+            "round_trips_saved": 0,
+            "sequential_waits_saved": 0,
+            "extension_seconds": 0.0,
+        }
         self.api_key = api_key
-        self.base_url = "https://openrouter.ai/api/v1"
+        # Any OpenAI-compatible endpoint, e.g. the local stub in benchmarks/stubs.
+        self.base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
         self.model = model
+        self.temperature = temperature
         self.headers = {
             "Authorization": f"Bearer {api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/dhyoprd/AutoAbsen",
         }
 
+    def _build_payload(self, prompt: str) -> Dict[str, Any]:
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": self.temperature
+        }
+
+    def _parse_json_response(self, text: str) -> Dict[str, Any]:
+        clean_text = text.strip()
+        if clean_text.startswith("```json"):
+            clean_text = clean_text.replace("```json", "").replace("```", "")
+        elif clean_text.startswith("```"):
+            clean_text = clean_text.replace("```", "")
+             
+        return json.loads(clean_text)
+
+    def _count(self, key: str, amount: float = 1):
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def _short_fields(self, data: Dict[str, Any]) -> Dict[str, str]:
+        return {
+            field: data.get(field, '')
+            for field in REPORT_FIELDS
+            if len(data.get(field, '')) < Report.MIN_FIELD_LENGTH
+        }
+
+    def _merge_batched_extension(self, data: Dict[str, Any], short: Dict[str, str], response_text: str) -> List[str]:
+        """Apply a batched extension response; returns fields that are still short."""
+        try:
+            extended = self._parse_json_response(response_text)
+        except ValueError:
+            extended = {}
+
+        fixed = 0
+        for field in short:
+            value = extended.get(field) if isinstance(extended, dict) else None
+            if isinstance(value, str) and len(value.strip()) >= Report.MIN_FIELD_LENGTH:
+                data[field] = value.strip()
+                fixed += 1
+        if fixed:
+            self._count("batched_extensions")
+            self._count("round_trips_saved", fixed - 1)
+        return [field for field in short if len(data.get(field, '')) < Report.MIN_FIELD_LENGTH]
+
+    def _log_extension(self, short_count: int, started: float):
+        elapsed = time.perf_counter() - started
+        self._count("extension_seconds", elapsed)
+        stats = self.get_stats()
+        print(
+            f"AI extension: {short_count} short field(s) repaired in {elapsed:.2f}s "
+            f"(round_trips_saved={stats['round_trips_saved']}, "
+            f"sequential_waits_saved={stats['sequential_waits_saved']})"
+        )
+
+
+class OpenRouterAI(OpenRouterClientBase, IContentGenerator):
+    """
+    Implementation of IContentGenerator using OpenRouter API.
+    Follows OCP: Can be extended or swapped with OpenAI/Claude without changing core logic.
+    """
+
+    @timed_stage("ai_generate", backend="openrouter")
     def generate_content(self, context: str, user_input: str) -> Report:
         prompt = PromptTemplate.generate_report_prompt(context, user_input)
         
@@ -30,9 +125,7 @@ class OpenRouterAI(IContentGenerator):
             data = self._parse_json_response(response_json)
             
             # Helper to extend short content
-            data['activity'] = self._ensure_length(data.get('activity', ''), 'activity')
-            data['learning'] = self._ensure_length(data.get('learning', ''), 'learning')
-            data['obstacles'] = self._ensure_length(data.get('obstacles', ''), 'obstacles')
+            data = self._ensure_lengths(data)
             
             return Report(
                 activity=data['activity'],
@@ -47,30 +140,18 @@ class OpenRouterAI(IContentGenerator):
             raise
 
     def _call_api(self, prompt: str) -> str:
-        payload = {
-            "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.7
-        }
-        
+        import requests  # not at module level: the async adapter shares this module's base class
+
+        self._count("api_calls")
         response = requests.post(
             f"{self.base_url}/chat/completions",
             headers=self.headers,
-            json=payload,
+            json=self._build_payload(prompt),
             timeout=30
         )
         response.raise_for_status()
         return response.json()["choices"][0]["message"]["content"]
 
-    def _parse_json_response(self, text: str) -> Dict[str, Any]:
-        clean_text = text.strip()
-        if clean_text.startswith("```json"):
-            clean_text = clean_text.replace("```json", "").replace("```", "")
-        elif clean_text.startswith("```"):
-            clean_text = clean_text.replace("```", "")
-             
-        return json.loads(clean_text)
-
     def _ensure_length(self, text: str, field_type: str) -> str:
         if len(text) >= Report.MIN_FIELD_LENGTH:
             return text
@@ -78,6 +159,31 @@ class OpenRouterAI(IContentGenerator):
         # Extension logic
         try:
             prompt = PromptTemplate.extend_content_prompt(text, field_type)
+            self._count("extension_calls")
             return self._call_api(prompt).strip()
         except Exception:
             return text  # Return original if extension fails
+
+    def _ensure_lengths(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        short = self._short_fields(data)
+        if not short:
+            return data
+
+        started = time.perf_counter()
+        pending = list(short)
+        if self.batch_extensions and len(short) > 1:
+            try:
+                self._count("extension_calls")
+                response_text = self._call_api(PromptTemplate.extend_fields_prompt(short))
+                pending = self._merge_batched_extension(data, short, response_text)
+            except Exception:
+                pending = list(short)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                extended = list(executor.map(lambda field: self._ensure_length(data.get(field, ''), field), pending))
+            data.update(zip(pending, extended))
+            self._count("sequential_waits_saved", len(pending) - 1)
+
+        self._log_extension(len(short), started)
+        return data
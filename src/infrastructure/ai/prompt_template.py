@@ -1,3 +1,6 @@
+import json
+from typing import Dict
+
 from src.core.entities import Report
 
 
@@ -41,4 +44,19 @@ Tipe: {field_type}
 Teks asli: {text}
 
 Output hanya teks hasil pengembangan.
+"""
+
+    @staticmethod
+    def extend_fields_prompt(fields: Dict[str, str]) -> str:
+        """Extend several short fields in one request; output keeps the same JSON keys."""
+        return f"""
+Kembangkan setiap teks berikut menjadi minimal {Report.MIN_FIELD_LENGTH} karakter
+(maks {Report.MAX_FIELD_LENGTH}) dengan bahasa profesional.
+Pertahankan makna masing-masing bagian dan jangan gunakan bullet points.
+
+Teks asli (JSON, kunci = tipe bagian):
+{json.dumps(fields, ensure_ascii=False, indent=4)}
+
+Format output (JSON murni, kunci yang sama):
+{json.dumps({key: "..." for key in fields}, indent=4)}
 """
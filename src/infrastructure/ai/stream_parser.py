@@ -0,0 +1,63 @@
+import re
+from typing import Dict, Tuple
+
+from .openrouter_ai import REPORT_FIELDS
+
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class IncrementalReportParser:
+    """
+    Extracts the activity/learning/obstacles string values from a JSON object
+    that is still being streamed, so partial text can be shown before the
+    completion finishes. Tolerates markdown fences and incomplete escapes.
+    """
+
+    _KEY_PATTERN = re.compile(r'"(%s)"\s*:\s*"' % "|".join(REPORT_FIELDS))
+
+    def __init__(self):
+        self.buffer = ""
+
+    def feed(self, chunk: str) -> Dict[str, Tuple[str, bool]]:
+        """Append a chunk; returns {field: (text_so_far, is_complete)} for fields seen so far."""
+        self.buffer += chunk
+        return self.fields()
+
+    def fields(self) -> Dict[str, Tuple[str, bool]]:
+        found = {}
+        for match in self._KEY_PATTERN.finditer(self.buffer):
+            field = match.group(1)
+            if field not in found:
+                found[field] = self._read_string(match.end())
+        return found
+
+    def _read_string(self, start: int) -> Tuple[str, bool]:
+        out = []
+        index = start
+        text = self.buffer
+        while index < len(text):
+            char = text[index]
+            if char == '"':
+                return "".join(out), True
+            if char != "\\":
+                out.append(char)
+                index += 1
+                continue
+
+            # Escape sequence: stop (without consuming) if it is not complete yet.
+            if index + 1 >= len(text):
+                break
+            code = text[index + 1]
+            if code == "u":
+                hex_digits = text[index + 2:index + 6]
+                if len(hex_digits) < 4:
+                    break
+                try:
+                    out.append(chr(int(hex_digits, 16)))
+                except ValueError:
+                    pass
+                index += 6
+                continue
+            out.append(_ESCAPES.get(code, code))
+            index += 2
+        return "".join(out), False
@@ -0,0 +1,24 @@
+class MagangHubApi:
+    """
+    Centralized configuration for the MagangHub monev backend endpoints used by
+    the browserless driver. Mirrors MagangHubSelectors: if the portal API
+    changes, only this file needs updates.
+
+    UNVERIFIED: the paths below, the login body (username/password) and the
+    report payload keys built in MaganghubHttpDriver.fill_report (slot_id, date,
+    attendance, activity, learning, obstacles, confirmed) are assumptions that
+    have only been exercised against benchmarks/stubs/maganghub_stub.py, not
+    the real portal. That is why MAGANGHUB_SUBMIT_MODE defaults to "browser";
+    confirm them against the portal's network traffic before relying on "http".
+    """
+    BASE_URL = "https://monev.maganghub.kemnaker.go.id"
+
+    LOGIN = "/api/auth/login"
+    DAILY_REPORT_SLOT = "/api/daily-reports/slot"
+    DAILY_REPORT_SUBMIT = "/api/daily-reports"
+
+    # Payload values
+    ATTENDANCE_PRESENT = "Hadir"
+
+    # Response keys that may carry the bearer token, in lookup order.
+    TOKEN_KEYS = ("access_token", "token", "accessToken")
@@ -0,0 +1,328 @@
+import os
+import threading
+import time
+from typing import List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+from src.infrastructure.monitoring.metrics import log_event
+from .selectors import MagangHubSelectors
+
+
+def _log(code: str, message: str):
+    log_event(code, message)
+
+
+def default_use_uc() -> bool:
+    """
+    UC mode can be unstable on some CI runners. Default to non-UC on GitHub Actions,
+    but allow override via env AUTOABSEN_USE_UC=true/false.
+    """
+    env_uc = os.getenv("AUTOABSEN_USE_UC")
+    if env_uc is None:
+        return os.getenv("GITHUB_ACTIONS", "false").lower() != "true"
+    return env_uc.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def launch_sb_session(use_uc: bool, headless: bool) -> Tuple[object, object, bool]:
+    """
+    Start a SeleniumBase session, retrying once without UC mode on failure.
+    Returns (context, sb, effective_use_uc); raises when both attempts fail.
+    """
+    # Imported on first launch so entry points that never open a browser skip selenium.
+    from seleniumbase import SB
+
+    try:
+        context = SB(uc=use_uc, headless=headless, test=True)
+        sb = context.__enter__()
+        _log("MH-DRIVER-START-OK", f"Browser session started (uc={use_uc}, headless={headless})")
+        return context, sb, use_uc
+    except Exception as e:
+        _log("MH-DRIVER-START-ERR", f"Failed to start browser session (uc={use_uc}): {e}")
+        if not use_uc:
+            raise
+
+    # Fallback once with non-UC mode for CI stability
+    try:
+        context = SB(uc=False, headless=headless, test=True)
+        sb = context.__enter__()
+        _log("MH-DRIVER-START-FALLBACK-OK", "Browser session recovered with fallback (uc=False)")
+        return context, sb, False
+    except Exception as fallback_error:
+        _log("MH-DRIVER-START-FALLBACK-ERR", f"Fallback browser session also failed: {fallback_error}")
+        raise
+
+
+def _process_tree_rss_mb(root_pid: Optional[int]) -> Optional[float]:
+    """Sum RSS of a process and all its descendants (Linux /proc only)."""
+    if not root_pid or not os.path.isdir("/proc"):
+        return None
+
+    children = {}
+    rss_pages = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as f:
+                stat = f.read()
+            # Fields after the "(comm)" part: state ppid ... ; rss is field 24.
+            fields = stat[stat.rfind(")") + 2:].split()
+            pid = int(entry)
+            children.setdefault(int(fields[1]), []).append(pid)
+            rss_pages[pid] = int(fields[21])
+        except (OSError, ValueError, IndexError):
+            continue
+
+    if root_pid not in rss_pages:
+        return None
+
+    total_pages = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        total_pages += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class PooledBrowser:
+    """A warm SeleniumBase session owned by a BrowserPool."""
+
+    def __init__(self, context, sb, use_uc: bool):
+        self.context = context
+        self.sb = sb
+        self.use_uc = use_uc
+        self.created_at = time.time()
+        self.last_used_at = self.created_at
+        self.uses = 0
+
+    def driver_pid(self) -> Optional[int]:
+        try:
+            return self.sb.driver.service.process.pid
+        except Exception:
+            return None
+
+    def rss_mb(self) -> Optional[float]:
+        return _process_tree_rss_mb(self.driver_pid())
+
+
+class BrowserPool:
+    """
+    Thread-safe pool of warm browser sessions shared by all drivers of a process.
+    Follows SRP: owns browser lifecycle (launch, health check, recycle, reset);
+    drivers only borrow sessions via checkout()/checkin().
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        use_uc: bool = False,
+        min_size: int = 0,
+        max_size: int = 1,
+        max_uses: int = 20,
+        max_rss_mb: int = 1500,
+        checkout_timeout: float = 300,
+        storage_origins: Sequence[str] = (MagangHubSelectors.BASE_URL,),
+    ):
+        self.headless = headless
+        self.use_uc = use_uc
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.max_uses = max_uses
+        self.max_rss_mb = max_rss_mb
+        self.checkout_timeout = checkout_timeout
+        # Origins whose storage is wiped between borrowers (the portal, or its local stub).
+        self.storage_origins = tuple(origin.rstrip("/") for origin in storage_origins if origin)
+
+        self._idle: List[PooledBrowser] = []
+        self._leased: List[PooledBrowser] = []
+        self._launching = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        with self._cond:
+            return len(self._idle) + len(self._leased) + self._launching
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "idle": len(self._idle),
+                "leased": len(self._leased),
+                "launching": self._launching,
+                "max_size": self.max_size,
+            }
+
+    def total_rss_mb(self) -> Optional[float]:
+        """Combined RSS of every browser the pool owns (idle and leased)."""
+        with self._cond:
+            browsers = self._idle + self._leased
+        readings = [rss for rss in (browser.rss_mb() for browser in browsers) if rss is not None]
+        return sum(readings) if readings else None
+
+    def _launch(self) -> Optional[PooledBrowser]:
+        try:
+            context, sb, effective_uc = launch_sb_session(self.use_uc, self.headless)
+        except Exception:
+            return None
+        # Remember the working mode so later launches skip the failing UC attempt.
+        self.use_uc = effective_uc
+        return PooledBrowser(context, sb, effective_uc)
+
+    def warm_up(self):
+        """Launch browsers until min_size sessions exist."""
+        while True:
+            with self._cond:
+                if self._closed or len(self._idle) + len(self._leased) + self._launching >= self.min_size:
+                    return
+                self._launching += 1
+
+            browser = self._launch()
+            with self._cond:
+                self._launching -= 1
+                if browser is not None and not self._closed:
+                    self._idle.append(browser)
+                    self._cond.notify()
+                    _log("MH-POOL-WARM", f"Warm browser ready (pool={self.stats()})")
+                    continue
+            if browser is not None:
+                self._destroy(browser)
+            return
+
+    def _is_healthy(self, browser: PooledBrowser) -> bool:
+        try:
+            browser.sb.driver.execute_script("return 1;")
+        except Exception:
+            return False
+        return True
+
+    def _needs_recycle(self, browser: PooledBrowser) -> Optional[str]:
+        if self.max_uses and browser.uses >= self.max_uses:
+            return f"uses={browser.uses}"
+        rss = browser.rss_mb()
+        if self.max_rss_mb and rss is not None and rss > self.max_rss_mb:
+            return f"rss={rss:.0f}MB"
+        return None
+
+    def _origins_to_clear(self, driver) -> List[str]:
+        origins = list(self.storage_origins)
+        parsed = urlparse(driver.current_url or "")
+        if parsed.scheme in ("http", "https"):
+            current = f"{parsed.scheme}://{parsed.netloc}"
+            if current not in origins:
+                origins.append(current)
+        return origins
+
+    def _reset(self, browser: PooledBrowser) -> bool:
+        """
+        Wipe cookies and per-origin storage so the next borrower starts from a clean
+        profile. Storage is cleared through CDP for each portal origin explicitly:
+        page-level localStorage.clear() misses it whenever the tab sits on about:blank
+        or an error page. Any failure recycles the browser instead of leaking state.
+        """
+        try:
+            driver = browser.sb.driver
+            # HTTP cache is kept on purpose: warm static assets are part of the win.
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in self._origins_to_clear(driver):
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            _log("MH-POOL-RESET-ERR", f"Could not clear browser state: {e}")
+            return False
+
+    def _destroy(self, browser: PooledBrowser):
+        try:
+            browser.context.__exit__(None, None, None)
+        except Exception:
+            pass
+
+    def checkout(self, timeout: Optional[float] = None) -> Optional[PooledBrowser]:
+        """
+        Borrow a healthy browser. Reuses an idle one when available, launches a new
+        one while below max_size, otherwise waits for a checkin until timeout.
+        """
+        deadline = time.time() + (self.checkout_timeout if timeout is None else timeout)
+        while True:
+            browser = None
+            launch = False
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return None
+                    if self._idle:
+                        browser = self._idle.pop()
+                        break
+                    if len(self._leased) + self._launching < self.max_size:
+                        self._launching += 1
+                        launch = True
+                        break
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        _log("MH-POOL-CHECKOUT-TIMEOUT", f"No browser available (pool={self.stats()})")
+                        return None
+                    self._cond.wait(remaining)
+
+            if launch:
+                browser = self._launch()
+                with self._cond:
+                    self._launching -= 1
+                    if browser is None:
+                        self._cond.notify()
+                        return None
+                    self._leased.append(browser)
+                browser.uses += 1
+                _log("MH-POOL-CHECKOUT", f"Launched new browser (pool={self.stats()})")
+                return browser
+
+            if not self._is_healthy(browser):
+                _log("MH-POOL-RECYCLE", "Discarding unhealthy idle browser")
+                self._destroy(browser)
+                with self._cond:
+                    self._cond.notify()
+                continue
+
+            with self._cond:
+                self._leased.append(browser)
+            browser.uses += 1
+            browser.last_used_at = time.time()
+            _log("MH-POOL-CHECKOUT", f"Reusing warm browser (uses={browser.uses}, pool={self.stats()})")
+            return browser
+
+    def checkin(self, browser: PooledBrowser, healthy: bool = True):
+        """Return a borrowed browser; it is reset for reuse or recycled."""
+        reason = None
+        if not healthy:
+            reason = "marked unhealthy"
+        else:
+            reason = self._needs_recycle(browser)
+        if reason is None and not self._reset(browser):
+            reason = "reset failed"
+
+        with self._cond:
+            if browser in self._leased:
+                self._leased.remove(browser)
+            keep = reason is None and not self._closed
+            if keep:
+                browser.last_used_at = time.time()
+                self._idle.append(browser)
+            self._cond.notify()
+
+        if not keep:
+            _log("MH-POOL-RECYCLE", f"Closing browser ({reason or 'pool closed'})")
+            self._destroy(browser)
+            if not self._closed and self.min_size:
+                threading.Thread(target=self.warm_up, daemon=True).start()
+
+    def close_all(self):
+        with self._cond:
+            self._closed = True
+            browsers = self._idle + self._leased
+            self._idle = []
+            self._leased = []
+            self._cond.notify_all()
+        for browser in browsers:
+            self._destroy(browser)
+        _log("MH-POOL-CLOSED", f"Browser pool closed ({len(browsers)} session(s))")
@@ -0,0 +1,159 @@
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from .dom_waits import JS_HELPERS
+from .element_query import ElementQuery
+
+_SNAPSHOT_SCRIPT = JS_HELPERS + """
+const submitQuery = arguments[0];
+const collapse = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+const dialogs = mh.visibleDialogs();
+const reportDialogs = dialogs.filter(mh.isReportDialog);
+const dialog = mh.reportDialog();
+
+const allTextareas = document.querySelectorAll('textarea');
+const textareas = mh.reportTextareas();
+
+const checkbox = mh.confirmCheckbox(dialog);
+
+let attendanceValue = '';
+const blocks = Array.from(dialog.querySelectorAll('.v-input, .v-select, [role="combobox"], .v-field, label, .v-label'));
+const attendanceBlock = blocks.find((el) => mh.normalize(el.textContent).includes('kehadiran'));
+if (attendanceBlock) {
+    const root = attendanceBlock.closest('.v-input') || attendanceBlock.parentElement || attendanceBlock;
+    const select = root.querySelector('select');
+    const typed = root.querySelector('input');
+    const display = root.querySelector('.v-select__selection-text, .v-select__selection, .v-field__input') || typed || root;
+    if (select && select.selectedIndex >= 0 && select.options[select.selectedIndex]) {
+        attendanceValue = collapse(select.options[select.selectedIndex].textContent);
+    } else {
+        attendanceValue = collapse(typed && typed.value ? typed.value : display.textContent);
+    }
+}
+
+const errors = [];
+['.v-messages__message', '.error--text', '.text-danger', '.invalid-feedback', '.v-alert__content', '[role="alert"]']
+    .forEach((selector) => {
+        dialog.querySelectorAll(selector).forEach((node) => {
+            const text = collapse(node.textContent);
+            if (text) errors.push(text);
+        });
+    });
+const invalidHints = [];
+dialog.querySelectorAll('.v-input--error, [aria-invalid="true"]').forEach((node) => {
+    const text = collapse(node.textContent);
+    if (text) invalidHints.push(text);
+    const label =
+        node.getAttribute('aria-label') ||
+        (node.closest('.v-input')?.querySelector('label, .v-label')?.textContent || '');
+    if (label) invalidHints.push(`invalid: ${collapse(label)}`);
+});
+
+return {
+    open: reportDialogs.length > 0,
+    visibleDialogs: dialogs.length,
+    textareaLengths: textareas.map((el) => (el.value || '').trim().length),
+    textareaTotal: allTextareas.length,
+    checkboxFound: !!checkbox.input,
+    checkboxChecked: !!(checkbox.input && checkbox.input.checked),
+    checkboxSource: checkbox.source,
+    attendanceValue,
+    submitButtons: mh.scan(submitQuery, false).diagnostics,
+    errors: Array.from(new Set(errors)).slice(0, 5),
+    invalidHints: Array.from(new Set(invalidHints)).slice(0, 6),
+};
+"""
+
+
+@dataclass
+class DialogSnapshot:
+    """Everything the submit flow needs to know about the report dialog, read in one round trip."""
+
+    open: bool = False
+    visible_dialogs: int = 0
+    textarea_lengths: List[int] = field(default_factory=list)
+    textarea_total: int = 0
+    checkbox_found: bool = False
+    checkbox_checked: bool = False
+    checkbox_source: str = ""
+    attendance_value: str = ""
+    submit_buttons: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+    invalid_hints: List[str] = field(default_factory=list)
+    source: str = "dialog-snapshot"
+    taken_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "DialogSnapshot":
+        return cls(
+            open=bool(payload.get("open")),
+            visible_dialogs=int(payload.get("visibleDialogs") or 0),
+            textarea_lengths=[int(length) for length in payload.get("textareaLengths") or []],
+            textarea_total=int(payload.get("textareaTotal") or 0),
+            checkbox_found=bool(payload.get("checkboxFound")),
+            checkbox_checked=bool(payload.get("checkboxChecked")),
+            checkbox_source=payload.get("checkboxSource") or "",
+            attendance_value=payload.get("attendanceValue") or "",
+            submit_buttons=list(payload.get("submitButtons") or []),
+            errors=list(payload.get("errors") or []),
+            invalid_hints=list(payload.get("invalidHints") or []),
+        )
+
+    @classmethod
+    def unavailable(cls, source: str) -> "DialogSnapshot":
+        return cls(source=source)
+
+    @property
+    def attendance_hadir(self) -> bool:
+        return "hadir" in self.attendance_value.lower()
+
+    @property
+    def submit_enabled(self) -> bool:
+        return any(not button.get("disabled") for button in self.submit_buttons)
+
+    @property
+    def submit_locked(self) -> bool:
+        return bool(self.submit_buttons) and not self.submit_enabled
+
+    def feedback(self) -> Dict[str, Any]:
+        """Compact view for MH-SUBMIT-* diagnostics."""
+        return {
+            "errors": self.errors,
+            "invalidHints": self.invalid_hints,
+            "submitButtons": self.submit_buttons,
+            "checkboxChecked": self.checkbox_checked if self.checkbox_found else None,
+            "attendanceValue": self.attendance_value,
+            "source": self.source,
+        }
+
+
+class DialogProbe:
+    """
+    Reads DialogSnapshot with one execute_script call. A snapshot younger than
+    max_age_seconds is reused; callers invalidate() after anything that mutates the page.
+    """
+
+    def __init__(self, driver, submit_query: ElementQuery, max_age_seconds: float = 0.3):
+        self.driver = driver
+        self.submit_query = submit_query
+        self.max_age_seconds = max_age_seconds
+        self._cached: Optional[DialogSnapshot] = None
+
+    def snapshot(self, fresh: bool = False) -> DialogSnapshot:
+        cached = self._cached
+        if not fresh and cached is not None and time.monotonic() - cached.taken_at < self.max_age_seconds:
+            return cached
+        try:
+            payload = self.driver.execute_script(_SNAPSHOT_SCRIPT, self.submit_query.to_args())
+        except Exception:
+            self._cached = None
+            return DialogSnapshot.unavailable("js-exception")
+        if not isinstance(payload, dict):
+            self._cached = None
+            return DialogSnapshot.unavailable("invalid-response")
+        self._cached = DialogSnapshot.from_payload(payload)
+        return self._cached
+
+    def invalidate(self):
+        self._cached = None
@@ -0,0 +1,250 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# Helpers shared by every in-page script, exposed as `mh` to condition bodies.
+JS_HELPERS = """
+const mh = (() => {
+    const DIALOGS = '.v-dialog--active, .v-overlay--active, [role="dialog"]';
+    const normalize = (text) => (text || '').toLowerCase().replace(/\\s+/g, ' ').trim();
+    const isVisible = (el) => {
+        if (!el) return false;
+        const rect = el.getBoundingClientRect();
+        const style = window.getComputedStyle(el);
+        return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+    };
+    const visibleDialogs = () => Array.from(document.querySelectorAll(DIALOGS)).filter(isVisible);
+    const isReportDialog = (el) => {
+        const text = normalize(el.textContent);
+        return (
+            !!el.querySelector('textarea') ||
+            text.includes('tambah laporan harian') ||
+            text.includes('uraian aktivitas') ||
+            text.includes('simpan dan kirim')
+        );
+    };
+    const reportDialogOpen = () => visibleDialogs().some(isReportDialog);
+    // The report dialog when open, else the first visible dialog, else the whole document.
+    const reportDialog = () => {
+        const visible = visibleDialogs();
+        return visible.find(isReportDialog) || visible[0] || document;
+    };
+    const reportTextareas = () =>
+        Array.from(document.querySelectorAll('textarea')).filter(
+            (el) => isVisible(el) && !!el.closest('.v-overlay--active, .v-dialog--active, [role="dialog"]')
+        );
+    // Walks `query.selector` inside the query scope and keeps nodes whose text or class matches;
+    // diagnostics describe every candidate seen. See ElementQuery for the fields.
+    const scan = (query, firstOnly) => {
+        const scope = query.scope === 'document' ? document : reportDialog();
+        const nodes = Array.from(scope.querySelectorAll(query.selector || '*'));
+        const textAny = query.textAny || [];
+        const classAny = query.classAny || [];
+        const matches = [];
+        const diagnostics = [];
+        for (const node of nodes) {
+            const text = normalize(node.textContent);
+            const className = (node.getAttribute('class') || '').toLowerCase();
+            const filtered = textAny.length || classAny.length;
+            if (filtered && !textAny.some((t) => text.includes(t)) && !classAny.some((c) => className.includes(c))) continue;
+            const disabled =
+                node.hasAttribute('disabled') || node.getAttribute('aria-disabled') === 'true' || className.includes('--disabled');
+            const visible = isVisible(node);
+            if (diagnostics.length < (query.maxDiagnostics || 10)) {
+                diagnostics.push({text: text.slice(0, 60), disabled, visible, class: className.slice(0, 120)});
+            }
+            if ((query.enabled && disabled) || (query.visible && !visible)) continue;
+            matches.push(node);
+            if (firstOnly) break;
+        }
+        return {matches, diagnostics, scanned: nodes.length};
+    };
+    const findFirst = (query) => {
+        const result = scan(query, true);
+        return {element: result.matches[0] || null, diagnostics: result.diagnostics, scanned: result.scanned};
+    };
+    const confirmCheckbox = (scope) => {
+        const dialog = scope || reportDialog();
+        const keywords = ['meninjau', 'isian laporan ini sudah benar', 'laporan ini sudah benar'];
+        const label = Array.from(dialog.querySelectorAll('label'))
+            .find((el) => keywords.some((key) => normalize(el.textContent).includes(key))) || null;
+        if (label) {
+            const forId = label.getAttribute('for') || '';
+            if (forId) {
+                let byId = null;
+                try {
+                    const escaped = (window.CSS && CSS.escape) ? CSS.escape(forId) : forId;
+                    byId = dialog.querySelector(`#${escaped}`);
+                } catch (e) {}
+                if (!byId) {
+                    const byDoc = document.getElementById(forId);
+                    if (byDoc && dialog.contains(byDoc)) byId = byDoc;
+                }
+                if (byId && byId.type === 'checkbox') return {input: byId, label, source: 'label-for'};
+            }
+            const nested = (label.parentElement || dialog).querySelector('input[type="checkbox"]');
+            if (nested) return {input: nested, label, source: 'label-parent'};
+        }
+        const checkboxes = Array.from(dialog.querySelectorAll('input[type="checkbox"]'));
+        if (checkboxes.length === 1) return {input: checkboxes[0], label, source: 'single-fallback'};
+        return {input: null, label, source: 'not-found'};
+    };
+    return {
+        normalize, isVisible, visibleDialogs, isReportDialog, reportDialogOpen, reportDialog,
+        reportTextareas, scan, findFirst, confirmCheckbox,
+    };
+})();
+"""
+
+_WAIT_SCRIPT = JS_HELPERS + """
+const conditionBody = arguments[0];
+const timeoutMs = arguments[1];
+const args = arguments[2] || {};
+const done = arguments[arguments.length - 1];
+const check = new Function('args', 'mh', conditionBody);
+const started = performance.now();
+
+let finished = false;
+let scheduled = false;
+const cleanups = [];
+const finish = (value, timedOut) => {
+    if (finished) return;
+    finished = true;
+    cleanups.forEach((fn) => { try { fn(); } catch (e) {} });
+    done({value: value === undefined ? null : value, timedOut, elapsedMs: Math.round(performance.now() - started)});
+};
+const evaluate = () => {
+    scheduled = false;
+    if (finished) return;
+    try {
+        const value = check(args, mh);
+        if (value) finish(value, false);
+    } catch (e) {}
+};
+const schedule = () => {
+    if (scheduled || finished) return;
+    scheduled = true;
+    Promise.resolve().then(evaluate);
+};
+
+const observer = new MutationObserver(schedule);
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+cleanups.push(() => observer.disconnect());
+
+// SPA route changes and CSS transitions do not always mutate the DOM.
+['popstate', 'hashchange', 'transitionend', 'animationend'].forEach((name) => {
+    window.addEventListener(name, schedule, true);
+    cleanups.push(() => window.removeEventListener(name, schedule, true));
+});
+const safetyPoll = setInterval(schedule, 250);
+cleanups.push(() => clearInterval(safetyPoll));
+const timer = setTimeout(() => finish(null, true), timeoutMs);
+cleanups.push(() => clearTimeout(timer));
+
+evaluate();
+"""
+
+
+# chromedriver wording for a wait killed by the page navigating or re-rendering under it.
+_NAVIGATION_ERROR_MARKERS = (
+    "document unloaded",
+    "cannot find context",
+    "execution context was destroyed",
+    "inspected target navigated",
+)
+
+
+def _is_navigation_error(error: Exception) -> bool:
+    """Whether a failed wait can be re-armed; a dead session or crashed tab cannot."""
+    # Imported on failure only: this module is loaded before any browser exists.
+    from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
+
+    if isinstance(error, StaleElementReferenceException):
+        return True
+    if not isinstance(error, WebDriverException):
+        return False
+    message = (error.msg or str(error)).lower()
+    return any(marker in message for marker in _NAVIGATION_ERROR_MARKERS)
+
+
+@dataclass
+class WaitResult:
+    ok: bool
+    value: Any = None
+    elapsed_seconds: float = 0.0
+
+
+class DomWaiter:
+    """
+    In-page wait engine: a condition (JS function body returning a truthy value)
+    is re-evaluated by a MutationObserver inside the page and resolves the moment
+    it holds, via one execute_async_script call per wait. A full page navigation
+    kills the script; the wait is then re-armed with whatever time remains.
+    Any other WebDriver error (e.g. an invalid session) is raised immediately,
+    and the driver's script timeout is restored when the wait returns.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def _script_timeout(self) -> Optional[float]:
+        try:
+            return self.driver.timeouts.script
+        except Exception:
+            return None
+
+    def wait_until(self, condition_body: str, timeout: float, args: Optional[dict] = None) -> WaitResult:
+        started = time.monotonic()
+        deadline = started + timeout
+        previous_timeout = self._script_timeout()
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return WaitResult(ok=False, elapsed_seconds=time.monotonic() - started)
+                try:
+                    self.driver.set_script_timeout(remaining + 5)
+                    result = self.driver.execute_async_script(
+                        _WAIT_SCRIPT, condition_body, int(remaining * 1000), args or {}
+                    )
+                except Exception as e:
+                    if not _is_navigation_error(e):
+                        raise
+                    time.sleep(0.1)
+                    continue
+
+                if isinstance(result, dict) and not result.get("timedOut"):
+                    return WaitResult(ok=True, value=result.get("value"), elapsed_seconds=time.monotonic() - started)
+                return WaitResult(ok=False, elapsed_seconds=time.monotonic() - started)
+        finally:
+            if previous_timeout is not None:
+                try:
+                    self.driver.set_script_timeout(previous_timeout)
+                except Exception:
+                    pass
+
+
+class Conditions:
+    """Reusable condition bodies for DomWaiter.wait_until (`args` and the `mh` helpers are in scope)."""
+
+    LOGIN_OUTCOME = """
+    const url = (location.href || '').toLowerCase();
+    if (!url.includes('/login') && url.includes(args.host)) return {kind: 'redirect', url};
+    const marker = Array.from(document.querySelectorAll(args.markers)).find(mh.isVisible);
+    if (marker) return {kind: 'marker', url};
+    const error = Array.from(document.querySelectorAll(args.errorSelector)).find(
+        (el) => mh.isVisible(el) && (el.textContent || '').trim()
+    );
+    if (error) return {kind: 'error', text: error.textContent.trim().slice(0, 200), url};
+    return null;
+    """
+
+    REPORT_DIALOG_CLOSED = """
+    return mh.reportDialogOpen() ? null : {closed: true};
+    """
+
+    # args: ElementQuery.to_args(); resolves with {element, diagnostics, scanned}.
+    FIRST_MATCH = """
+    const found = mh.findFirst(args);
+    return found.element ? found : null;
+    """
@@ -0,0 +1,66 @@
+from typing import Optional
+
+from src.core.interfaces import IAutomationDriver
+from src.infrastructure.monitoring.metrics import log_event
+from .api_endpoints import MagangHubApi
+from .browser_pool import BrowserPool
+from .fallback_driver import FallbackAutomationDriver
+from .resource_blocking import MAGANGHUB_PROFILE, BlockingProfile, NetworkBaseline, parse_pattern_list
+from .seleniumbase_driver import SeleniumBaseDriver
+from .session_cache import SessionCache
+
+
+def build_session_cache(settings) -> Optional[SessionCache]:
+    """Build once per process and pass to build_automation_driver: key derivation is deliberately slow."""
+    if not settings.session_cache_secret:
+        return None
+    return SessionCache(
+        cache_dir=settings.session_cache_dir,
+        secret=settings.session_cache_secret,
+        ttl_seconds=settings.session_cache_ttl_minutes * 60,
+    )
+
+
+def build_blocking_profile(settings) -> Optional[BlockingProfile]:
+    if not settings.resource_blocking:
+        return None
+    return MAGANGHUB_PROFILE.with_overrides(
+        extra_deny=parse_pattern_list(settings.maganghub_block_deny),
+        extra_allow=parse_pattern_list(settings.maganghub_block_allow),
+    )
+
+
+def build_network_baseline(settings) -> Optional[NetworkBaseline]:
+    if not settings.network_baseline_path:
+        return None
+    return NetworkBaseline(settings.network_baseline_path)
+
+
+def build_automation_driver(
+    settings,
+    headless: bool,
+    pool: Optional[BrowserPool] = None,
+    session_cache: Optional[SessionCache] = None,
+) -> IAutomationDriver:
+    """
+    Composition helper shared by the entry points.
+    MAGANGHUB_SUBMIT_MODE=http submits through the backend API and keeps
+    SeleniumBase as the automatic fallback; "browser" (the default) uses
+    SeleniumBase only. The API contract behind "http" is unverified, see MagangHubApi.
+    """
+    browser_driver = SeleniumBaseDriver(
+        headless=headless,
+        pool=pool,
+        session_cache=session_cache,
+        blocking=build_blocking_profile(settings),
+        network_baseline=build_network_baseline(settings),
+        base_url=settings.maganghub_web_base_url,
+    )
+    if settings.maganghub_submit_mode.strip().lower() != "http":
+        return browser_driver
+
+    from .maganghub_http_driver import MaganghubHttpDriver  # requests is only needed in http mode
+
+    log_event("MH-HTTP-UNVERIFIED", "MAGANGHUB_SUBMIT_MODE=http uses assumed API paths/payload keys (see api_endpoints.py)")
+    http_driver = MaganghubHttpDriver(base_url=settings.maganghub_api_base_url or MagangHubApi.BASE_URL)
+    return FallbackAutomationDriver(primary=http_driver, fallback=browser_driver)
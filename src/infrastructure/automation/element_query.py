@@ -0,0 +1,68 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .dom_waits import JS_HELPERS
+
+_FIND_FIRST_SCRIPT = JS_HELPERS + """
+return mh.findFirst(arguments[0]);
+"""
+
+
+@dataclass(frozen=True)
+class ElementQuery:
+    """
+    Declarative element lookup evaluated inside the page (mh.findFirst), so
+    filtering costs one WebDriver call instead of several per element.
+
+    A node is a candidate when its text contains any of `text_any` or its class
+    contains any of `class_any` (no filters: every node under `selector`).
+    `enabled` / `visible` then decide which candidate is returned.
+    """
+
+    selector: str
+    text_any: Tuple[str, ...] = ()
+    class_any: Tuple[str, ...] = ()
+    enabled: bool = False
+    visible: bool = False
+    scope: str = "dialog"  # "dialog" (report dialog, else document) or "document"
+    max_diagnostics: int = 10
+
+    def to_args(self) -> Dict[str, Any]:
+        return {
+            "selector": self.selector,
+            "textAny": [text.lower() for text in self.text_any],
+            "classAny": [name.lower() for name in self.class_any],
+            "enabled": self.enabled,
+            "visible": self.visible,
+            "scope": self.scope,
+            "maxDiagnostics": self.max_diagnostics,
+        }
+
+
+@dataclass
+class ElementMatch:
+    element: Any = None
+    diagnostics: List[Dict[str, Any]] = field(default_factory=list)
+    scanned: int = 0
+
+    @classmethod
+    def from_payload(cls, payload: Optional[Dict[str, Any]]) -> "ElementMatch":
+        if not isinstance(payload, dict):
+            return cls()
+        return cls(
+            element=payload.get("element"),
+            diagnostics=list(payload.get("diagnostics") or []),
+            scanned=int(payload.get("scanned") or 0),
+        )
+
+    @property
+    def found(self) -> bool:
+        return self.element is not None
+
+
+def find_first(driver, query: ElementQuery) -> ElementMatch:
+    """One round trip: the first element matching `query` plus per-candidate diagnostics."""
+    try:
+        return ElementMatch.from_payload(driver.execute_script(_FIND_FIRST_SCRIPT, query.to_args()))
+    except Exception:
+        return ElementMatch()
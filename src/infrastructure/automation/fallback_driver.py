@@ -0,0 +1,114 @@
+from typing import Optional
+
+from src.core.interfaces import IAutomationDriver
+from src.core.entities import Report
+from src.infrastructure.monitoring.metrics import log_event
+
+
+class FlowOutcome:
+    """
+    Where a primary driver's flow stands, exposed as its `outcome` attribute.
+    Only NOT_SUBMITTED lets the fallback run: every other failure either cannot
+    be fixed by a browser or may already have recorded the report.
+    """
+    NOT_SUBMITTED = "not_submitted"          # nothing was sent yet (or it never reached the server)
+    SUBMITTED = "submitted"
+    ALREADY_SUBMITTED = "already_submitted"  # today's report already exists: success, no-op
+    AUTH_REJECTED = "auth_rejected"          # credentials refused: a browser login would fail too
+    SUBMIT_REJECTED = "submit_rejected"      # the server answered and refused the report
+    SUBMIT_AMBIGUOUS = "submit_ambiguous"    # the POST may have been recorded: never replay
+
+
+class FallbackAutomationDriver(IAutomationDriver):
+    """
+    Composite IAutomationDriver: runs a fast primary driver (e.g. HTTP) and
+    switches to a fallback driver (e.g. SeleniumBase) when a step fails before
+    anything was submitted (primary.outcome == FlowOutcome.NOT_SUBMITTED).
+    When switching mid-flow, the steps already completed are replayed on the
+    fallback so callers can keep using the step-by-step interface.
+    """
+
+    def __init__(self, primary: IAutomationDriver, fallback: IAutomationDriver):
+        self.primary = primary
+        self.fallback = fallback
+        self._active = primary
+        self._email: Optional[str] = None
+        self._password: Optional[str] = None
+        self._report: Optional[Report] = None
+
+    def _log(self, code: str, message: str):
+        log_event(code, message)
+
+    def _may_fall_back(self, stage: str) -> bool:
+        outcome = self.primary.outcome
+        if outcome == FlowOutcome.NOT_SUBMITTED:
+            return True
+        self._log("MH-FALLBACK-SKIP", f"Primary driver stopped at '{stage}' ({outcome}); not retrying in the browser")
+        return False
+
+    def _switch_to_fallback(self, stage: str) -> bool:
+        if self._active is self.fallback or not self._may_fall_back(stage):
+            return False
+        self._log("MH-FALLBACK", f"Primary driver failed at '{stage}', switching to {type(self.fallback).__name__}")
+        try:
+            self.primary.close()
+        except Exception:
+            pass
+        self._active = self.fallback
+
+        if stage == "login":
+            return True
+        if not self.fallback.login(self._email, self._password):
+            return False
+        if stage == "navigate":
+            return True
+        if not self.fallback.navigate_to_report_page():
+            return False
+        if stage == "fill":
+            return True
+        return self.fallback.fill_report(self._report)
+
+    def execute_full_flow(self, email: str, password: str, report: Report) -> bool:
+        try:
+            if self.primary.execute_full_flow(email, password, report):
+                return True
+        except Exception as e:
+            self._log("MH-FALLBACK", f"Primary driver raised: {e}")
+        if not self._may_fall_back("flow"):
+            return False
+        self._log("MH-FALLBACK", f"Primary flow failed, retrying with {type(self.fallback).__name__}")
+        return self.fallback.execute_full_flow(email, password, report)
+
+    def login(self, email: str, password: str) -> bool:
+        self._email, self._password = email, password
+        if self._active.login(email, password):
+            return True
+        return self._switch_to_fallback("login") and self._active.login(email, password)
+
+    def navigate_to_report_page(self) -> bool:
+        if self._active.navigate_to_report_page():
+            return True
+        return self._switch_to_fallback("navigate") and self._active.navigate_to_report_page()
+
+    def fill_report(self, report: Report) -> bool:
+        self._report = report
+        if self._active.fill_report(report):
+            return True
+        return self._switch_to_fallback("fill") and self._active.fill_report(report)
+
+    def submit_report(self) -> bool:
+        if self._active.submit_report():
+            return True
+        return self._switch_to_fallback("submit") and self._active.submit_report()
+
+    def submission_ready(self) -> bool:
+        return self._active.submission_ready()
+
+    def close(self):
+        try:
+            self.primary.close()
+        finally:
+            self.fallback.close()
+            self._active = self.primary
+            self._email = self._password = None
+            self._report = None
@@ -0,0 +1,151 @@
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from .dom_waits import JS_HELPERS
+
+# Writes every field through the native value setter (bypassing the Vue-patched
+# property), fires input/change/blur so v-model and validation run, and returns
+# the resulting lengths in the same call.
+_NATIVE_FILL_SCRIPT = JS_HELPERS + """
+const values = arguments[0];
+const areas = mh.reportTextareas();
+if (areas.length < values.length) return {count: areas.length, lengths: areas.map((el) => (el.value || '').trim().length)};
+
+const setValue = Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value').set;
+values.forEach((value, index) => {
+    const area = areas[index];
+    area.focus();
+    setValue.call(area, value);
+    area.dispatchEvent(new Event('input', { bubbles: true }));
+    area.dispatchEvent(new Event('change', { bubbles: true }));
+    area.blur();
+    area.dispatchEvent(new Event('blur', { bubbles: true }));
+});
+return {count: areas.length, lengths: mh.reportTextareas().map((el) => (el.value || '').trim().length)};
+"""
+
+_FOCUS_SCRIPT = JS_HELPERS + """
+const area = mh.reportTextareas()[arguments[0]];
+if (!area) return false;
+area.scrollIntoView({block: 'center'});
+area.focus();
+area.select();
+return true;
+"""
+
+_VERIFY_SCRIPT = JS_HELPERS + """
+const areas = mh.reportTextareas();
+areas.forEach((el) => {
+    try {
+        el.blur();
+        el.dispatchEvent(new Event('blur', { bubbles: true }));
+    } catch (e) {}
+});
+return {count: areas.length, lengths: areas.map((el) => (el.value || '').trim().length)};
+"""
+
+_TEXTAREAS_SCRIPT = JS_HELPERS + """
+return mh.reportTextareas();
+"""
+
+
+@dataclass
+class FillResult:
+    strategy: str
+    lengths: List[int] = field(default_factory=list)
+    ok: bool = False
+    tried: List[str] = field(default_factory=list)
+
+
+class FormFillEngine:
+    """
+    Fills all report textareas at once and verifies lengths in the same pass.
+    Strategies, cheapest first:
+      - native_setter: one execute_script for every field (value setter + Vue events)
+      - cdp_insert_text: CDP Input.insertText per field (trusted input events)
+      - send_keys: WebDriver typing, last resort
+    The strategy that last succeeded is tried first by every engine in the process.
+    """
+
+    STRATEGIES = ("native_setter", "cdp_insert_text", "send_keys")
+
+    _preferred: Optional[str] = None
+    _preferred_lock = threading.Lock()
+
+    def __init__(self, driver, min_length: int = 100, log: Optional[Callable[[str, str], None]] = None):
+        self.driver = driver
+        self.min_length = min_length
+        self._log = log or (lambda code, message: None)
+
+    @classmethod
+    def preferred_strategy(cls) -> Optional[str]:
+        return cls._preferred
+
+    @classmethod
+    def _remember(cls, strategy: str):
+        with cls._preferred_lock:
+            cls._preferred = strategy
+
+    def _ordered_strategies(self) -> List[str]:
+        preferred = self.preferred_strategy()
+        if preferred not in self.STRATEGIES:
+            return list(self.STRATEGIES)
+        return [preferred] + [name for name in self.STRATEGIES if name != preferred]
+
+    def fill(self, values: List[str]) -> FillResult:
+        result = FillResult(strategy="")
+        for strategy in self._ordered_strategies():
+            result.tried.append(strategy)
+            try:
+                lengths = getattr(self, f"_fill_{strategy}")(values)
+            except Exception as e:
+                self._log("MH-FILL-STRATEGY-ERR", f"{strategy} failed: {e}")
+                continue
+
+            result.strategy = strategy
+            result.lengths = lengths
+            self._log("MH-FILL-FIELD-LEN", f"Field lengths after {strategy}: {lengths}")
+            if len(lengths) >= len(values) and all(length >= self.min_length for length in lengths[:len(values)]):
+                result.ok = True
+                self._remember(strategy)
+                return result
+        return result
+
+    def _fill_native_setter(self, values: List[str]) -> List[int]:
+        outcome = self.driver.execute_script(_NATIVE_FILL_SCRIPT, list(values))
+        return list(outcome.get("lengths") or []) if isinstance(outcome, dict) else []
+
+    def _fill_cdp_insert_text(self, values: List[str]) -> List[int]:
+        for index, value in enumerate(values):
+            if not self.driver.execute_script(_FOCUS_SCRIPT, index):
+                break
+            # Replaces the current selection, like a paste: one trusted input event per field.
+            self.driver.execute_cdp_cmd("Input.insertText", {"text": value})
+        return self._verify()
+
+    def _fill_send_keys(self, values: List[str]) -> List[int]:
+        from selenium.webdriver.common.keys import Keys  # last-resort strategy only
+
+        areas = self.driver.execute_script(_TEXTAREAS_SCRIPT) or []
+        for area, value in zip(areas, values):
+            try:
+                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", area)
+                area.click()
+            except Exception:
+                pass
+            try:
+                area.send_keys(Keys.CONTROL, "a")
+                area.send_keys(Keys.BACKSPACE)
+            except Exception:
+                area.clear()
+            area.send_keys(value)
+            try:
+                area.send_keys(Keys.TAB)
+            except Exception:
+                pass
+        return self._verify()
+
+    def _verify(self) -> List[int]:
+        outcome = self.driver.execute_script(_VERIFY_SCRIPT)
+        return list(outcome.get("lengths") or []) if isinstance(outcome, dict) else []
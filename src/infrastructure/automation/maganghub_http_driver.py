@@ -0,0 +1,211 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.core.interfaces import IAutomationDriver
+from src.core.entities import Report
+from src.infrastructure.monitoring.metrics import log_event, timed_stage
+from src.utils.request_errors import never_sent
+from .api_endpoints import MagangHubApi as Api
+from .fallback_driver import FlowOutcome
+
+
+class MaganghubHttpDriver(IAutomationDriver):
+    """
+    Implementation of IAutomationDriver that talks to the MagangHub backend
+    directly over a pooled HTTP session (no browser).
+    The session is kept across flows so keep-alive connections are reused;
+    close() only drops per-flow state (token, slot, payload).
+    `outcome` (FlowOutcome) tells FallbackAutomationDriver whether a failed
+    flow may be retried in the browser.
+    """
+
+    def __init__(
+        self,
+        base_url: str = Api.BASE_URL,
+        timeout_seconds: int = 15,
+        pool_size: int = 10,
+        utc_offset_hours: int = 8,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.timeout_seconds = timeout_seconds
+        self.tz = timezone(timedelta(hours=utc_offset_hours))
+
+        self.session = requests.Session()
+        retry = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json"})
+
+        self._token: Optional[str] = None
+        self._slot: Optional[Dict[str, Any]] = None
+        self._payload: Optional[Dict[str, Any]] = None
+        self.outcome = FlowOutcome.NOT_SUBMITTED
+
+    def _log(self, code: str, message: str):
+        log_event(code, message)
+
+    def _url(self, path: str) -> str:
+        return f"{self.base_url}{path}"
+
+    def _auth_headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self._token}"} if self._token else {}
+
+    def _today(self) -> str:
+        return datetime.now(self.tz).strftime("%Y-%m-%d")
+
+    def execute_full_flow(self, email: str, password: str, report: Report) -> bool:
+        try:
+            if not self.login(email, password):
+                return False
+            if not self.navigate_to_report_page():
+                return False
+            if not self.fill_report(report):
+                return False
+            return self.submit_report()
+        finally:
+            self.close()
+
+    @timed_stage("login", backend="http")
+    def login(self, email: str, password: str) -> bool:
+        self.outcome = FlowOutcome.NOT_SUBMITTED
+        try:
+            self._log("MH-HTTP-LOGIN-START", "Logging in via API")
+            response = self.session.post(
+                self._url(Api.LOGIN),
+                json={"username": email, "password": password},
+                timeout=self.timeout_seconds,
+            )
+            if response.status_code in (401, 403):
+                self.outcome = FlowOutcome.AUTH_REJECTED
+                self._log("MH-HTTP-LOGIN-ERR-REJECTED", f"Login rejected (status={response.status_code})")
+                return False
+            response.raise_for_status()
+
+            body = response.json()
+            data = body.get("data", body) if isinstance(body, dict) else {}
+            self._token = next((data.get(key) for key in Api.TOKEN_KEYS if data.get(key)), None)
+            if not self._token:
+                self._log("MH-HTTP-LOGIN-ERR-TOKEN", "Login response did not contain an access token")
+                return False
+
+            self._log("MH-HTTP-LOGIN-OK", "API login succeeded")
+            return True
+        except Exception as e:
+            self._log("MH-HTTP-LOGIN-ERR-EXCEPTION", f"API login failed: {e}")
+            return False
+
+    @timed_stage("navigate", backend="http")
+    def navigate_to_report_page(self) -> bool:
+        if not self._token:
+            return False
+        try:
+            today = self._today()
+            response = self.session.get(
+                self._url(Api.DAILY_REPORT_SLOT),
+                params={"date": today},
+                headers=self._auth_headers(),
+                timeout=self.timeout_seconds,
+            )
+            response.raise_for_status()
+            body = response.json()
+            slot = body.get("data", body) if isinstance(body, dict) else None
+            if not isinstance(slot, dict):
+                self._log("MH-HTTP-NAV-ERR", f"No report slot returned for {today}")
+                return False
+            if slot.get("submitted"):
+                # Success as far as callers are concerned: fill/submit become no-ops.
+                self.outcome = FlowOutcome.ALREADY_SUBMITTED
+                self._slot = slot
+                self._log("MH-HTTP-NAV-SUBMITTED", f"Report for {today} is already submitted, nothing to do")
+                return True
+
+            self._slot = slot
+            self._log("MH-HTTP-NAV-OK", f"Report slot resolved for {today} (id={slot.get('id')})")
+            return True
+        except Exception as e:
+            self._log("MH-HTTP-NAV-ERR", f"Failed to fetch today's report slot: {e}")
+            return False
+
+    @timed_stage("fill", backend="http")
+    def fill_report(self, report: Report) -> bool:
+        if self._slot is None:
+            return False
+        if self.outcome == FlowOutcome.ALREADY_SUBMITTED:
+            return True
+        if not report.validate():
+            self._log("MH-HTTP-FILL-ERR-LEN", "Report fields are below the minimum length")
+            return False
+
+        # Payload keys are assumed, not confirmed against the portal (see MagangHubApi).
+        self._payload = {
+            "slot_id": self._slot.get("id"),
+            "date": self._slot.get("date", self._today()),
+            "attendance": Api.ATTENDANCE_PRESENT,
+            "activity": report.activity,
+            "learning": report.learning,
+            "obstacles": report.obstacles,
+            "confirmed": True,
+        }
+        self._log("MH-HTTP-FILL-OK", "Report payload prepared")
+        return True
+
+    @timed_stage("submit", backend="http")
+    def submit_report(self) -> bool:
+        if self.outcome == FlowOutcome.ALREADY_SUBMITTED:
+            self._log("MH-HTTP-SUBMIT-SKIP", "Report already submitted today, skipping")
+            return True
+        if self._payload is None:
+            return False
+        # From here on the report may reach the server: any unexpected error must not be replayed.
+        self.outcome = FlowOutcome.SUBMIT_AMBIGUOUS
+        try:
+            response = self.session.post(
+                self._url(Api.DAILY_REPORT_SUBMIT),
+                json=self._payload,
+                headers=self._auth_headers(),
+                timeout=self.timeout_seconds,
+            )
+        except requests.RequestException as e:
+            if never_sent(e):
+                self.outcome = FlowOutcome.NOT_SUBMITTED
+                self._log("MH-HTTP-SUBMIT-ERR-CONNECT", f"Could not reach the API: {e}")
+                return False
+            # The POST may have been recorded before the connection dropped.
+            self._log("MH-HTTP-SUBMIT-ERR-AMBIGUOUS", f"Submit outcome unknown, not retrying: {e}")
+            return False
+
+        if response.status_code in (200, 201):
+            self.outcome = FlowOutcome.SUBMITTED
+            self._log("MH-HTTP-SUBMIT-OK", "Report submitted via API")
+            return True
+        if response.status_code == 409:
+            self.outcome = FlowOutcome.ALREADY_SUBMITTED
+            self._log("MH-HTTP-SUBMIT-SKIP", "API reports today's report as already submitted")
+            return True
+
+        detail = response.text[:300]
+        if response.status_code >= 500:
+            self._log("MH-HTTP-SUBMIT-ERR-AMBIGUOUS", f"Server error on submit (status={response.status_code}): {detail}")
+            return False
+        self.outcome = FlowOutcome.SUBMIT_REJECTED
+        self._log("MH-HTTP-SUBMIT-ERR", f"Submit rejected (status={response.status_code}): {detail}")
+        return False
+
+    def submission_ready(self) -> bool:
+        # A slot resolved for an earlier day (prepared before midnight WITA) is stale.
+        return bool(self._token and self._slot and self._slot.get("date", self._today()) == self._today())
+
+    def close(self):
+        self._token = None
+        self._slot = None
+        self._payload = None
@@ -1,13 +1,12 @@
 import os
 import time
 from datetime import datetime
-from typing import Tuple
+from typing import Optional, Tuple
 from urllib.parse import urlparse
 
-from selenium.common.exceptions import NoAlertPresentException
-from seleniumbase import SB
-
+from .presensi_endpoint import PresensiEndpoint
 from .presensi_selectors import PresensiSelectors as Sel
+from .resource_blocking import BlockingProfile, NetworkBaseline, NetworkMeter, apply_blocking_profile
 
 
 class PresensiDriver:
@@ -16,18 +15,32 @@ class PresensiDriver:
     Keeps SRP: only handles browser interactions.
     """
 
-    def __init__(self, headless: bool = True):
+    def __init__(
+        self,
+        headless: bool = True,
+        blocking: Optional[BlockingProfile] = None,
+        network_baseline: Optional[NetworkBaseline] = None,
+    ):
         self.headless = headless
         self.sb = None
         self._sb_context = None
+        self.blocking = blocking if headless else None
+        self.network_baseline = network_baseline
+        self._network_meter: Optional[NetworkMeter] = None
 
     def _start_session(self) -> bool:
         if self.sb is not None:
             return True
 
+        # Imported on first launch so a run that never needs the browser skips selenium.
+        from seleniumbase import SB
+
         try:
             self._sb_context = SB(uc=True, headless=self.headless, test=True)
             self.sb = self._sb_context.__enter__()
+            blocked = self.blocking is not None and apply_blocking_profile(self.sb.driver, self.blocking)
+            if self.network_baseline is not None:
+                self._network_meter = NetworkMeter(site="presensi", blocked=blocked)
             return True
         except Exception as error:
             print(f"❌ Failed to start browser session: {error}")
@@ -76,6 +89,7 @@ class PresensiDriver:
     def _consume_alert_text(self) -> str:
         if not self.sb:
             return ""
+        from selenium.common.exceptions import NoAlertPresentException
 
         try:
             alert = self.sb.driver.switch_to.alert
@@ -91,8 +105,8 @@ class PresensiDriver:
         if not self.sb:
             return False, "Browser session is not available."
 
-        success_keywords = ("berhasil", "sukses", "success")
-        failure_keywords = ("gagal", "failed", "error")
+        success_keywords = PresensiEndpoint.SUCCESS_KEYWORDS
+        failure_keywords = PresensiEndpoint.FAILURE_KEYWORDS
         deadline = time.time() + timeout_seconds
 
         while time.time() < deadline:
@@ -174,7 +188,15 @@ class PresensiDriver:
         finally:
             self.close()
 
+    def _report_network(self):
+        if self._network_meter is None or not self.sb:
+            return
+        self._network_meter.record(self.sb.driver)
+        self.network_baseline.report(self._network_meter.usage)
+        self._network_meter = None
+
     def close(self):
+        self._report_network()
         if self._sb_context is None:
             return
         try:
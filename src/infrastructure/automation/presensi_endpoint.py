@@ -0,0 +1,30 @@
+class PresensiEndpoint:
+    """
+    Centralized description of the presensi Apps Script web app for the
+    browserless client. Mirrors PresensiSelectors: if the script's form or
+    replies change, only this file needs updates.
+
+    UNVERIFIED: the field names, a doPost handler behind /exec and the JSON
+    `status`/`message` reply are assumptions. The real page submits through a
+    client-side presensi('MASUK') handler, most likely google.script.run, which
+    may expose no doPost at all. benchmarks/stubs/presensi_stub.py implements
+    this same guess, so stub runs do not validate it; the default submit mode
+    stays browser until the script's real contract is confirmed.
+    """
+    # Form fields posted to the web app (doPost); names follow the page's inputs.
+    NAME_FIELD = "nama"
+    UNIT_FIELD = "unit"
+    ACTION_FIELD = "aksi"
+
+    ACTIONS = ("MASUK", "KELUAR")
+
+    # JSON reply keys, in lookup order; a reply without a status key is not a script answer.
+    STATUS_KEYS = ("status", "result", "success", "ok")
+    MESSAGE_KEYS = ("message", "pesan", "msg")
+
+    # Feedback wording shared with PresensiDriver; failure words are checked first.
+    SUCCESS_KEYWORDS = ("berhasil", "sukses", "success")
+    FAILURE_KEYWORDS = ("gagal", "failed", "error")
+
+    # Landing on one of these means the deployment requires a Google sign-in.
+    AUTH_HOSTS = ("accounts.google.com",)
@@ -0,0 +1,54 @@
+from typing import Tuple
+
+from src.infrastructure.monitoring.metrics import log_event
+
+
+class PresensiOutcome:
+    """
+    Where the primary's last submission stands, exposed as its `outcome` attribute.
+    Only the RETRYABLE outcomes let the browser submit again: in the others the
+    POST reached the Apps Script and attendance may already be recorded.
+    """
+    NOT_SENT = "not_sent"            # connection never established
+    AUTH_REQUIRED = "auth_required"  # redirected to Google sign-in before the script ran
+    REJECTED = "rejected"            # the script answered and refused the submission
+    CONFIRMED = "confirmed"
+    UNCONFIRMED = "unconfirmed"      # the script answered but the reply says neither
+    AMBIGUOUS = "ambiguous"          # timeout, dropped connection or server error after sending
+
+    RETRYABLE = (NOT_SENT, AUTH_REQUIRED, REJECTED)
+
+
+class FallbackPresensiSubmitter:
+    """
+    Tries a primary presensi submitter (the HTTP client) and repeats the
+    submission with the fallback (PresensiDriver in a browser) only when the
+    primary's outcome shows the attempt was not recorded (PresensiOutcome.RETRYABLE).
+    Both expose submit_presensi(url, full_name, unit_name, action) -> (success, details).
+    """
+
+    def __init__(self, primary, fallback):
+        self.primary = primary
+        self.fallback = fallback
+
+    def submit_presensi(self, url: str, full_name: str, unit_name: str, action: str) -> Tuple[bool, str]:
+        try:
+            success, details = self.primary.submit_presensi(url, full_name, unit_name, action)
+        except Exception as error:
+            success, details = False, f"{type(self.primary).__name__} raised: {error}"
+        finally:
+            self.primary.close()
+        if success:
+            return True, details
+        outcome = self.primary.outcome
+        if outcome not in PresensiOutcome.RETRYABLE:
+            log_event("PRESENSI-FALLBACK-SKIP", f"Not retrying in the browser ({outcome}): attendance may already be recorded")
+            return False, f"{details} Not retried: the request reached the endpoint, check the sheet before submitting again."
+
+        log_event("PRESENSI-FALLBACK", f"{details} Retrying with {type(self.fallback).__name__}")
+        success, fallback_details = self.fallback.submit_presensi(url, full_name, unit_name, action)
+        return success, f"{fallback_details} (first attempt: {details})"
+
+    def close(self):
+        self.primary.close()
+        self.fallback.close()
@@ -0,0 +1,156 @@
+import json
+import re
+from html import unescape
+from typing import Any, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.infrastructure.monitoring.metrics import log_event
+from src.utils.request_errors import never_sent
+from .presensi_endpoint import PresensiEndpoint as Endpoint
+from .presensi_fallback import PresensiOutcome
+
+_TAGS = re.compile(r"<script\b.*?</script>|<style\b.*?</style>|<[^>]+>", re.IGNORECASE | re.DOTALL)
+
+
+def classify_feedback(text: str) -> Optional[bool]:
+    """True/False when the text reads as success/failure, None when it says neither."""
+    lowered = (text or "").lower()
+    if any(word in lowered for word in Endpoint.FAILURE_KEYWORDS):
+        return False
+    if any(word in lowered for word in Endpoint.SUCCESS_KEYWORDS):
+        return True
+    return None
+
+
+def is_auth_redirect(url: str) -> bool:
+    host = (urlparse(url or "").hostname or "").lower()
+    return host in Endpoint.AUTH_HOSTS or "signin" in (url or "").lower()
+
+
+def reply_text(body: str) -> str:
+    """Visible text of an HTML/plain reply, for logs and error details."""
+    return " ".join(unescape(_TAGS.sub(" ", body or "")).split())[:200]
+
+
+def parse_presensi_reply(body: str) -> Optional[Tuple[Optional[bool], str]]:
+    """
+    Verdict and message from the script's JSON reply. None when the body is not
+    a script answer at all (HTML, plain text, JSON without a status key).
+    """
+    try:
+        data: Any = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or not any(key in data for key in Endpoint.STATUS_KEYS):
+        return None
+
+    message = next((str(data[key]) for key in Endpoint.MESSAGE_KEYS if data.get(key)), "")
+    for key in Endpoint.STATUS_KEYS:
+        if key not in data:
+            continue
+        status = data[key]
+        verdict = status if isinstance(status, bool) else classify_feedback(str(status))
+        if verdict is None and str(status).lower() in ("ok", "true"):
+            verdict = True
+        if verdict is not None:
+            return verdict, message or str(status)
+    return classify_feedback(message), message
+
+
+class PresensiHttpClient:
+    """
+    Browserless presensi: posts the form fields straight to the Apps Script web
+    app and reads the verdict from its reply. Same submit_presensi() contract as
+    PresensiDriver. `outcome` (PresensiOutcome) records whether a failed POST
+    may be repeated in the browser; a timed-out or unconfirmed one may not.
+
+    UNVERIFIED: the POST contract is assumed (see PresensiEndpoint). A reply
+    that is not a recognized script answer, e.g. Apps Script's "Script
+    function not found: doPost" page, counts as rejected so the browser runs.
+    """
+
+    def __init__(self, timeout_seconds: int = 15):
+        self.timeout_seconds = timeout_seconds
+        self.session = requests.Session()
+        # Only connection failures are retried: a POST that reached the script must not be replayed.
+        retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.2, allowed_methods=None)
+        adapter = HTTPAdapter(max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json, text/plain;q=0.9, */*;q=0.5"})
+        self.outcome = PresensiOutcome.NOT_SENT
+
+    def _log(self, code: str, message: str):
+        log_event(code, message)
+
+    def submit_presensi(
+        self,
+        url: str,
+        full_name: str,
+        unit_name: str,
+        action: str,
+    ) -> Tuple[bool, str]:
+        self.outcome = PresensiOutcome.NOT_SENT
+        normalized_action = action.strip().upper()
+        if normalized_action not in Endpoint.ACTIONS:
+            return False, f"Unsupported action: {action}"
+
+        payload = {
+            Endpoint.NAME_FIELD: full_name,
+            Endpoint.UNIT_FIELD: unit_name,
+            Endpoint.ACTION_FIELD: normalized_action,
+        }
+        self._log("PRESENSI-HTTP-START", f"Posting presensi {normalized_action}")
+        # From here on the script may have run: anything unexpected must not be replayed.
+        self.outcome = PresensiOutcome.AMBIGUOUS
+        try:
+            # Apps Script answers with a redirect to the script output; requests follows it with a GET.
+            response = self.session.post(url, data=payload, timeout=self.timeout_seconds)
+        except requests.RequestException as error:
+            if never_sent(error):
+                self.outcome = PresensiOutcome.NOT_SENT
+                self._log("PRESENSI-HTTP-ERR", f"Could not reach the endpoint: {error}")
+                return False, f"HTTP request failed: {error}"
+            self._log("PRESENSI-HTTP-ERR-AMBIGUOUS", f"No reply after sending, attendance may be recorded: {error}")
+            return False, f"Presensi endpoint did not answer after the form was sent: {error}"
+
+        if is_auth_redirect(response.url):
+            self.outcome = PresensiOutcome.AUTH_REQUIRED
+            self._log("PRESENSI-HTTP-ERR-AUTH", "Redirected to Google sign-in")
+            return False, "Auth redirect detected (Google sign-in required). Endpoint is not CI-accessible."
+        if response.status_code >= 500:
+            self._log("PRESENSI-HTTP-ERR-AMBIGUOUS", f"HTTP {response.status_code} after sending, attendance may be recorded")
+            return False, f"HTTP {response.status_code} from presensi endpoint."
+        if response.status_code >= 400:
+            self.outcome = PresensiOutcome.REJECTED
+            self._log("PRESENSI-HTTP-ERR", f"HTTP {response.status_code}")
+            return False, f"HTTP {response.status_code} from presensi endpoint."
+
+        parsed = parse_presensi_reply(response.text)
+        if parsed is None:
+            # Not the reply this client expects: the contract is wrong, let the browser submit instead.
+            self.outcome = PresensiOutcome.REJECTED
+            detail = reply_text(response.text)
+            self._log("PRESENSI-HTTP-ERR-UNRECOGNIZED", f"Reply is not a presensi script answer: {detail[:80]}")
+            return False, f"Unrecognized reply from presensi endpoint: {detail[:120]}"
+        verdict, message = parsed
+        if verdict is None:
+            self.outcome = PresensiOutcome.UNCONFIRMED
+            self._log("PRESENSI-HTTP-ERR-UNCONFIRMED", f"Script reply has no success/failure wording: {message[:80]}")
+            return False, "Presensi endpoint reply did not confirm the submission."
+        if not verdict:
+            self.outcome = PresensiOutcome.REJECTED
+            self._log("PRESENSI-HTTP-ERR-REJECTED", message)
+            return False, message
+
+        self.outcome = PresensiOutcome.CONFIRMED
+        self._log("PRESENSI-HTTP-OK", message)
+        print(f"✅ Presensi {normalized_action} succeeded. {message}")
+        return True, message
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,249 @@
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.infrastructure.monitoring.metrics import log_event
+
+
+def _log(code: str, message: str):
+    log_event(code, message)
+
+
+IMAGE_PATTERNS = ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.ico*", "*.avif*")
+FONT_PATTERNS = ("*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*")
+MEDIA_PATTERNS = ("*.mp4*", "*.webm*", "*.mp3*")
+TRACKER_PATTERNS = (
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*facebook.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+)
+
+
+@dataclass(frozen=True)
+class BlockingProfile:
+    """
+    URL patterns (CDP Network.setBlockedURLs wildcards) blocked for one site.
+    CDP blocking is deny-only and never sees an allow list, so `allow` cannot
+    exempt single URLs: it drops the deny patterns it fully covers (allow
+    "*.woff*" drops deny "*.woff*" and "*.woff2*"). An allow that only overlaps
+    part of a deny pattern (e.g. "*/logo.png" vs "*.png*") changes nothing and
+    is reported by ineffective_allows().
+    """
+
+    site: str
+    deny: Tuple[str, ...] = ()
+    allow: Tuple[str, ...] = ()
+
+    def effective_patterns(self) -> List[str]:
+        return [
+            pattern
+            for pattern in dict.fromkeys(self.deny)
+            if not any(fnmatch(pattern, allowed) for allowed in self.allow)
+        ]
+
+    def ineffective_allows(self) -> List[str]:
+        """Allow patterns that cover no deny pattern and therefore unblock nothing."""
+        return [
+            allowed
+            for allowed in dict.fromkeys(self.allow)
+            if not any(fnmatch(pattern, allowed) for pattern in self.deny)
+        ]
+
+    def with_overrides(self, extra_deny: Iterable[str] = (), extra_allow: Iterable[str] = ()) -> "BlockingProfile":
+        return BlockingProfile(
+            site=self.site,
+            deny=self.deny + tuple(extra_deny),
+            allow=self.allow + tuple(extra_allow),
+        )
+
+
+MAGANGHUB_PROFILE = BlockingProfile(
+    site="maganghub",
+    deny=IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + TRACKER_PATTERNS,
+)
+
+# The Apps Script form renders inside a googleusercontent.com iframe and needs its scripts;
+# no deny pattern matches scripts, so the form keeps working without an allow list.
+PRESENSI_PROFILE = BlockingProfile(
+    site="presensi",
+    deny=IMAGE_PATTERNS + FONT_PATTERNS + MEDIA_PATTERNS + TRACKER_PATTERNS + (
+        "*fonts.googleapis.com*",
+        "*fonts.gstatic.com*",
+        "*ssl.gstatic.com/images*",
+    ),
+)
+
+
+def parse_pattern_list(raw: Optional[str]) -> Tuple[str, ...]:
+    """Comma/newline separated patterns from env/config."""
+    if not raw:
+        return ()
+    return tuple(item.strip() for item in raw.replace("\n", ",").split(",") if item.strip())
+
+
+def apply_blocking_profile(driver, profile: BlockingProfile) -> bool:
+    """Enable the Network domain and install the profile's blocked URL patterns."""
+    patterns = profile.effective_patterns()
+    ignored = profile.ineffective_allows()
+    if ignored:
+        _log(
+            "MH-NET-BLOCK-WARN",
+            f"Allow pattern(s) {ignored} cover no deny pattern of {profile.site} and unblock nothing "
+            "(CDP cannot exempt single URLs; allow a whole deny pattern such as *.woff* instead)",
+        )
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        _log("MH-NET-BLOCK", f"Resource blocking active for {profile.site}: {len(patterns)} pattern(s)")
+        return True
+    except Exception as e:
+        _log("MH-NET-BLOCK-ERR", f"Could not install resource blocking for {profile.site}: {e}")
+        return False
+
+
+_USAGE_SCRIPT = """
+const entries = performance.getEntriesByType('resource');
+const nav = performance.getEntriesByType('navigation')[0];
+return {
+    origin: performance.timeOrigin,
+    navBytes: nav ? (nav.transferSize || 0) : 0,
+    loadMs: nav && nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : 0,
+    resources: entries.map((entry) => entry.transferSize || 0),
+};
+"""
+
+
+@dataclass
+class NetworkUsage:
+    site: str
+    blocked: bool
+    bytes: int = 0
+    requests: int = 0
+    load_ms: float = 0.0
+    documents: int = 0
+
+
+@dataclass
+class NetworkMeter:
+    """
+    Sums Resource Timing transfer sizes and page-load times across the documents
+    a driver visits. record() can be called repeatedly; entries already counted
+    for the current document are skipped.
+    """
+
+    site: str
+    blocked: bool
+    usage: NetworkUsage = field(init=False)
+    _origin: Optional[float] = field(default=None, init=False)
+    _seen: int = field(default=0, init=False)
+    _load_counted: bool = field(default=False, init=False)
+
+    def __post_init__(self):
+        self.usage = NetworkUsage(site=self.site, blocked=self.blocked)
+
+    def record(self, driver):
+        try:
+            sample = driver.execute_script(_USAGE_SCRIPT)
+        except Exception:
+            return
+        if not isinstance(sample, dict):
+            return
+
+        if sample.get("origin") != self._origin:
+            self._origin = sample.get("origin")
+            self._seen = 0
+            self._load_counted = False
+            self.usage.documents += 1
+            self.usage.bytes += int(sample.get("navBytes") or 0)
+
+        sizes = sample.get("resources") or []
+        fresh = sizes[self._seen:]
+        self._seen = len(sizes)
+        self.usage.bytes += int(sum(fresh))
+        self.usage.requests += len(fresh)
+
+        load_ms = float(sample.get("loadMs") or 0)
+        if load_ms and not self._load_counted:
+            self.usage.load_ms += load_ms
+            self._load_counted = True
+
+
+class NetworkBaseline:
+    """
+    Per-site moving average of unblocked runs (JSON file). Blocked runs are
+    compared against it to report bytes/time saved.
+    """
+
+    def __init__(self, path: str, smoothing: float = 0.3):
+        self.path = path
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, float]]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, data: Dict[str, Dict[str, float]]):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # A private temp file per writer: drivers in other processes report concurrently.
+        fd, tmp_path = tempfile.mkstemp(dir=directory or ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def report(self, usage: NetworkUsage):
+        """Log this run's usage; update the baseline (unblocked) or log savings against it (blocked)."""
+        _log(
+            "MH-NET-USAGE",
+            f"{usage.site}: {usage.bytes / 1024:.0f} KiB over {usage.requests} request(s), "
+            f"page load {usage.load_ms:.0f} ms across {usage.documents} document(s), blocked={usage.blocked}",
+        )
+        if not usage.documents:
+            return
+
+        with self._lock:
+            data = self._load()
+            baseline = data.get(usage.site)
+            if not usage.blocked:
+                if baseline is None:
+                    baseline = {"bytes": usage.bytes, "load_ms": usage.load_ms, "samples": 0}
+                alpha = self.smoothing
+                baseline["bytes"] = (1 - alpha) * baseline["bytes"] + alpha * usage.bytes
+                baseline["load_ms"] = (1 - alpha) * baseline["load_ms"] + alpha * usage.load_ms
+                baseline["samples"] = int(baseline.get("samples", 0)) + 1
+                data[usage.site] = baseline
+                try:
+                    self._write(data)
+                except OSError:
+                    pass
+                return
+
+        if baseline is None:
+            _log("MH-NET-SAVED", f"{usage.site}: no unblocked baseline yet (run once with RESOURCE_BLOCKING=false)")
+            return
+        _log(
+            "MH-NET-SAVED",
+            f"{usage.site}: ~{(baseline['bytes'] - usage.bytes) / 1024:.0f} KiB and "
+            f"~{baseline['load_ms'] - usage.load_ms:.0f} ms page load saved vs unblocked baseline "
+            f"({int(baseline.get('samples', 0))} sample(s))",
+        )
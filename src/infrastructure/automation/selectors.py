@@ -35,6 +35,10 @@ class MagangHubSelectors:
         "'Saya menyatakan telah meninjau dan memastikan isian laporan ini sudah benar')]"
     )
     
+    # In-page submit lookup (ElementQuery): button text or class hints, lowercase.
+    SUBMIT_CANDIDATE_TEXT = ("simpan", "kirim", "submit")
+    SUBMIT_CANDIDATE_CLASS = ("bg-black",)
+
     SUBMIT_BUTTON = (
         "//div[contains(@class,'v-card-actions')]//button"
         "[contains(normalize-space(.), 'Simpan') or "
@@ -0,0 +1,79 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+
+class SessionCache:
+    """
+    Encrypted on-disk cache of authenticated browser state (cookies + localStorage).
+    One file per account; entries expire after a TTL and are dropped when they
+    cannot be decrypted (e.g. the secret was rotated).
+    """
+
+    # Fixed salt: the secret itself is the only key material, the salt just
+    # namespaces the derived key to this cache.
+    _KDF_SALT = b"autoabsen-session-cache"
+    _KDF_ITERATIONS = 200_000
+
+    def __init__(self, cache_dir: str, secret: str, ttl_seconds: int = 6 * 3600):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        derived = hashlib.pbkdf2_hmac("sha256", secret.encode("utf-8"), self._KDF_SALT, self._KDF_ITERATIONS)
+        self._fernet = Fernet(base64.urlsafe_b64encode(derived))
+
+    def _path_for(self, account: str) -> str:
+        digest = hashlib.sha256(account.strip().lower().encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.session")
+
+    def load(self, account: str) -> Optional[Dict]:
+        path = self._path_for(account)
+        try:
+            with open(path, "rb") as f:
+                token = f.read()
+        except OSError:
+            return None
+
+        try:
+            entry = json.loads(self._fernet.decrypt(token).decode("utf-8"))
+        except (InvalidToken, ValueError):
+            self.invalidate(account)
+            return None
+
+        if time.time() - entry.get("saved_at", 0) > self.ttl_seconds:
+            self.invalidate(account)
+            return None
+        return entry
+
+    def save(self, account: str, cookies: List[Dict], local_storage: Dict[str, str]):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = {
+            "saved_at": time.time(),
+            "cookies": cookies,
+            "local_storage": local_storage,
+        }
+        token = self._fernet.encrypt(json.dumps(entry).encode("utf-8"))
+        # A private temp file per writer: concurrent batch workers never share one.
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self._path_for(account))
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def invalidate(self, account: str):
+        try:
+            os.remove(self._path_for(account))
+        except OSError:
+            pass
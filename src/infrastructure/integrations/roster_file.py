@@ -0,0 +1,76 @@
+import csv
+import json
+import os
+from dataclasses import asdict
+from typing import List
+
+from src.core.entities import BatchResult, RosterEntry
+from src.core.exceptions import ConfigurationError
+
+REQUIRED_FIELDS = ("email", "activity")
+
+
+def _resolve_password(row: dict) -> str:
+    """Allow `password_env` to reference an env var instead of a plaintext password."""
+    env_name = (row.get("password_env") or "").strip()
+    if env_name:
+        return os.getenv(env_name, "")
+    return (row.get("password") or "").strip()
+
+
+def load_roster(path: str) -> List[RosterEntry]:
+    """
+    Load a roster from CSV (header row) or JSON (list of objects).
+    Columns: email, password | password_env, activity, context (optional).
+    """
+    if path.lower().endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            rows = json.load(f)
+        if not isinstance(rows, list):
+            raise ConfigurationError("JSON roster must be a list of objects")
+    else:
+        with open(path, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+
+    entries = []
+    for index, row in enumerate(rows, start=1):
+        missing = [field for field in REQUIRED_FIELDS if not (row.get(field) or "").strip()]
+        password = _resolve_password(row)
+        if not password:
+            missing.append("password")
+        if missing:
+            raise ConfigurationError(f"Roster row {index} is missing: {', '.join(missing)}")
+
+        entries.append(
+            RosterEntry(
+                email=row["email"].strip(),
+                password=password,
+                activity=row["activity"].strip(),
+                context=(row.get("context") or "").strip(),
+            )
+        )
+    return entries
+
+
+def write_results(path: str, results: List[BatchResult]):
+    """Write the per-account result table as CSV."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fieldnames = list(BatchResult.__dataclass_fields__)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        for result in results:
+            writer.writerow(asdict(result))
+
+
+def format_results_table(results: List[BatchResult]) -> str:
+    email_width = max([len("email")] + [len(result.email) for result in results])
+    lines = [f"{'email':<{email_width}}  status  seconds  error"]
+    for result in results:
+        status = "OK" if result.success else "FAIL"
+        lines.append(
+            f"{result.email:<{email_width}}  {status:<6}  {result.duration_seconds:>7.1f}  {result.error or ''}"
+        )
+    return "\n".join(lines)
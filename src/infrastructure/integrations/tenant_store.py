@@ -0,0 +1,164 @@
+import base64
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from src.core.entities import Tenant
+from src.core.exceptions import ConfigurationError
+
+
+def _email_key(email: str) -> str:
+    return hashlib.sha256(email.strip().lower().encode("utf-8")).hexdigest()
+
+
+class TenantStore:
+    """
+    Encrypted SQLite store mapping Telegram user IDs to tenants.
+    Credentials, context and preferences are stored as one Fernet token per row;
+    only the Telegram ID and a hash of the email are plaintext (both indexed).
+    Reads go through a bounded in-memory cache that writes invalidate.
+    """
+
+    # Same derivation as SessionCache, namespaced to this store.
+    _KDF_SALT = b"autoabsen-tenant-store"
+    _KDF_ITERATIONS = 200_000
+
+    def __init__(self, path: str, secret: str, cache_ttl_seconds: float = 300, cache_max_entries: int = 1000):
+        self.path = path
+        self.cache_ttl_seconds = cache_ttl_seconds
+        self.cache_max_entries = cache_max_entries
+        derived = hashlib.pbkdf2_hmac("sha256", secret.encode("utf-8"), self._KDF_SALT, self._KDF_ITERATIONS)
+        self._fernet = Fernet(base64.urlsafe_b64encode(derived))
+        self._lock = threading.Lock()
+        # telegram_id -> (tenant or None for "not registered", cached_at)
+        self._cache: "OrderedDict[int, Tuple[Optional[Tenant], float]]" = OrderedDict()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "undecryptable": 0}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS tenants (
+                telegram_id INTEGER PRIMARY KEY,
+                email_hash TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_tenants_email_hash ON tenants(email_hash)")
+        self._conn.commit()
+        try:
+            os.chmod(path, 0o600)
+        except OSError:
+            pass
+
+    def _encrypt(self, tenant: Tenant) -> bytes:
+        payload = {
+            "email": tenant.email,
+            "password": tenant.password,
+            "context": tenant.context,
+            "preferences": tenant.preferences,
+        }
+        return self._fernet.encrypt(json.dumps(payload).encode("utf-8"))
+
+    def _decrypt(self, telegram_id: int, token: bytes) -> Optional[Tenant]:
+        try:
+            payload = json.loads(self._fernet.decrypt(bytes(token)).decode("utf-8"))
+        except (InvalidToken, ValueError):
+            # Wrong or rotated secret: treat as unregistered rather than failing every message.
+            self.stats["undecryptable"] += 1
+            return None
+        return Tenant(
+            telegram_id=telegram_id,
+            email=payload.get("email", ""),
+            password=payload.get("password", ""),
+            context=payload.get("context", ""),
+            preferences=payload.get("preferences") or {},
+        )
+
+    def _cache_put(self, telegram_id: int, tenant: Optional[Tenant]):
+        self._cache[telegram_id] = (tenant, time.monotonic())
+        self._cache.move_to_end(telegram_id)
+        while len(self._cache) > self.cache_max_entries:
+            self._cache.popitem(last=False)
+
+    def get(self, telegram_id: int) -> Optional[Tenant]:
+        with self._lock:
+            cached = self._cache.get(telegram_id)
+            if cached is not None and time.monotonic() - cached[1] <= self.cache_ttl_seconds:
+                self._cache.move_to_end(telegram_id)
+                self.stats["hits"] += 1
+                return cached[0]
+
+            self.stats["misses"] += 1
+            row = self._conn.execute(
+                "SELECT payload FROM tenants WHERE telegram_id = ?",
+                (telegram_id,),
+            ).fetchone()
+            tenant = self._decrypt(telegram_id, row[0]) if row else None
+            self._cache_put(telegram_id, tenant)
+            return tenant
+
+    def find_by_email(self, email: str) -> Optional[Tenant]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT telegram_id, payload FROM tenants WHERE email_hash = ?",
+                (_email_key(email),),
+            ).fetchone()
+            return self._decrypt(row[0], row[1]) if row else None
+
+    def upsert(self, tenant: Tenant):
+        """Create or replace a tenant. One MagangHub account can belong to one Telegram user only."""
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    """
+                    INSERT INTO tenants (telegram_id, email_hash, payload, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(telegram_id) DO UPDATE SET
+                        email_hash = excluded.email_hash,
+                        payload = excluded.payload,
+                        updated_at = excluded.updated_at
+                    """,
+                    (tenant.telegram_id, _email_key(tenant.email), self._encrypt(tenant), now, now),
+                )
+                self._conn.commit()
+            except sqlite3.IntegrityError:
+                self._conn.rollback()
+                raise ConfigurationError("This MagangHub account is already registered to another Telegram user")
+            self._cache_put(tenant.telegram_id, tenant)
+
+    def delete(self, telegram_id: int) -> bool:
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM tenants WHERE telegram_id = ?", (telegram_id,))
+            self._conn.commit()
+            self._cache.pop(telegram_id, None)
+            return cursor.rowcount > 0
+
+    def telegram_ids(self) -> List[int]:
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT telegram_id FROM tenants ORDER BY telegram_id")]
+
+    def get_stats(self) -> Dict[str, float]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats["cached"] = len(self._cache)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,124 @@
+import functools
+import inspect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram, start_http_server
+except ImportError:  # Metrics are optional; everything below degrades to no-ops.
+    Counter = Gauge = Histogram = start_http_server = None
+
+STAGES = ("ai_generate", "browser_start", "login", "navigate", "fill", "submit")
+STAGE_BUCKETS = (0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120, 300)
+
+
+def outcome_of(code: str) -> str:
+    """Classify an MH-*/WF-* log code: failure (…ERR…), success (…OK…), or info."""
+    parts = code.upper().split("-")
+    if any(part.startswith("ERR") or part in ("EXCEPTION", "TIMEOUT") for part in parts):
+        return "failure"
+    if "OK" in parts:
+        return "success"
+    return "info"
+
+
+class BotMetrics:
+    """
+    Prometheus instruments for the long-running bot, registered once per process.
+    Safe to use when prometheus_client is not installed (every call is a no-op).
+    """
+
+    def __init__(self):
+        self.enabled = Counter is not None
+        self._server_started = False
+        self._lock = threading.Lock()
+        if not self.enabled:
+            return
+
+        self.stage_seconds = Histogram(
+            "autoabsen_stage_seconds",
+            "Latency of one pipeline stage",
+            ["stage", "backend"],
+            buckets=STAGE_BUCKETS,
+        )
+        self.log_events = Counter(
+            "autoabsen_log_events_total",
+            "MH-*/WF-* log codes emitted, by outcome",
+            ["code", "outcome"],
+        )
+        self.jobs_in_flight = Gauge("autoabsen_jobs_in_flight", "Report jobs currently being processed")
+        self.queue_depth = Gauge("autoabsen_queue_depth", "Report jobs waiting for a submission worker")
+        self.browser_rss_mb = Gauge("autoabsen_browser_rss_mb", "Resident memory of pooled browser processes (MB)")
+
+    def serve(self, port: int, host: str = "0.0.0.0") -> bool:
+        """Start the /metrics HTTP endpoint (daemon thread). Returns False when unavailable."""
+        if not self.enabled:
+            print("[MH-METRICS-ERR] prometheus_client is not installed; metrics endpoint disabled")
+            return False
+        with self._lock:
+            if not self._server_started:
+                start_http_server(port, addr=host)
+                self._server_started = True
+        print(f"[MH-METRICS-OK] Metrics endpoint listening on http://{host}:{port}/metrics")
+        return True
+
+    @contextmanager
+    def stage(self, name: str, backend: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.stage_seconds.labels(stage=name, backend=backend).observe(time.perf_counter() - started)
+
+    def count_code(self, code: str):
+        if self.enabled:
+            self.log_events.labels(code=code, outcome=outcome_of(code)).inc()
+
+    @contextmanager
+    def job(self):
+        if self.enabled:
+            self.jobs_in_flight.inc()
+        try:
+            yield
+        finally:
+            if self.enabled:
+                self.jobs_in_flight.dec()
+
+    def set_queue_depth(self, depth: int):
+        if self.enabled:
+            self.queue_depth.set(depth)
+
+    def track_browser_rss(self, read_rss_mb: Callable[[], Optional[float]]):
+        """Sample browser RSS at scrape time."""
+        if self.enabled:
+            self.browser_rss_mb.set_function(lambda: read_rss_mb() or 0.0)
+
+
+metrics = BotMetrics()
+
+
+def timed_stage(name: str, backend: str):
+    """Decorator: observe the wrapped call (sync or async) in autoabsen_stage_seconds."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with metrics.stage(name, backend):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with metrics.stage(name, backend):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def log_event(code: str, message: str):
+    """Print an MH-*/WF-* log line and count it."""
+    print(f"[{code}] {message}")
+    metrics.count_code(code)
@@ -1,16 +1,23 @@
 import logging
 import asyncio
+import math
+from collections import defaultdict
+from concurrent.futures import Future
+from typing import Dict, Iterable, Optional, Tuple
 from telegram import Update
 from telegram.ext import (
-    ApplicationBuilder,
     ApplicationHandlerStop,
     ContextTypes,
     CommandHandler,
     MessageHandler,
     filters,
 )
-from src.core.interfaces import IInteractionHandler
-from src.services.report_service import ReportService
+from src.core.entities import Report, Tenant
+from src.core.exceptions import ConfigurationError, QueueFullError
+from src.core.interfaces import IAsyncContentGenerator, IInteractionHandler
+from src.infrastructure.integrations.tenant_store import TenantStore
+from .update_source import UpdateSource
+from src.services.submission_scheduler import JobTicket, SubmissionScheduler
 from src.config import config
 
 # Setup logging
@@ -21,14 +28,48 @@ class TelegramBotHandler(IInteractionHandler):
     Handles Telegram interactions.
     Requires TELEGRAM_BOT_TOKEN in .env
     """
-    def __init__(self, token: str, report_service: ReportService):
+    def __init__(
+        self,
+        token: str,
+        scheduler: SubmissionScheduler,
+        async_ai: Optional[IAsyncContentGenerator] = None,
+        tenants: Optional[TenantStore] = None,
+        registration_open: bool = False,
+        registration_ids: Iterable[str] = (),
+        update_source: Optional[UpdateSource] = None,
+    ):
         self.token = token
-        self.service = report_service
-        self.app = ApplicationBuilder().token(token).build()
+        self.update_source = update_source or UpdateSource()
+        # Per-user credentials/context; without a store only the single .env account is served.
+        self.tenants = tenants
+        self.registration_open = registration_open
+        # Cohort allowlist for closed registration; the .env ALLOWED_TELEGRAM_ID is always allowed.
+        self.registration_ids = {str(telegram_id) for telegram_id in registration_ids}
+        if config.allowed_telegram_id:
+            self.registration_ids.add(config.allowed_telegram_id)
+        # Every submission goes through the scheduler's bounded queue and workers.
+        self.scheduler = scheduler
+        # When set, generation is awaited on the event loop and only the
+        # (blocking) browser submission is queued.
+        self.async_ai = async_ai
+        # Holds a user's messages in order until their job is queued (per-user FIFO).
+        self._user_locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.app = (
+            self.update_source.application_builder(token)
+            # Handlers wait on queued jobs; updates must not be processed one at a time.
+            .concurrent_updates(True)
+            .post_init(self._on_startup)
+            .post_shutdown(self._on_shutdown)
+            .build()
+        )
         
         # Register handlers
         self.app.add_handler(CommandHandler("start", self.start_command))
         self.app.add_handler(CommandHandler("help", self.help_command))
+        if self.tenants is not None:
+            self.app.add_handler(CommandHandler("register", self.register_command))
+            self.app.add_handler(CommandHandler("context", self.context_command))
+            self.app.add_handler(CommandHandler("unregister", self.unregister_command))
         self.app.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), self.handle_message))
 
     async def start_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -44,49 +85,225 @@ class TelegramBotHandler(IInteractionHandler):
         await update.message.reply_text(
             "Commands:\n"
             "/start - Start the bot\n"
-            "Just type your activity to submit a report."
+            + (
+                "/register <email> <password> - Link your MagangHub account\n"
+                "/context <text> - Set your internship context\n"
+                "/unregister - Remove your account\n"
+                if self.tenants is not None
+                else ""
+            )
+            + "Just type your activity to submit a report."
+        )
+
+    def _resolve_tenant(self, user_id: int) -> Optional[Tenant]:
+        """Registered tenant, else the .env account for the allowlisted ID (or anyone when no allowlist)."""
+        if self.tenants is not None:
+            tenant = self.tenants.get(user_id)
+            if tenant is not None:
+                return tenant
+        if not config.has_single_account():
+            return None
+        if config.allowed_telegram_id and str(user_id) != config.allowed_telegram_id:
+            return None
+        if self.tenants is not None and not config.allowed_telegram_id:
+            # Multi-tenant mode: the .env account is never shared with unregistered users.
+            return None
+        return Tenant(
+            telegram_id=user_id,
+            email=config.maganghub_email,
+            password=config.maganghub_password,
+            context=config.aktivitas_konteks,
         )
 
+    async def register_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        user_id = update.effective_user.id
+        # The message carries a password: remove it from the chat history first.
+        try:
+            await update.message.delete()
+        except Exception:
+            pass
+        chat = update.effective_chat
+
+        if not self.registration_open and str(user_id) not in self.registration_ids:
+            await chat.send_message(
+                f"⛔ Registration is closed. Ask the bot admin to add your Telegram ID ({user_id}) "
+                "to TENANT_REGISTRATION_IDS."
+            )
+            return
+        # The password is the rest of the line, so it may contain spaces.
+        parts = (update.message.text or "").split(None, 2)
+        if len(parts) != 3 or not parts[2].strip():
+            await chat.send_message("Usage: /register <email> <password>")
+            return
+
+        email, password = parts[1], parts[2].strip()
+        owner = self.tenants.find_by_email(email)
+        if owner is not None and owner.telegram_id != user_id:
+            await chat.send_message(f"❌ {email} is already registered to another Telegram user.")
+            return
+        existing = self.tenants.get(user_id)
+        tenant = Tenant(
+            telegram_id=user_id,
+            email=email,
+            password=password,
+            context=existing.context if existing else "",
+            preferences=existing.preferences if existing else {},
+        )
+        try:
+            self.tenants.upsert(tenant)
+        except ConfigurationError as e:
+            await chat.send_message(f"❌ {e}")
+            return
+        await chat.send_message(f"✅ Registered {email}. Your message with the password was deleted.")
+
+    async def context_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        tenant = self.tenants.get(update.effective_user.id)
+        if tenant is None:
+            await update.message.reply_text("Register first with /register <email> <password>.")
+            return
+        text = " ".join(context.args).strip()
+        if not text:
+            await update.message.reply_text(f"Current context: {tenant.context or config.aktivitas_konteks}")
+            return
+        tenant.context = text
+        self.tenants.upsert(tenant)
+        await update.message.reply_text("✅ Context updated.")
+
+    async def unregister_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        if self.tenants.delete(update.effective_user.id):
+            await update.message.reply_text("🗑️ Your account was removed.")
+        else:
+            await update.message.reply_text("You are not registered.")
+
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         user_text = update.message.text
         user_id = update.effective_user.id
 
-        # Security: restrict access when allowlist is configured.
-        if config.allowed_telegram_id and str(user_id) != config.allowed_telegram_id:
+        # Security: only registered tenants (or the allowlisted .env account) may submit.
+        tenant = self._resolve_tenant(user_id)
+        if tenant is None:
             await update.message.reply_text("⛔ Unauthorized.")
             raise ApplicationHandlerStop
+        report_context = tenant.context or config.aktivitas_konteks
 
         await update.message.reply_text("⏳ Processing your report... (This simulates browsing, might take 1-2 mins)")
-        
-        # Run synchronous service logic in a separate thread to not block the bot
-        # automation is blocking, so we need run_in_executor
-        loop = asyncio.get_running_loop()
-        
+
+        generation: Optional[Future] = None
         try:
-            # We need to pass the context explicitly or rely on global config
-            # Here we assume single-user config for now (SOLID: we should probably pass user credentials here)
-            success = await loop.run_in_executor(
-                None, 
-                self.service.process_daily_report,
-                config.aktivitas_konteks,
-                user_text, 
-                config.maganghub_email, 
-                config.maganghub_password
-            )
-            
+            async with self._user_locks[user_id]:
+                if self.async_ai is not None and self.scheduler.pipelined:
+                    ticket, generation = await self._enqueue_while_generating(tenant, report_context, user_text)
+                elif self.async_ai is not None:
+                    ticket = await self._generate_then_enqueue(tenant, report_context, user_text)
+                else:
+                    ticket = await self.scheduler.submit(
+                        user_id,
+                        lambda service: service.process_daily_report(
+                            report_context,
+                            user_text,
+                            tenant.email,
+                            tenant.password,
+                        ),
+                    )
+            if ticket is None:
+                await update.message.reply_text("❌ Report generation failed. Check logs.")
+                return
+
+            await update.message.reply_text(self._queue_status_text(ticket))
+            success = await ticket.result()
+
             if success:
                 await update.message.reply_text("✅ Report Submitted Successfully! 🎉")
+            elif self._generation_failed(generation):
+                await update.message.reply_text("❌ Report generation failed. Check logs.")
             else:
                 await update.message.reply_text("❌ Report Submission Failed. Check logs.")
                 
+        except QueueFullError:
+            await update.message.reply_text("🚦 The submission queue is full. Please try again in a few minutes.")
         except Exception as e:
             logger.error(f"Bot Error: {e}")
             await update.message.reply_text(f"❌ Error: {str(e)}")
 
+    async def _generate_report(self, report_context: str, user_text: str) -> Optional[Report]:
+        try:
+            report = await self.async_ai.generate_content(report_context, user_text)
+        except Exception as e:
+            logger.error(f"AI Generation Error: {e}")
+            return None
+        if not report.validate():
+            logger.warning("Generated report failed validation (too short).")
+            return None
+        return report
+
+    async def _generate_then_enqueue(self, tenant: Tenant, report_context: str, user_text: str) -> Optional[JobTicket]:
+        report = await self._generate_report(report_context, user_text)
+        if report is None:
+            return None
+
+        return await self.scheduler.submit(
+            tenant.telegram_id,
+            lambda service: service.submit_generated_report(
+                report,
+                tenant.email,
+                tenant.password,
+            ),
+        )
+
+    async def _enqueue_while_generating(
+        self, tenant: Tenant, report_context: str, user_text: str
+    ) -> Tuple[JobTicket, Future]:
+        """
+        Queue the job right away and generate on the loop meanwhile: the worker
+        logs in and opens today's report, then blocks on the generation before filling.
+        """
+        generation = asyncio.run_coroutine_threadsafe(
+            self._generate_report(report_context, user_text),
+            asyncio.get_running_loop(),
+        )
+        try:
+            ticket = await self.scheduler.submit(
+                tenant.telegram_id,
+                lambda service: service.submit_pipelined(
+                    generation.result,
+                    tenant.email,
+                    tenant.password,
+                ),
+            )
+        except BaseException:
+            generation.cancel()
+            raise
+        return ticket, generation
+
+    @staticmethod
+    def _generation_failed(generation: Optional[Future]) -> bool:
+        return (
+            generation is not None
+            and generation.done()
+            and (generation.cancelled() or generation.result() is None)
+        )
+
+    @staticmethod
+    def _queue_status_text(ticket: JobTicket) -> str:
+        eta_minutes = max(1, math.ceil(ticket.eta_seconds / 60))
+        if ticket.wait_seconds <= 0:
+            return f"🚀 Submitting now (ETA ~{eta_minutes} min)"
+        return f"🕒 Queued at position {ticket.position} (ETA ~{eta_minutes} min)"
+
+    async def _on_startup(self, application):
+        await self.scheduler.start()
+
+    async def _on_shutdown(self, application):
+        await self.scheduler.stop()
+        if self.tenants is not None:
+            self.tenants.close()
+        if self.async_ai is not None:
+            await self.async_ai.aclose()
+
     def start(self):
         """Run the bot (blocking)"""
-        print("🤖 Telegram Bot Started...")
-        self.app.run_polling()
+        print(f"🤖 Telegram Bot Started ({self.update_source.mode})...")
+        self.update_source.run(self.app)
 
     def stop(self):
         pass
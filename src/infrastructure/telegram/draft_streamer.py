@@ -0,0 +1,61 @@
+import logging
+import time
+from typing import Dict, Optional
+
+from telegram.error import BadRequest, RetryAfter
+
+logger = logging.getLogger(__name__)
+
+FIELD_TITLES = (("activity", "Activity"), ("learning", "Learning"), ("obstacles", "Obstacles"))
+
+
+def render_partial_draft(fields: Dict[str, str]) -> str:
+    """Plain-text preview of a draft that is still streaming (no Markdown: text may be cut mid-token)."""
+    parts = ["✍️ Drafting report...\n"]
+    for key, title in FIELD_TITLES:
+        if key in fields:
+            parts.append(f"{title}:\n{fields[key]}▌\n")
+    return "\n".join(parts)
+
+
+class ThrottledMessageEditor:
+    """
+    Edits one Telegram message in place, at most once per min_interval seconds.
+    Intermediate updates inside the window are dropped (the next edit carries the
+    latest text); flush() always sends the final text. Honors RetryAfter.
+    """
+
+    def __init__(self, message, min_interval: float = 1.5):
+        self.message = message
+        self.min_interval = min_interval
+        self._last_text: Optional[str] = None
+        self._next_allowed = 0.0
+        self.edits = 0
+
+    async def update(self, text: str):
+        if text == self._last_text or time.monotonic() < self._next_allowed:
+            return
+        await self._edit(text)
+
+    async def flush(self, text: str, parse_mode: Optional[str] = None) -> bool:
+        return await self._edit(text, parse_mode=parse_mode)
+
+    async def _edit(self, text: str, parse_mode: Optional[str] = None) -> bool:
+        try:
+            await self.message.edit_text(text, parse_mode=parse_mode)
+            self._last_text = text
+            self.edits += 1
+            return True
+        except RetryAfter as e:
+            retry_after = getattr(e.retry_after, "total_seconds", lambda: e.retry_after)()
+            logger.warning(f"Telegram edit throttled, retry after {retry_after}s")
+            self._next_allowed = time.monotonic() + float(retry_after)
+            return False
+        except BadRequest as e:
+            # "Message is not modified" is harmless; anything else is reported to the caller.
+            if "not modified" in str(e).lower():
+                return True
+            logger.warning(f"Telegram edit failed: {e}")
+            return False
+        finally:
+            self._next_allowed = max(self._next_allowed, time.monotonic() + self.min_interval)
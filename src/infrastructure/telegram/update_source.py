@@ -0,0 +1,100 @@
+import re
+import secrets
+from dataclasses import dataclass
+from typing import Optional
+
+from telegram.ext import Application, ApplicationBuilder
+
+from src.core.exceptions import ConfigurationError
+
+UPDATE_MODES = ("polling", "webhook")
+# Telegram accepts 1-256 characters from A-Z, a-z, 0-9, "_" and "-".
+_SECRET_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,256}$")
+
+
+@dataclass(frozen=True)
+class UpdateSource:
+    """
+    How a bot receives updates: long polling, or a webhook served by PTB's
+    embedded server (needs python-telegram-bot[webhooks]). In webhook mode every
+    request must carry X-Telegram-Bot-Api-Secret-Token; PTB rejects the rest with 403.
+    """
+
+    mode: str = "polling"
+    webhook_url: Optional[str] = None  # public base URL Telegram posts to
+    listen: str = "0.0.0.0"
+    port: int = 8443
+    path: str = "telegram"
+    secret_token: Optional[str] = None
+    api_base_url: Optional[str] = None  # Bot API server, e.g. a local fake for tests
+
+    @classmethod
+    def from_config(cls, settings) -> "UpdateSource":
+        source = cls(
+            mode=(settings.telegram_update_mode or "polling").strip().lower(),
+            webhook_url=settings.telegram_webhook_url,
+            listen=settings.telegram_webhook_listen,
+            port=settings.telegram_webhook_port,
+            path=settings.telegram_webhook_path,
+            # A per-process secret is enough: setWebhook re-registers it on every start.
+            secret_token=settings.telegram_webhook_secret or secrets.token_urlsafe(32),
+            api_base_url=settings.telegram_api_base_url,
+        )
+        source.validate()
+        return source
+
+    @property
+    def is_webhook(self) -> bool:
+        return self.mode == "webhook"
+
+    @property
+    def url_path(self) -> str:
+        return self.path.strip("/")
+
+    @property
+    def full_webhook_url(self) -> str:
+        return f"{(self.webhook_url or '').rstrip('/')}/{self.url_path}"
+
+    def validate(self):
+        if self.mode not in UPDATE_MODES:
+            raise ConfigurationError(f"TELEGRAM_UPDATE_MODE must be one of {', '.join(UPDATE_MODES)}")
+        if not self.is_webhook:
+            return
+        if not self.webhook_url:
+            raise ConfigurationError("TELEGRAM_WEBHOOK_URL is required in webhook mode")
+        if not self.secret_token or not _SECRET_PATTERN.match(self.secret_token):
+            raise ConfigurationError("TELEGRAM_WEBHOOK_SECRET may only contain A-Z, a-z, 0-9, '_' and '-'")
+
+    def application_builder(self, token: str) -> ApplicationBuilder:
+        builder = ApplicationBuilder().token(token)
+        if self.api_base_url:
+            base = self.api_base_url.rstrip("/")
+            builder = builder.base_url(f"{base}/bot").base_file_url(f"{base}/file/bot")
+        return builder
+
+    def run(self, app: Application):
+        """Blocking: serve updates until stopped (long-running bot)."""
+        if self.is_webhook:
+            print(f"🌐 Webhook listening on {self.listen}:{self.port}/{self.url_path}")
+            app.run_webhook(
+                listen=self.listen,
+                port=self.port,
+                url_path=self.url_path,
+                webhook_url=self.full_webhook_url,
+                secret_token=self.secret_token,
+            )
+        else:
+            app.run_polling()
+
+    async def start(self, app: Application):
+        """Start receiving updates on an initialized, started app; stop with app.updater.stop()."""
+        if self.is_webhook:
+            await app.updater.start_webhook(
+                listen=self.listen,
+                port=self.port,
+                url_path=self.url_path,
+                webhook_url=self.full_webhook_url,
+                secret_token=self.secret_token,
+            )
+        else:
+            await app.updater.start_polling()
@@ -1,13 +1,14 @@
 import os
 import sys
-from dotenv import load_dotenv
 
 # Add project root to path to ensure imports work
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(project_root)
 
-from src.infrastructure.ai.openrouter_ai import OpenRouterAI
-from src.infrastructure.automation.seleniumbase_driver import SeleniumBaseDriver
+from src.infrastructure.ai.generator_factory import build_content_generator, build_generation_cache_store
+from src.infrastructure.automation.browser_pool import BrowserPool, default_use_uc
+from src.infrastructure.automation.driver_factory import build_automation_driver, build_session_cache
+from src.infrastructure.automation.selectors import MagangHubSelectors
 from src.services.report_service import ReportService
 
 from src.config import config
@@ -15,6 +16,9 @@ from src.config import config
 def main():
     if not config:
         return
+    if not config.has_single_account():
+        print("❌ MAGANGHUB_EMAIL and MAGANGHUB_PASSWORD are required for CLI mode.")
+        return
 
     # User Input
     print(f"📝 Apa aktivitasmu hari ini? (Context: {config.aktivitas_konteks})")
@@ -25,20 +29,31 @@ def main():
 
     # Dependency Injection
     # We inject the concrete implementations here (Composition Root)
-    ai_provider = OpenRouterAI(
-        api_key=config.openrouter_api_key,
-        model=config.ai_model,
-    )
+    ai_provider = build_content_generator(config, build_generation_cache_store(config))
     
     # Logic inversion: Show Browser = True -> Headless = False
     is_headless = not config.show_browser
     
-    automation_driver = SeleniumBaseDriver(headless=is_headless)
+    browser_pool = BrowserPool(
+        headless=is_headless,
+        use_uc=default_use_uc(),
+        min_size=config.browser_pool_min_size,
+        max_size=config.browser_pool_max_size,
+        max_uses=config.browser_pool_max_uses,
+        max_rss_mb=config.browser_pool_max_rss_mb,
+        storage_origins=(config.maganghub_web_base_url or MagangHubSelectors.BASE_URL,),
+    )
+    automation_driver = build_automation_driver(
+        config, headless=is_headless, pool=browser_pool, session_cache=build_session_cache(config)
+    )
     
-    service = ReportService(ai_provider, automation_driver)
+    service = ReportService(ai_provider, automation_driver, pipelined=config.report_pipeline)
     
     # Execute
-    service.process_daily_report(config.aktivitas_konteks, activity, config.maganghub_email, config.maganghub_password)
+    try:
+        service.process_daily_report(config.aktivitas_konteks, activity, config.maganghub_email, config.maganghub_password)
+    finally:
+        browser_pool.close_all()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,107 @@
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, List, Optional
+
+from src.core.entities import BatchResult, RosterEntry
+from src.core.interfaces import IAutomationDriver, IContentGenerator
+from .report_service import ReportService
+
+
+def recommended_worker_count(per_worker_mb: int = 500, max_workers: int = 16) -> int:
+    """
+    Size the worker pool from host capacity: one worker per CPU core, capped by
+    how many browser sessions (~per_worker_mb each) fit in available memory.
+    """
+    cpu_bound = os.cpu_count() or 1
+    memory_bound = cpu_bound
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    available_mb = int(line.split()[1]) // 1024
+                    memory_bound = max(1, available_mb // per_worker_mb)
+                    break
+    except OSError:
+        pass
+    return max(1, min(cpu_bound, memory_bound, max_workers))
+
+
+class BatchReportService:
+    """
+    Service Layer: runs ReportService for a whole roster with bounded concurrency.
+    Each job gets its own driver from driver_factory (drivers are not thread-safe);
+    start times are spread across a window so the cohort does not hit the portal
+    at the same second.
+    """
+
+    def __init__(
+        self,
+        ai_generator: IContentGenerator,
+        driver_factory: Callable[[], IAutomationDriver],
+        max_workers: int = 1,
+        spread_seconds: float = 0.0,
+    ):
+        self.ai = ai_generator
+        self.driver_factory = driver_factory
+        self.max_workers = max(1, max_workers)
+        self.spread_seconds = max(0.0, spread_seconds)
+
+    def _start_offsets(self, count: int) -> List[float]:
+        if count <= 1 or self.spread_seconds <= 0:
+            return [0.0] * count
+        slot = self.spread_seconds / count
+        # Even slots with jitter inside each slot keep the spread but avoid lockstep.
+        return [index * slot + random.uniform(0, slot * 0.5) for index in range(count)]
+
+    def _run_one(self, entry: RosterEntry, default_context: str) -> BatchResult:
+        started = time.monotonic()
+        started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        error: Optional[str] = None
+        try:
+            service = ReportService(self.ai, self.driver_factory())
+            success = service.process_daily_report(
+                entry.context or default_context,
+                entry.activity,
+                entry.email,
+                entry.password,
+            )
+            if not success:
+                error = "generation or submission failed (see MH-* logs)"
+        except Exception as e:
+            success = False
+            error = str(e)
+
+        return BatchResult(
+            email=entry.email,
+            success=success,
+            duration_seconds=round(time.monotonic() - started, 2),
+            started_at=started_at,
+            error=error,
+        )
+
+    def run(self, entries: List[RosterEntry], default_context: str) -> List[BatchResult]:
+        offsets = self._start_offsets(len(entries))
+        batch_start = time.monotonic()
+        print(
+            f"📋 Batch: {len(entries)} account(s), workers={self.max_workers}, "
+            f"spread={self.spread_seconds:.0f}s"
+        )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="batch") as executor:
+            futures = []
+            for entry, offset in zip(entries, offsets):
+                delay = batch_start + offset - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(self._run_one, entry, default_context))
+            results = [future.result() for future in futures]
+
+        succeeded = sum(1 for result in results if result.success)
+        print(
+            f"📊 Batch finished: {succeeded}/{len(results)} succeeded "
+            f"in {time.monotonic() - batch_start:.1f}s"
+        )
+        return results
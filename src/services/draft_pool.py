@@ -0,0 +1,118 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from src.core.entities import Report
+from src.core.interfaces import IAsyncContentGenerator
+from src.infrastructure.monitoring.metrics import log_event
+
+ProgressCallback = Callable[[Dict[str, str]], Awaitable[None]]
+
+
+def draft_score(report: Report) -> tuple:
+    """Valid drafts first, then the one whose shortest field is longest."""
+    return (report.validate(), min(len(report.activity), len(report.learning), len(report.obstacles)))
+
+
+class DraftCandidatePool:
+    """
+    Service Layer: several drafts for one activity text, generated concurrently.
+    generate() streams the primary draft and starts one generation per alternate
+    generator alongside it; next_alternate() hands out the best finished
+    alternate immediately and tops the pool back up in the background.
+    Call everything from the event loop; close() cancels what is still running.
+    """
+
+    def __init__(self, primary: IAsyncContentGenerator, alternates: List[IAsyncContentGenerator]):
+        self.primary = primary
+        self.alternates = alternates
+        self._ready: List[Report] = []
+        self._pending: Set[asyncio.Task] = set()
+        self._available = asyncio.Event()
+        self._context = ""
+        self._user_input = ""
+        self._next_generator = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.alternates)
+
+    @property
+    def ready_count(self) -> int:
+        return len(self._ready)
+
+    async def generate(
+        self,
+        context: str,
+        user_input: str,
+        on_progress: ProgressCallback,
+        primary: Optional[IAsyncContentGenerator] = None,
+    ) -> Report:
+        """
+        Best of the primary draft and any alternates already finished with it.
+        `primary` replaces the pool's primary generator for this draft only
+        (e.g. an uncached one when the cached draft was just rejected).
+        """
+        await self.close()
+        self._context, self._user_input = context, user_input
+        for _ in self.alternates:
+            self._top_up()
+        report = await (primary or self.primary).generate_content_streaming(context, user_input, on_progress)
+        if self._ready and draft_score(max(self._ready, key=draft_score)) > draft_score(report):
+            self._ready.append(report)
+            report = self._take_best()
+        log_event(
+            "WF-DRAFT-POOL",
+            f"Draft served; {len(self._ready)} alternate(s) ready, {len(self._pending)} generating",
+        )
+        return report
+
+    async def next_alternate(self, timeout: float) -> Optional[Report]:
+        """
+        Best ready alternate (waiting up to timeout if all are still generating);
+        None when the pool has nothing left to offer. Starts a replacement.
+        """
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not self._ready and self._pending:
+            self._available.clear()
+            try:
+                await asyncio.wait_for(self._available.wait(), deadline - asyncio.get_running_loop().time())
+            except asyncio.TimeoutError:
+                break
+        if not self._ready:
+            return None
+        report = self._take_best()
+        self._top_up()
+        log_event("WF-DRAFT-POOL", f"Alternate served; {len(self._ready)} ready, {len(self._pending)} generating")
+        return report
+
+    def _take_best(self) -> Report:
+        best = max(self._ready, key=draft_score)
+        self._ready.remove(best)
+        return best
+
+    def _top_up(self):
+        generator = self.alternates[self._next_generator % len(self.alternates)]
+        self._next_generator += 1
+        task = asyncio.ensure_future(generator.generate_content(self._context, self._user_input))
+        self._pending.add(task)
+        task.add_done_callback(self._collect)
+
+    def _collect(self, task: asyncio.Task):
+        self._pending.discard(task)
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            log_event("WF-DRAFT-POOL-ERR", f"Alternate draft failed: {error}")
+        elif task.result().validate():
+            self._ready.append(task.result())
+        # Wake next_alternate() either way; it gives up once nothing is pending.
+        self._available.set()
+
+    async def close(self):
+        tasks = list(self._pending)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._pending.clear()
+        self._ready.clear()
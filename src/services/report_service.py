@@ -1,46 +1,114 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from src.core.entities import Report
 from src.core.interfaces import IContentGenerator, IAutomationDriver
 
 class ReportService:
     """
     Service Layer: Orchestrates the generation and submission of reports.
     Follows DIP: Depends on abstractions (Interfaces).
+    In pipelined mode, generation runs while the driver starts its session,
+    logs in and opens today's report; the two join before the form is filled.
     """
-    
-    def __init__(self, ai_generator: IContentGenerator, driver: IAutomationDriver):
+
+    def __init__(self, ai_generator: IContentGenerator, driver: IAutomationDriver, pipelined: bool = False):
         self.ai = ai_generator
         self.driver = driver
+        self.pipelined = pipelined
 
     def process_daily_report(self, context: str, user_activity: str, email: str, password: str) -> bool:
         """
         Full workflow: Generate content -> Submit to portal.
         """
+        if self.pipelined:
+            print("🤖 Generating report content while the portal session is prepared...")
+            return self.submit_pipelined(lambda: self._generate(context, user_activity), email, password)
+
         print("🤖 [1/2] Generating Report Content...")
+        report = self._generate(context, user_activity)
+        if report is None:
+            return False
+
+        print("\n🚀 [2/2] Automating Submission...")
+        return self.submit_generated_report(report, email, password)
+
+    def _generate(self, context: str, user_activity: str) -> Optional[Report]:
         try:
             report = self.ai.generate_content(context, user_activity)
             if not report.validate():
                 print("❌ Generated report failed validation (too short).")
-                return False
-            
+                return None
+
             print("✅ Report Generated:")
             print(f"   - Activity: {len(report.activity)} chars")
             print(f"   - Learning: {len(report.learning)} chars")
             print(f"   - Obstacles: {len(report.obstacles)} chars")
-            
+            return report
+
         except Exception as e:
             print(f"❌ AI Generation Error: {e}")
-            return False
+            return None
 
-        print("\n🚀 [2/2] Automating Submission...")
+    def submit_generated_report(self, report: Report, email: str, password: str) -> bool:
+        """
+        Submission half of the workflow, for callers that generated the report
+        themselves (e.g. with an async generator on the event loop).
+        """
         try:
             success = self.driver.execute_full_flow(email, password, report)
-            
+
             if success:
                 print("✅ Report Submitted Successfully!")
             else:
                 print("❌ Report Submission Failed.")
-            
+
             return success
-            
+
+        except Exception as e:
+            print(f"❌ Automation Error: {e}")
+            return False
+        finally:
+            self.driver.close()
+
+    def submit_pipelined(self, produce_report: Callable[[], Optional[Report]], email: str, password: str) -> bool:
+        """
+        Run produce_report (blocking; None = no usable report) on a helper thread
+        while this thread prepares the portal session, then fill and submit.
+        The driver is closed whichever side fails; a generation still running
+        after a failed preparation is left to finish on its own.
+        """
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-gen")
+        pending = executor.submit(produce_report)
+        executor.shutdown(wait=False)
+        try:
+            prepared = self.driver.prepare_submission(email, password)
+            prepared_after = time.monotonic() - started
+            if not prepared:
+                print("❌ Report Submission Failed (could not open today's report).")
+                return False
+
+            try:
+                report = pending.result()
+            except Exception as e:
+                print(f"❌ AI Generation Error: {e}")
+                return False
+            if report is None:
+                return False
+            print(
+                f"⏱️ Session ready after {prepared_after:.1f}s, "
+                f"report ready after {time.monotonic() - started:.1f}s"
+            )
+
+            success = self.driver.finish_submission(report)
+            if success:
+                print("✅ Report Submitted Successfully!")
+            else:
+                print("❌ Report Submission Failed.")
+            return success
+
         except Exception as e:
             print(f"❌ Automation Error: {e}")
             return False
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Optional
+
+from src.core.entities import Report
+from src.core.interfaces import IAutomationDriver
+from src.infrastructure.monitoring.metrics import log_event
+from src.utils.daemon_thread import run_in_daemon_thread
+
+
+class _Preparation:
+    """
+    One speculative prepare_submission run. A discard() that lands while the
+    session is still starting has nothing to close yet, so run() closes the
+    driver itself once preparation returns. Closes are serialized.
+    """
+
+    def __init__(self, driver: IAutomationDriver):
+        self.driver = driver
+        self._lock = threading.Lock()
+        self._close_lock = threading.Lock()
+        self._running = True
+        self._discarded = False
+
+    def run(self, email: str, password: str) -> bool:
+        try:
+            return self.driver.prepare_submission(email, password)
+        finally:
+            with self._lock:
+                self._running = False
+                discarded = self._discarded
+            if discarded:
+                try:
+                    self.close()
+                except Exception as e:
+                    log_event("WF-PREWARM-ERR", f"Closing discarded session failed: {e}")
+
+    def discard(self) -> bool:
+        """Mark as discarded; True while run() is still in flight (it then closes on exit)."""
+        with self._lock:
+            self._discarded = True
+            return self._running
+
+    def close(self):
+        with self._close_lock:
+            self.driver.close()
+
+
+class SubmissionPrewarm:
+    """
+    Speculatively runs the slow half of a submission (session start, login,
+    opening today's report) while the user is still reviewing the draft, so
+    confirmation only has to fill and submit.
+    A prewarm that failed, outlived max_age_seconds or whose session is no longer
+    ready is replaced by a fresh preparation at finish(); discard() tears it down.
+    Call start()/finish()/discard() from the event loop.
+    """
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], IAutomationDriver],
+        email: str,
+        password: str,
+        max_age_seconds: float = 600,
+    ):
+        self.driver_factory = driver_factory
+        self.email = email
+        self.password = password
+        self.max_age_seconds = max_age_seconds
+        self._prep: Optional[_Preparation] = None
+        self._task: Optional[asyncio.Future] = None
+        self._started_at = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._task is not None
+
+    def start(self):
+        if self._task is not None:
+            return
+        self._prep = _Preparation(self.driver_factory())
+        self._started_at = time.monotonic()
+        self._task = asyncio.ensure_future(run_in_daemon_thread(self._prep.run, self.email, self.password))
+        log_event("WF-PREWARM-START", "Preparing browser session, login and today's report in the background")
+
+    async def _prepared(self) -> bool:
+        try:
+            return bool(await self._task)
+        except Exception as e:
+            log_event("WF-PREWARM-ERR", f"Prewarm failed: {e}")
+            return False
+
+    async def _usable(self) -> bool:
+        if not await self._prepared():
+            return False
+        age = time.monotonic() - self._started_at
+        if age > self.max_age_seconds:
+            log_event("WF-PREWARM-STALE", f"Prewarmed session is {age:.0f}s old, refreshing")
+            return False
+        if not await run_in_daemon_thread(self._prep.driver.submission_ready):
+            log_event("WF-PREWARM-STALE", "Prewarmed session is no longer on today's report, refreshing")
+            return False
+        return True
+
+    async def finish(self, report: Report) -> bool:
+        """Fill and submit on the prewarmed session (refreshing it once if needed), then tear down."""
+        try:
+            if self._task is None:
+                self.start()
+            if await self._usable():
+                log_event("WF-PREWARM-HIT", f"Prewarmed session ready after {time.monotonic() - self._started_at:.1f}s")
+            else:
+                await self.discard()
+                self.start()
+                if not await self._prepared():
+                    return False
+            return bool(await run_in_daemon_thread(self._prep.driver.finish_submission, report))
+        finally:
+            await self.discard()
+
+    async def discard(self):
+        task, prep = self._task, self._prep
+        self._task = self._prep = None
+        if task is None or prep is None:
+            return
+        if not prep.discard():
+            try:
+                await run_in_daemon_thread(prep.close)
+            except Exception as e:
+                log_event("WF-PREWARM-ERR", f"Closing prewarmed session failed: {e}")
+            return
+        task.cancel()
+        # Closing from another thread makes a preparation past session start fail fast;
+        # a browser still launching is closed by _Preparation.run when it returns.
+        threading.Thread(target=prep.close, name="prewarm-close", daemon=True).start()
@@ -0,0 +1,177 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Deque, List, Optional, Set
+
+from src.core.exceptions import QueueFullError
+from src.core.interfaces import IAutomationDriver, IContentGenerator
+from src.infrastructure.monitoring.metrics import metrics
+from .report_service import ReportService
+
+# Blocking unit of work; receives a ReportService bound to a fresh, job-scoped driver.
+SubmissionWork = Callable[[ReportService], bool]
+
+
+@dataclass
+class SubmissionJob:
+    user_id: int
+    work: SubmissionWork
+    future: asyncio.Future
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class JobTicket:
+    """Handed back on submit: where the job landed and when it should be done."""
+    position: int  # 1-based place in the waiting line
+    wait_seconds: float  # estimated wait before a worker picks it up (0 = starts now)
+    eta_seconds: float  # estimated time until this job finishes
+    future: asyncio.Future  # resolves to the job's result
+
+    async def result(self) -> bool:
+        return await self.future
+
+
+class SubmissionScheduler:
+    """
+    Service Layer: bounded job queue in front of the blocking submission drivers.
+    - at most `workers` jobs run at once, each in its own executor thread with a
+      driver from driver_factory (drivers are not thread-safe);
+    - jobs of one user run in arrival order and never concurrently;
+    - submit() fails fast with QueueFullError once max_queue jobs are waiting;
+    - with pipelined=True, each job's ReportService overlaps generation with login.
+    start()/stop()/submit() must be called from the event loop that owns it.
+    """
+
+    def __init__(
+        self,
+        ai_generator: IContentGenerator,
+        driver_factory: Callable[[], IAutomationDriver],
+        workers: int = 1,
+        max_queue: int = 20,
+        job_seconds_estimate: float = 90.0,
+        smoothing: float = 0.3,
+        pipelined: bool = False,
+    ):
+        self.ai = ai_generator
+        self.driver_factory = driver_factory
+        self.workers = max(1, workers)
+        self.max_queue = max(1, max_queue)
+        # Moving average of finished job durations, seeded with the estimate.
+        self.avg_job_seconds = job_seconds_estimate
+        self.smoothing = smoothing
+        self.pipelined = pipelined
+        self._pending: Deque[SubmissionJob] = deque()
+        self._active_users: Set[int] = set()
+        self._changed: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    @property
+    def running(self) -> int:
+        return len(self._active_users)
+
+    async def start(self):
+        if self._tasks:
+            return
+        self._changed = asyncio.Event()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="submit")
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        metrics.set_queue_depth(0)
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        while self._pending:
+            self._pending.popleft().future.cancel()
+        metrics.set_queue_depth(0)
+        if self._executor is not None:
+            # Submissions already inside a driver finish in their threads.
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def submit(self, user_id: int, work: SubmissionWork) -> JobTicket:
+        if not self._tasks:
+            raise RuntimeError("SubmissionScheduler.start() has not been awaited")
+        if len(self._pending) >= self.max_queue:
+            raise QueueFullError(f"Submission queue is full ({self.max_queue} waiting)")
+
+        job = SubmissionJob(user_id=user_id, work=work, future=asyncio.get_running_loop().create_future())
+        ahead = len(self._pending)
+        wait = self._estimate_wait(ahead, user_id)
+        self._pending.append(job)
+        metrics.set_queue_depth(len(self._pending))
+        self._changed.set()
+        return JobTicket(
+            position=ahead + 1,
+            wait_seconds=wait,
+            eta_seconds=wait + self.avg_job_seconds,
+            future=job.future,
+        )
+
+    def _estimate_wait(self, ahead: int, user_id: int) -> float:
+        # The user's own earlier jobs run one after another (a running one is assumed half done).
+        own_ahead = sum(1 for job in self._pending if job.user_id == user_id)
+        own_wait = own_ahead + (0.5 if user_id in self._active_users else 0.0)
+
+        free = self.workers - self.running
+        if ahead < free:
+            return own_wait * self.avg_job_seconds
+        # Completions needed before this job starts; they arrive in waves of `workers`.
+        needed = ahead - free + 1
+        return max((needed - 1) // self.workers + 0.5, own_wait) * self.avg_job_seconds
+
+    def _take_ready(self) -> Optional[SubmissionJob]:
+        """Oldest waiting job whose user has nothing running (keeps per-user FIFO)."""
+        blocked = set(self._active_users)
+        for job in self._pending:
+            if job.user_id in blocked:
+                continue
+            if job.future.done():  # caller gave up while waiting
+                self._pending.remove(job)
+                return self._take_ready()
+            self._pending.remove(job)
+            return job
+        return None
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job = self._take_ready()
+            if job is None:
+                self._changed.clear()
+                await self._changed.wait()
+                continue
+
+            self._active_users.add(job.user_id)
+            metrics.set_queue_depth(len(self._pending))
+            started = time.monotonic()
+            try:
+                with metrics.job():
+                    result = await loop.run_in_executor(self._executor, self._run_job, job.work)
+                if not job.future.done():
+                    job.future.set_result(result)
+            except asyncio.CancelledError:
+                job.future.cancel()
+                raise
+            except Exception as e:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            finally:
+                self._record_duration(time.monotonic() - started)
+                self._active_users.discard(job.user_id)
+                self._changed.set()
+
+    def _run_job(self, work: SubmissionWork) -> bool:
+        return work(ReportService(self.ai, self.driver_factory(), pipelined=self.pipelined))
+
+    def _record_duration(self, seconds: float):
+        self.avg_job_seconds = (1 - self.smoothing) * self.avg_job_seconds + self.smoothing * seconds
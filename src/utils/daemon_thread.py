@@ -0,0 +1,32 @@
+import asyncio
+import threading
+from typing import Any, Callable
+
+
+async def run_in_daemon_thread(func: Callable[..., Any], *args) -> Any:
+    """
+    Like loop.run_in_executor, but on a fresh daemon thread. asyncio.run() joins
+    executor threads on exit, so a cancelled caller would otherwise still wait
+    for a blocking browser flow to finish. Cancelling the await abandons the result.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def deliver(setter, value):
+        if not future.done():
+            setter(value)
+
+    def target():
+        try:
+            result = func(*args)
+        except BaseException as e:
+            outcome = (future.set_exception, e)
+        else:
+            outcome = (future.set_result, result)
+        try:
+            loop.call_soon_threadsafe(deliver, *outcome)
+        except RuntimeError:
+            pass  # loop already closed: the caller has exited
+
+    threading.Thread(target=target, name=getattr(func, "__name__", "blocking"), daemon=True).start()
+    return await future
@@ -0,0 +1,14 @@
+import requests
+from urllib3.exceptions import NewConnectionError
+
+
+def never_sent(error: requests.RequestException) -> bool:
+    """
+    Connect-phase failures: the request provably never reached the server, so it
+    is safe to repeat by other means. Read timeouts and connections dropped after
+    sending are not: the server may already have acted on the request.
+    """
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
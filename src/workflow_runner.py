@@ -3,39 +3,69 @@ import sys
 import logging
 import asyncio
 import time
+from typing import Awaitable, Optional, Set
 from telegram import Update
-from telegram.ext import ApplicationBuilder, ContextTypes, MessageHandler, filters
+from telegram.ext import ContextTypes, MessageHandler, filters
 
 # Ensure project root is in python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.infrastructure.ai.openrouter_ai import OpenRouterAI
-from src.infrastructure.automation.seleniumbase_driver import SeleniumBaseDriver
-from src.services.report_service import ReportService
+from src.infrastructure.ai.generator_factory import (
+    build_async_content_generator,
+    build_draft_variants,
+    build_generation_cache_store,
+)
+from src.infrastructure.ai.generation_cache import uncached
+from src.infrastructure.automation.driver_factory import build_automation_driver, build_session_cache
+from src.infrastructure.telegram.draft_streamer import ThrottledMessageEditor, render_partial_draft
+from src.infrastructure.telegram.update_source import UpdateSource
 from src.config import config
+from src.core.exceptions import ConfigurationError
+from src.core.entities import Report
+from src.services.draft_pool import DraftCandidatePool
+from src.services.submission_prewarm import SubmissionPrewarm
 from src.utils.logger import setup_logger
 
 logger = logging.getLogger(__name__)
 
+# Replies that ask for another version of the same draft.
+ALTERNATE_COMMANDS = ("NEXT", "REGENERATE")
+# How long NEXT waits for an alternate that is still generating.
+ALTERNATE_WAIT_SECONDS = 20
+
 class WorkflowBot:
     """
     Short-lived bot for workflow interactions.
     It will run for a max duration (e.g. 15 mins) and exit.
     """
-    def __init__(self):
-        self.app = ApplicationBuilder().token(config.telegram_bot_token).build()
+    def __init__(self, update_source: Optional[UpdateSource] = None):
+        # Polling or webhook (embedded server), see TELEGRAM_UPDATE_MODE.
+        self.update_source = update_source or UpdateSource.from_config(config)
+        self.app = self.update_source.application_builder(config.telegram_bot_token).build()
         self.app.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), self.handle_message))
         self.interaction_complete = False
-        self.start_time = time.time()
+        # Set exactly when the workflow is decided; run() waits on it with a deadline.
+        self.completed = asyncio.Event()
+        self.start_time = time.monotonic()
         self.MAX_DURATION = 900  # 15 minutes timeout
+        # Generation/submission tasks that must be cancelled on timeout.
+        self._inflight: Set[asyncio.Task] = set()
         
         # Dependency Injection
-        self.ai = OpenRouterAI(
-            api_key=config.openrouter_api_key,
-            model=config.ai_model,
+        # Async client: generation is awaited on the bot loop, no executor hop.
+        self.ai = build_async_content_generator(config, build_generation_cache_store(config))
+        # Same client without the cache: a regenerated draft must not be the cached one the user rejected.
+        self.fresh_ai = uncached(self.ai)
+        # Alternate drafts (DRAFT_CANDIDATES > 1) for instant NEXT; disabled with no variants.
+        self.draft_pool = DraftCandidatePool(self.ai, build_draft_variants(config, self.ai))
+        # Driver is created lazily: speculatively once a draft is shown, or at YES.
+        session_cache = build_session_cache(config)
+        self.prewarm = SubmissionPrewarm(
+            lambda: build_automation_driver(config, headless=True, session_cache=session_cache),  # Always headless in CI
+            config.maganghub_email,
+            config.maganghub_password,
+            max_age_seconds=config.workflow_prewarm_max_age_seconds,
         )
-        self.service = None 
-        # Delayed init for driver to save resources if no input
         
         # State
         self.state = "WAITING_FOR_INPUT" # -> WAITING_CONFIRM -> DONE
@@ -55,8 +85,7 @@ class WorkflowBot:
             logger.info(f"[WF-NOTIFY-OK] Notification sent to {config.allowed_telegram_id}")
         except Exception as e:
             logger.error(f"[WF-NOTIFY-ERR] Failed to send notification: {e}")
-            self.submission_success = False
-            self.interaction_complete = True # Exit if we can't notify
+            self._finish(False)  # Exit if we can't notify
 
     async def handle_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         user_id = str(update.effective_user.id)
@@ -67,117 +96,187 @@ class WorkflowBot:
         text = update.message.text
         
         if self.state == "WAITING_FOR_INPUT":
-            await update.message.reply_text("⏳ Generating draft report... please wait.")
-            
-            # Generate Report
-            try:
-                # We reuse the AI logic directly here to just get the object first
-                # Or use service but we need to split generation and submission.
-                # Let's use AI directly for "Draft" step.
-                report = self.ai.generate_content(config.aktivitas_konteks, text)
-                
-                if not report.validate():
-                    await update.message.reply_text("❌ Generated report was too short. Please try again with more details.")
-                    return
-
-                self.draft_report = report
-                self.draft_context = text
-                self.state = "WAITING_CONFIRM"
-                
-                # Send back for double check
-                response_text = (
-                    "**✅ Draft Report Generated**\n\n"
-                    f"**Activity:**\n{report.activity}\n\n"
-                    f"**Learning:**\n{report.learning}\n\n"
-                    f"**Obstacles:**\n{report.obstacles}\n\n"
-                    "-----------------------------\n"
-                    "Reply **'YES'** to submit this report.\n"
-                    "Reply **'CANCEL'** to stop.\n"
-                    "Reply anything else to regenerate."
-                )
-                await update.message.reply_text(response_text, parse_mode="Markdown")
-                
-            except Exception as e:
-                logger.error(f"[WF-GEN-ERR] Generation error: {e}")
-                await update.message.reply_text("❌ Error generating report. Try again.")
+            await self._generate_draft(update, text)
 
         elif self.state == "WAITING_CONFIRM":
             if text.upper().strip() == "YES":
-                await update.message.reply_text("🚀 Submitting report... (Selenium launching)")
-                
-                # Launch Selenium (Only now to save memory/time)
+                await update.message.reply_text("🚀 Submitting report...")
+
                 try:
-                    is_headless = True # Always headless in CI
-                    driver = SeleniumBaseDriver(headless=is_headless)
-                    service = ReportService(self.ai, driver)
-                    
-                    # Run logic (blocking call needs executor)
-                    loop = asyncio.get_running_loop()
-                    success = await loop.run_in_executor(
-                        None,
-                        self.service_submit_wrapper,
-                        service,
-                        self.draft_report
-                    )
+                    # Only fill + submit remain when the prewarm is ready; otherwise it prepares now.
+                    success = await self._track(self.prewarm.finish(self.draft_report))
                     
                     if success:
                         logger.info("[WF-SUBMIT-OK] Report submitted successfully.")
                         await update.message.reply_text("🎉 Report Submitted Successfully!")
-                        self.submission_success = True
                     else:
                         logger.warning("[WF-SUBMIT-ERR] Report submission returned unsuccessful result.")
                         await update.message.reply_text("❌ Submission Failed. Check GitHub Actions logs.")
-                        self.submission_success = False
+                    self._finish(success)
 
+                except asyncio.CancelledError:
+                    logger.warning("[WF-SUBMIT-CANCELLED] Submission cancelled at workflow deadline.")
+                    # Quit the browser so the worker thread fails fast instead of finishing the flow.
+                    await self.prewarm.discard()
                 except Exception as e:
                     logger.error(f"[WF-SUBMIT-EXCEPTION] Automation exception: {e}")
                     await update.message.reply_text(f"❌ Automation Error: {e}")
-                    self.submission_success = False
-
-                self.interaction_complete = True
+                    self._finish(False)
                 
+            elif text.upper().strip() in ALTERNATE_COMMANDS and self.draft_pool.enabled:
+                try:
+                    report = await self._track(self.draft_pool.next_alternate(timeout=ALTERNATE_WAIT_SECONDS))
+                except asyncio.CancelledError:
+                    logger.warning("[WF-GEN-CANCELLED] Generation cancelled at workflow deadline.")
+                    return
+                if report is None:
+                    # Every alternate failed or is still too slow: generate afresh from the same activity.
+                    self.state = "WAITING_FOR_INPUT"
+                    await self._generate_draft(update, self.draft_context, rejected=self.draft_report)
+                    return
+                self.draft_report = report
+                await update.message.reply_text(self._draft_text(report), parse_mode="Markdown")
+
             elif text.upper().strip() == "CANCEL":
                 await update.message.reply_text("🚫 Operation cancelled.")
-                self.submission_success = False
-                self.interaction_complete = True
+                await self.prewarm.discard()
+                self._finish(False)
             else:
                 # Treat as new input -> Regenerate
                 self.state = "WAITING_FOR_INPUT"
                 await self.handle_message(update, context)
 
-    def service_submit_wrapper(self, service, report):
-        """Helper to call service submit directly since we already have the report object"""
-        # We only need submit here because draft is already generated.
-        return service.driver.execute_full_flow(
-            config.maganghub_email,
-            config.maganghub_password,
-            report
+    async def _generate_draft(self, update: Update, text: str, rejected: Optional[Report] = None):
+        """Stream a draft for `text`; with `rejected`, bypass the cache and never re-offer that draft."""
+        generator = self.fresh_ai if rejected is not None else self.ai
+        status_message = await update.message.reply_text("⏳ Generating draft report... please wait.")
+        # The status message is edited in place as activity/learning/obstacles stream in.
+        editor = ThrottledMessageEditor(status_message)
+        if config.report_pipeline:
+            # Browser start and login overlap the generation (and later the review).
+            self.prewarm.start()
+
+        async def on_progress(fields):
+            await editor.update(render_partial_draft(fields))
+        
+        # Generate Report
+        try:
+            # We reuse the AI logic directly here to just get the object first
+            # Or use service but we need to split generation and submission.
+            # Let's use AI directly for "Draft" step.
+            if self.draft_pool.enabled:
+                # Alternates generate alongside; NEXT serves them without another round trip.
+                report = await self._track(
+                    self.draft_pool.generate(config.aktivitas_konteks, text, on_progress, primary=generator)
+                )
+            else:
+                report = await self._track(
+                    generator.generate_content_streaming(config.aktivitas_konteks, text, on_progress)
+                )
+
+            if rejected is not None and self._same_draft(report, rejected):
+                # Keep the rejected draft reviewable rather than presenting it as new.
+                self.draft_report = rejected
+                self.state = "WAITING_CONFIRM"
+                await update.message.reply_text(
+                    "⚠️ Could not produce a different draft right now. Reply YES to submit the previous one, "
+                    "send new activity text, or CANCEL."
+                )
+                return
+
+            if not report.validate():
+                await update.message.reply_text("❌ Generated report was too short. Please try again with more details.")
+                return
+
+            self.draft_report = report
+            self.draft_context = text
+            self.state = "WAITING_CONFIRM"
+            
+            # Send back for double check
+            response_text = self._draft_text(report)
+            if not await editor.flush(response_text, parse_mode="Markdown"):
+                await update.message.reply_text(response_text, parse_mode="Markdown")
+
+            # The user needs a while to review: get the browser logged in and on today's report meanwhile.
+            if config.workflow_prewarm:
+                self.prewarm.start()
+
+        except asyncio.CancelledError:
+            logger.warning("[WF-GEN-CANCELLED] Generation cancelled at workflow deadline.")
+        except Exception as e:
+            logger.error(f"[WF-GEN-ERR] Generation error: {e}")
+            await update.message.reply_text("❌ Error generating report. Try again.")
+
+    @staticmethod
+    def _same_draft(first: Report, second: Report) -> bool:
+        return (first.activity, first.learning, first.obstacles) == (second.activity, second.learning, second.obstacles)
+
+    def _draft_text(self, report: Report) -> str:
+        return (
+            "**✅ Draft Report Generated**\n\n"
+            f"**Activity:**\n{report.activity}\n\n"
+            f"**Learning:**\n{report.learning}\n\n"
+            f"**Obstacles:**\n{report.obstacles}\n\n"
+            "-----------------------------\n"
+            "Reply **'YES'** to submit this report.\n"
+            "Reply **'CANCEL'** to stop.\n"
+            + ("Reply **'NEXT'** for another version.\n" if self.draft_pool.enabled else "")
+            + "Reply anything else to regenerate."
         )
 
+    def _finish(self, success: bool):
+        if self.interaction_complete:
+            return
+        self.submission_success = success
+        self.interaction_complete = True
+        self.completed.set()
+
+    async def _track(self, awaitable: Awaitable):
+        """Run as a task that a timeout can cancel; awaiting it re-raises CancelledError."""
+        task = asyncio.ensure_future(awaitable)
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+        return await task
+
+    async def _cancel_inflight(self):
+        tasks = list(self._inflight)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
     async def run(self):
-        """Main loop with timeout"""
+        """Wait for completion or the deadline, whichever comes first."""
         await self.app.initialize()
         await self.app.start()
         await self.notify_user()
-        await self.app.updater.start_polling()
-        
-        while not self.interaction_complete:
-            if time.time() - self.start_time > self.MAX_DURATION:
-                logger.warning("[WF-TIMEOUT] Timeout reached. Exiting.")
-                self.submission_success = False
-                try:
-                    await self.app.bot.send_message(
+        if not self.interaction_complete:
+            await self.update_source.start(self.app)
+
+        remaining = self.MAX_DURATION - (time.monotonic() - self.start_time)
+        try:
+            await asyncio.wait_for(self.completed.wait(), timeout=max(0.0, remaining))
+        except asyncio.TimeoutError:
+            logger.warning("[WF-TIMEOUT] Timeout reached. Exiting.")
+            self._finish(False)
+            await self._cancel_inflight()
+            await self.prewarm.discard()
+            try:
+                await asyncio.wait_for(
+                    self.app.bot.send_message(
                         chat_id=config.allowed_telegram_id,
                         text="⏳ **Timeout**: You didn't reply in time. Workflow exiting."
-                    )
-                except:
-                    pass
-                break
-            await asyncio.sleep(1)
-            
-        await self.app.updater.stop()
+                    ),
+                    timeout=10,
+                )
+            except Exception:
+                pass
+
+        if self.app.updater.running:
+            await self.app.updater.stop()
         await self.app.stop()
         await self.app.shutdown()
+        await self.draft_pool.close()
+        await self.ai.aclose()
 
         return self.submission_success is True
 
@@ -186,8 +285,15 @@ async def main_async() -> bool:
     if not config.telegram_bot_token or not config.allowed_telegram_id:
         logger.error("[WF-CONFIG-ERR] Missing Telegram config")
         return False
+    if not config.has_single_account():
+        logger.error("[WF-CONFIG-ERR] Missing MagangHub credentials")
+        return False
 
-    bot = WorkflowBot()
+    try:
+        bot = WorkflowBot()
+    except ConfigurationError as e:
+        logger.error(f"[WF-CONFIG-ERR] {e}")
+        return False
     return await bot.run()
 
 def main():